@@ -0,0 +1,90 @@
+"""Compares compiled protobuf decoders with the reflection based conversion.
+
+Lazy message views are measured by reading a single field of the response,
+columnar candles by decoding the whole response into numpy arrays.
+
+Run with ``python -m benchmarks.bench_decoding``.
+"""
+from typing import Any, Callable, Tuple
+
+from benchmarks.harness import measure
+from benchmarks.payloads import make_candles_response, make_order_book_response
+from tinkoff.invest import _grpc_helpers
+from tinkoff.invest.schemas import GetCandlesResponse, MarketDataResponse
+
+
+def compare(
+    name: str, pb_obj: Any, dataclass_type: type, number: int
+) -> Tuple[float, float]:
+    generic = measure(
+        lambda: _grpc_helpers.protobuf_to_dataclass_generic(pb_obj, dataclass_type),
+        number,
+    )
+    compiled = measure(
+        lambda: _grpc_helpers.protobuf_to_dataclass(pb_obj, dataclass_type), number
+    )
+    print(  # noqa:T201
+        f"{name:<32} generic {generic * 1e6:>10.1f} us"
+        f"  compiled {compiled * 1e6:>10.1f} us  x{generic / compiled:.1f}"
+    )
+    return generic, compiled
+
+
+def compare_view(
+    name: str,
+    pb_obj: Any,
+    dataclass_type: type,
+    read: Callable[[Any], Any],
+    number: int,
+) -> Tuple[float, float]:
+    compiled = measure(
+        lambda: read(_grpc_helpers.protobuf_to_dataclass(pb_obj, dataclass_type)),
+        number,
+    )
+    view = measure(
+        lambda: read(_grpc_helpers.protobuf_to_view(pb_obj, dataclass_type)), number
+    )
+    print(  # noqa:T201
+        f"{name:<32} compiled {compiled * 1e6:>9.1f} us"
+        f"  view {view * 1e6:>14.1f} us  x{compiled / view:.1f}"
+    )
+    return compiled, view
+
+
+def compare_columns(name: str, pb_obj: Any, number: int) -> Tuple[float, float]:
+    from tinkoff.invest.columnar import (  # pylint:disable=import-outside-toplevel
+        candles_to_columns,
+    )
+
+    compiled = measure(
+        lambda: _grpc_helpers.protobuf_to_dataclass(pb_obj, GetCandlesResponse),
+        number,
+    )
+    columns = measure(lambda: candles_to_columns(pb_obj.candles), number)
+    print(  # noqa:T201
+        f"{name:<32} compiled {compiled * 1e6:>9.1f} us"
+        f"  columns {columns * 1e6:>11.1f} us  x{compiled / columns:.1f}"
+    )
+    return compiled, columns
+
+
+def main() -> None:
+    compare("GetCandlesResponse[1000]", make_candles_response(), GetCandlesResponse, 5)
+    compare(
+        "MarketDataResponse.orderbook[50]",
+        make_order_book_response(),
+        MarketDataResponse,
+        200,
+    )
+    compare_view(
+        "GetCandlesResponse[1000][-1]",
+        make_candles_response(),
+        GetCandlesResponse,
+        lambda response: response.candles[-1].close,
+        5,
+    )
+    compare_columns("GetCandlesResponse[1000] columns", make_candles_response(), 5)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,42 @@
+"""Compares compiled protobuf encoders with the reflection based conversion.
+
+Run with ``python -m benchmarks.bench_encoding``.
+"""
+import uuid
+
+from benchmarks.harness import measure
+from benchmarks.payloads import make_post_order_request
+from tinkoff.invest import _grpc_helpers
+from tinkoff.invest.grpc import orders_pb2
+
+
+def main() -> None:
+    request = make_post_order_request()
+    template = _grpc_helpers.RequestTemplate(request)
+    order_id = str(uuid.uuid4())
+    results = {
+        "generic": measure(
+            lambda: _grpc_helpers.dataclass_to_protobuff_generic(
+                request, orders_pb2.PostOrderRequest()
+            ),
+            10_000,
+        ),
+        "compiled": measure(
+            lambda: _grpc_helpers.dataclass_to_protobuff(
+                request, orders_pb2.PostOrderRequest()
+            ),
+            10_000,
+        ),
+        "template": measure(
+            lambda: template.encode(
+                orders_pb2.PostOrderRequest, quantity=2, order_id=order_id
+            ),
+            10_000,
+        ),
+    }
+    for name, seconds in results.items():
+        print(f"PostOrderRequest {name:<10} {seconds * 1e6:>8.2f} us")  # noqa:T201
+
+
+if __name__ == "__main__":
+    main()
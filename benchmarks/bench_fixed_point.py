@@ -0,0 +1,50 @@
+"""Compares price math on candles done with Decimal and with FixedPoint.
+
+Run with ``python -m benchmarks.bench_fixed_point``.
+"""
+from decimal import Decimal
+from typing import List
+
+from benchmarks.harness import measure
+from benchmarks.payloads import make_candles_response
+from tinkoff.invest import FixedPoint, HistoricCandle, _grpc_helpers
+from tinkoff.invest.schemas import GetCandlesResponse
+from tinkoff.invest.utils import quotation_to_decimal
+
+LOT = 10
+
+
+def total_with_decimal(candles: List[HistoricCandle]) -> Decimal:
+    total = Decimal(0)
+    for candle in candles:
+        total += (
+            quotation_to_decimal(candle.close) - quotation_to_decimal(candle.open)
+        ) * LOT
+    return total
+
+
+def total_with_fixed_point(candles: List[HistoricCandle]) -> FixedPoint:
+    total = FixedPoint()
+    for candle in candles:
+        total += (
+            FixedPoint.from_quotation(candle.close)
+            - FixedPoint.from_quotation(candle.open)
+        ) * LOT
+    return total
+
+
+def main() -> None:
+    candles = _grpc_helpers.protobuf_to_dataclass(
+        make_candles_response(), GetCandlesResponse
+    ).candles
+    assert total_with_decimal(candles) == total_with_fixed_point(candles).to_decimal()
+    decimal = measure(lambda: total_with_decimal(candles), 20)
+    fixed_point = measure(lambda: total_with_fixed_point(candles), 20)
+    print(  # noqa:T201
+        f"{'candles[1000] price math':<32} decimal {decimal * 1e6:>10.1f} us"
+        f"  fixed point {fixed_point * 1e6:>10.1f} us  x{decimal / fixed_point:.1f}"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""Measures memory taken by slotted schema dataclasses.
+
+Every object is compared with a copy made of regular dataclasses with the
+same fields, which is how schemas were declared before they got `__slots__`.
+The gap is smaller on python 3.11+, where regular instances got more compact.
+
+Run with ``python -m benchmarks.bench_memory``.
+"""
+import dataclasses
+import tracemalloc
+from typing import Any, Callable, Dict, List
+
+from benchmarks.payloads import make_candles_response, make_shares_response
+from tinkoff.invest import _grpc_helpers
+from tinkoff.invest.schemas import GetCandlesResponse, SharesResponse
+
+_UNSLOTTED_TYPES: Dict[type, type] = {}
+
+
+def get_unslotted_type(dataclass_type: type) -> type:
+    if dataclass_type not in _UNSLOTTED_TYPES:
+        _UNSLOTTED_TYPES[dataclass_type] = dataclasses.make_dataclass(
+            dataclass_type.__name__,
+            [field.name for field in dataclasses.fields(dataclass_type)],
+            eq=False,
+        )
+    return _UNSLOTTED_TYPES[dataclass_type]
+
+
+def rebuild(value: Any, get_type: Callable[[type], type]) -> Any:
+    """Copy nested dataclasses, other values are shared."""
+    if isinstance(value, list):
+        return [rebuild(item, get_type) for item in value]
+    if not dataclasses.is_dataclass(value):
+        return value
+    # bypasses __init__, so both variants hold the very same field values
+    copy = object.__new__(get_type(type(value)))
+    for field in dataclasses.fields(value):
+        object.__setattr__(
+            copy, field.name, rebuild(getattr(value, field.name), get_type)
+        )
+    return copy
+
+
+def measure(build: Callable[[], List[Any]]) -> float:
+    tracemalloc.start()
+    try:
+        before, _ = tracemalloc.get_traced_memory()
+        objects = build()
+        after, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return (after - before) / len(objects)
+
+
+def compare(name: str, objects: List[Any]) -> None:
+    rebuild(objects[:1], get_unslotted_type)  # creates the unslotted types
+    slotted = measure(lambda: rebuild(objects, lambda type_: type_))
+    unslotted = measure(lambda: rebuild(objects, get_unslotted_type))
+    print(  # noqa:T201
+        f"{name:<16} dict {unslotted:>8.0f} B  slots {slotted:>8.0f} B"
+        f"  x{unslotted / slotted:.1f}"
+    )
+
+
+def main() -> None:
+    candles = _grpc_helpers.protobuf_to_dataclass(
+        make_candles_response(), GetCandlesResponse
+    ).candles
+    shares = _grpc_helpers.protobuf_to_dataclass(
+        make_shares_response(), SharesResponse
+    ).instruments
+    compare("HistoricCandle", candles)
+    compare("Share", shares)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+import json
+import platform
+import timeit
+import tracemalloc
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+import google.protobuf
+
+REPEAT = 5
+
+
+@dataclass
+class Result:
+    name: str
+    # Items processed by a single call, e.g. candles in a response
+    items: int
+    seconds_per_call: float
+    # Memory kept alive by the value returned from a call
+    retained_bytes: int
+    # Highest memory usage during a call
+    peak_bytes: int
+
+    @property
+    def items_per_second(self) -> float:
+        return self.items / self.seconds_per_call
+
+
+def measure(func: Callable[[], Any], number: int) -> float:
+    return min(timeit.repeat(func, number=number, repeat=REPEAT)) / number
+
+
+def measure_allocations(func: Callable[[], Any]) -> Dict[str, int]:
+    func()  # warms up caches, e.g. compiled decoders
+    tracemalloc.start()
+    try:
+        before, _ = tracemalloc.get_traced_memory()
+        result = func()
+        after, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del result
+    return {"retained_bytes": after - before, "peak_bytes": peak - before}
+
+
+def run(
+    name: str, func: Callable[[], Any], items: int, number: Optional[int] = None
+) -> Result:
+    if number is None:
+        # enough calls to take at least 0.2 seconds
+        number, _ = timeit.Timer(func).autorange()
+    return Result(
+        name=name,
+        items=items,
+        seconds_per_call=measure(func, number),
+        **measure_allocations(func),
+    )
+
+
+def print_results(
+    results: List[Result], baseline: Optional[Dict[str, Dict[str, Any]]] = None
+) -> None:
+    print(  # noqa:T201
+        f"{'case':<44}{'per call':>12}{'items/s':>14}{'retained':>12}{'peak':>12}"
+    )
+    for result in results:
+        line = (
+            f"{result.name:<44}"
+            f"{result.seconds_per_call * 1e6:>10.1f}us"
+            f"{result.items_per_second:>14,.0f}"
+            f"{result.retained_bytes / 1024:>10.1f}KB"
+            f"{result.peak_bytes / 1024:>10.1f}KB"
+        )
+        if baseline and result.name in baseline:
+            before = baseline[result.name]["seconds_per_call"]
+            line += f"  x{before / result.seconds_per_call:.2f} vs baseline"
+        print(line)  # noqa:T201
+
+
+def environment() -> Dict[str, str]:
+    return {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "protobuf": google.protobuf.__version__,
+        "machine": platform.machine(),
+    }
+
+
+def save_results(path: Path, results: List[Result]) -> None:
+    data = {
+        "environment": environment(),
+        "results": {result.name: asdict(result) for result in results},
+    }
+    path.write_text(json.dumps(data, indent=2))
+
+
+def load_results(path: Path) -> Dict[str, Dict[str, Any]]:
+    return json.loads(path.read_text())["results"]
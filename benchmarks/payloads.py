@@ -0,0 +1,133 @@
+"""Synthetic protobuf payloads of realistic sizes.
+
+Payloads are deterministic, so numbers of different runs are comparable.
+"""
+import uuid
+from typing import Any, Iterable, List
+
+from tinkoff.invest.grpc import instruments_pb2, marketdata_pb2
+from tinkoff.invest.schemas import (
+    OrderDirection,
+    OrderType,
+    PostOrderRequest,
+    Quotation,
+)
+
+# Number of shares listed by the exchange, the size of `shares()` response
+SHARES_COUNT = 2000
+
+
+def _set_prices(prices: Iterable[Any], units: int, nano: int) -> None:
+    for price in prices:
+        price.units = units
+        price.nano = nano
+
+
+def make_candles_response(size: int = 1000) -> Any:
+    response = marketdata_pb2.GetCandlesResponse()
+    for i in range(size):
+        candle = response.candles.add()
+        _set_prices(
+            (candle.open, candle.high, candle.low, candle.close),
+            100 + i % 7,
+            250_000_000,
+        )
+        candle.volume = 1000 + i
+        candle.time.seconds = 1_600_000_000 + i * 60
+        candle.is_complete = True
+    return response
+
+
+def make_order_book_response(depth: int = 50) -> Any:
+    response = marketdata_pb2.MarketDataResponse()
+    orderbook = response.orderbook
+    orderbook.figi = "BBG004730N88"
+    orderbook.depth = depth
+    orderbook.instrument_uid = "e6123145-9665-43e0-8413-cd61b8aa9b13"
+    orderbook.time.seconds = 1_600_000_000
+    for i in range(depth):
+        for orders in (orderbook.bids, orderbook.asks):
+            order = orders.add()
+            order.price.units = 250 + i
+            order.price.nano = 500_000_000
+            order.quantity = 10 + i
+    return response
+
+
+def make_shares_response(size: int = SHARES_COUNT) -> Any:
+    response = instruments_pb2.SharesResponse()
+    for i in range(size):
+        share = response.instruments.add()
+        share.figi = f"BBG{i:09}"
+        share.ticker = f"T{i}"
+        share.class_code = "TQBR"
+        share.isin = f"RU{i:010}"
+        share.uid = f"{i:032x}"
+        share.position_uid = f"{i + size:032x}"
+        share.name = f"Share {i}"
+        share.exchange = "MOEX"
+        share.currency = "rub"
+        share.sector = "it"
+        share.country_of_risk = "RU"
+        share.lot = 10
+        share.min_price_increment.nano = 10_000_000
+        share.nominal.currency = "rub"
+        share.nominal.units = 1
+        share.klong.units = 2
+        share.kshort.units = 2
+        share.dlong.nano = 300_000_000
+        share.dshort.nano = 300_000_000
+        share.ipo_date.seconds = 1_000_000_000
+        share.issue_size = 1_000_000
+        share.buy_available_flag = True
+        share.sell_available_flag = True
+        share.api_trade_available_flag = True
+        share.trading_status = 5
+    return response
+
+
+def make_market_data_burst(size: int = 1000) -> List[Any]:
+    """Mix of stream messages as they arrive for a few subscriptions."""
+    burst = []
+    for i in range(size):
+        response = marketdata_pb2.MarketDataResponse()
+        kind = i % 4
+        if kind == 0:
+            candle = response.candle
+            candle.figi = "BBG004730N88"
+            candle.interval = 1
+            _set_prices(
+                (candle.open, candle.high, candle.low, candle.close), 250, i * 1000
+            )
+            candle.volume = i
+            candle.time.seconds = 1_600_000_000 + i
+            candle.last_trade_ts.seconds = 1_600_000_000 + i
+        elif kind == 1:
+            trade = response.trade
+            trade.figi = "BBG004730N88"
+            trade.direction = 1
+            trade.price.units = 250
+            trade.quantity = i
+            trade.time.seconds = 1_600_000_000 + i
+        elif kind == 2:
+            last_price = response.last_price
+            last_price.figi = "BBG004730N88"
+            last_price.price.units = 250
+            last_price.time.seconds = 1_600_000_000 + i
+        else:
+            response.CopyFrom(make_order_book_response(depth=20))
+        burst.append(response)
+    return burst
+
+
+def make_post_order_request() -> PostOrderRequest:
+    return PostOrderRequest(
+        figi="BBG004730N88",
+        quantity=1,
+        price=Quotation(units=250, nano=500_000_000),
+        direction=OrderDirection.ORDER_DIRECTION_BUY,
+        account_id="2000000000",
+        order_type=OrderType.ORDER_TYPE_LIMIT,
+        order_id=str(uuid.UUID(int=0)),
+        instrument_id="",
+    )
@@ -0,0 +1,185 @@
+"""Benchmark suite for the conversion layer and service hot paths.
+
+Reports time per call, items per second, memory retained by the result and
+peak memory during a call. Results can be saved and compared later:
+
+    python -m benchmarks.suite --save before.json
+    python -m benchmarks.suite --baseline before.json
+
+Run with ``python -m benchmarks.suite``.
+"""
+import argparse
+from pathlib import Path
+from typing import Any, Callable, List, Tuple
+
+from benchmarks.harness import Result, load_results, print_results, run, save_results
+from benchmarks.payloads import (
+    make_candles_response,
+    make_market_data_burst,
+    make_order_book_response,
+    make_post_order_request,
+    make_shares_response,
+)
+from tinkoff.invest import _grpc_helpers
+from tinkoff.invest.grpc import instruments_pb2, marketdata_pb2, orders_pb2
+from tinkoff.invest.schemas import (
+    CandleInstrument,
+    GetCandlesResponse,
+    MarketDataRequest,
+    MarketDataResponse,
+    SharesResponse,
+    SubscribeCandlesRequest,
+    SubscriptionAction,
+    SubscriptionInterval,
+)
+from tinkoff.invest.utils import filter_distinct_candles, quotation_to_decimal
+
+Case = Tuple[str, Callable[[], Any], int]
+
+
+def decoding_cases() -> List[Case]:
+    candles = make_candles_response()
+    order_book = make_order_book_response()
+    shares = make_shares_response()
+    burst = make_market_data_burst()
+    return [
+        (
+            "decode GetCandlesResponse[1000]",
+            lambda: _grpc_helpers.protobuf_to_dataclass(candles, GetCandlesResponse),
+            len(candles.candles),
+        ),
+        (
+            "decode MarketDataResponse.orderbook[50]",
+            lambda: _grpc_helpers.protobuf_to_dataclass(order_book, MarketDataResponse),
+            1,
+        ),
+        (
+            "decode SharesResponse[2000]",
+            lambda: _grpc_helpers.protobuf_to_dataclass(shares, SharesResponse),
+            len(shares.instruments),
+        ),
+        (
+            "decode MarketDataResponse burst[1000]",
+            lambda: [
+                _grpc_helpers.protobuf_to_dataclass(response, MarketDataResponse)
+                for response in burst
+            ],
+            len(burst),
+        ),
+    ]
+
+
+def encoding_cases() -> List[Case]:
+    post_order = make_post_order_request()
+    shares = _grpc_helpers.protobuf_to_dataclass(make_shares_response(), SharesResponse)
+    subscribe = MarketDataRequest(
+        subscribe_candles_request=SubscribeCandlesRequest(
+            subscription_action=SubscriptionAction.SUBSCRIPTION_ACTION_SUBSCRIBE,
+            instruments=[
+                CandleInstrument(
+                    figi=f"BBG{i:09}",
+                    interval=SubscriptionInterval.SUBSCRIPTION_INTERVAL_ONE_MINUTE,
+                )
+                for i in range(100)
+            ],
+        )
+    )
+    return [
+        (
+            "encode PostOrderRequest",
+            lambda: _grpc_helpers.dataclass_to_protobuff(
+                post_order, orders_pb2.PostOrderRequest()
+            ),
+            1,
+        ),
+        (
+            "encode MarketDataRequest subscribe[100]",
+            lambda: _grpc_helpers.dataclass_to_protobuff(
+                subscribe, marketdata_pb2.MarketDataRequest()
+            ),
+            100,
+        ),
+        (
+            "encode SharesResponse[2000]",
+            lambda: _grpc_helpers.dataclass_to_protobuff(
+                shares, instruments_pb2.SharesResponse()
+            ),
+            len(shares.instruments),
+        ),
+    ]
+
+
+def helpers_cases() -> List[Case]:
+    pb_candles = make_candles_response()
+    timestamps = [candle.time for candle in pb_candles.candles]
+    candles = _grpc_helpers.protobuf_to_dataclass(
+        pb_candles, GetCandlesResponse
+    ).candles
+    datetimes = [candle.time for candle in candles]
+    prices = [candle.close for candle in candles]
+    # every candle is received twice, as at the edges of requested intervals
+    repeated_candles = [candle for candle in candles for _ in range(2)]
+    return [
+        (
+            "ts_to_datetime[1000]",
+            lambda: list(map(_grpc_helpers.ts_to_datetime, timestamps)),
+            len(timestamps),
+        ),
+        (
+            "datetime_to_ts[1000]",
+            lambda: list(map(_grpc_helpers.datetime_to_ts, datetimes)),
+            len(datetimes),
+        ),
+        (
+            "quotation_to_decimal[1000]",
+            lambda: list(map(quotation_to_decimal, prices)),
+            len(prices),
+        ),
+        (
+            "filter_distinct_candles[2000]",
+            lambda: filter_distinct_candles(repeated_candles),
+            len(repeated_candles),
+        ),
+    ]
+
+
+def columnar_cases() -> List[Case]:
+    try:
+        from tinkoff.invest.columnar import (  # pylint:disable=import-outside-toplevel
+            candles_to_columns,
+        )
+    except ImportError:
+        return []
+    candles = make_candles_response()
+    return [
+        (
+            "candles_to_columns[1000]",
+            lambda: candles_to_columns(candles.candles),
+            len(candles.candles),
+        ),
+    ]
+
+
+def run_suite(name_filter: str = "") -> List[Result]:
+    cases = decoding_cases() + encoding_cases() + helpers_cases() + columnar_cases()
+    return [
+        run(name, func, items) for name, func, items in cases if name_filter in name
+    ]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--filter", default="", help="run cases containing text")
+    parser.add_argument("--save", type=Path, help="save results into json file")
+    parser.add_argument("--baseline", type=Path, help="compare with saved results")
+    args = parser.parse_args()
+
+    baseline = load_results(args.baseline) if args.baseline else None
+    results = run_suite(args.filter)
+    print_results(results, baseline)
+    if args.save:
+        save_results(args.save, results)
+
+
+if __name__ == "__main__":
+    main()
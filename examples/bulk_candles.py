@@ -0,0 +1,46 @@
+import logging
+import os
+from datetime import timedelta
+
+from tinkoff.invest import CandleInterval, Client
+from tinkoff.invest.data_loaders.bulk_candles_loader import BulkCandlesLoader
+from tinkoff.invest.data_loaders.candles_jobs import BulkLoadProgress, CandlesJob
+from tinkoff.invest.rate_limiting.scheduler import RateLimitScheduler
+from tinkoff.invest.rate_limiting.sync.grpc_interceptor import (
+    RateLimitClientInterceptor,
+)
+from tinkoff.invest.utils import now
+
+TOKEN = os.environ["INVEST_TOKEN"]
+logging.basicConfig(format="%(asctime)s %(levelname)s:%(message)s", level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+def log_progress(progress: BulkLoadProgress):
+    logger.info(
+        "%s/%s jobs, %.0f candles/s",
+        progress.jobs_done,
+        progress.jobs_total,
+        progress.candles_per_second,
+    )
+
+
+def main():
+    interceptor = RateLimitClientInterceptor(scheduler=RateLimitScheduler())
+    with Client(TOKEN, interceptors=[interceptor]) as client:
+        shares = client.instruments.shares().instruments[:100]
+        jobs = [
+            CandlesJob(
+                figi=share.figi,
+                interval=CandleInterval.CANDLE_INTERVAL_HOUR,
+                from_=now() - timedelta(days=90),
+            )
+            for share in shares
+        ]
+        loader = BulkCandlesLoader(client, max_workers=8, on_progress=log_progress)
+        for result in loader.load(jobs):
+            print(result.job.figi, len(result.candles), result.error)
+
+
+if __name__ == "__main__":
+    main()
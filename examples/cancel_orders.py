@@ -15,7 +15,8 @@ def main():
         account, *_ = response.accounts
         account_id = account.id
         logger.info("Orders: %s", client.orders.get_orders(account_id=account_id))
-        client.cancel_all_orders(account_id=account.id)
+        result = client.cancel_all_orders(account_id=account.id)
+        logger.info("Failed to cancel: %s", result.failed)
         logger.info("Orders: %s", client.orders.get_orders(account_id=account_id))
 
 
@@ -0,0 +1,20 @@
+import os
+
+from tinkoff.invest import Client, GetOperationsByCursorRequest
+from tinkoff.invest.data_loaders.operations_cursor import OperationsCursorCheckpoint
+
+token = os.environ["INVEST_TOKEN"]
+
+
+with Client(token) as client:
+    accounts = client.users.get_accounts()
+    account_id = accounts.accounts[0].id
+
+    request = GetOperationsByCursorRequest(account_id=account_id)
+    # store the checkpoint to continue from it later
+    checkpoint = OperationsCursorCheckpoint()
+    for operation in client.get_all_operations_by_cursor(
+        request, page_size=1000, checkpoint=checkpoint
+    ):
+        print(operation.date, operation.type, operation.payment)
+    print(checkpoint)
@@ -0,0 +1,20 @@
+import logging
+import os
+
+from tinkoff.invest import Client
+from tinkoff.invest.deadlines.settings import DeadlineSettings
+from tinkoff.invest.hedging.settings import HedgingSettings
+
+logging.basicConfig(format="%(asctime)s %(levelname)s:%(message)s", level=logging.DEBUG)
+
+TOKEN = os.environ["INVEST_TOKEN"]
+
+deadlines = DeadlineSettings(
+    default=30.0, methods={"MarketDataService/GetLastPrices": 2.0}
+)
+# a second request is sent when the first one is slower than 95% of calls
+hedging = HedgingSettings(percentile=95.0)
+
+with Client(TOKEN, deadlines=deadlines, hedging=hedging) as client:
+    for _ in range(100):
+        print(client.market_data.get_last_prices(figi=["BBG004730N88"]))
@@ -0,0 +1,31 @@
+import os
+import uuid
+
+from tinkoff.invest import OrderDirection, OrderType, PostOrderRequest, RequestTemplate
+from tinkoff.invest.sandbox.client import SandboxClient
+
+TOKEN = os.environ["INVEST_TOKEN"]
+
+
+def main():
+    with SandboxClient(TOKEN) as client:
+        accounts = client.users.get_accounts()
+        account_id = accounts.accounts[0].id
+        template = RequestTemplate(
+            PostOrderRequest(
+                figi="BBG004730N88",
+                account_id=account_id,
+                direction=OrderDirection.ORDER_DIRECTION_BUY,
+                order_type=OrderType.ORDER_TYPE_MARKET,
+            )
+        )
+        for quantity in (1, 2, 3):
+            print(
+                client.orders.post_order_from_template(
+                    template, quantity=quantity, order_id=str(uuid.uuid4())
+                )
+            )
+
+
+if __name__ == "__main__":
+    main()
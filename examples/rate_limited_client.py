@@ -0,0 +1,28 @@
+import logging
+import os
+from datetime import timedelta
+
+from tinkoff.invest import CandleInterval, Client
+from tinkoff.invest.rate_limiting.scheduler import RateLimitScheduler
+from tinkoff.invest.rate_limiting.sync.grpc_interceptor import (
+    RateLimitClientInterceptor,
+)
+from tinkoff.invest.utils import now
+
+logging.basicConfig(format="%(asctime)s %(levelname)s:%(message)s", level=logging.DEBUG)
+
+TOKEN = os.environ["INVEST_TOKEN"]
+
+# budgets are learned from responses, known limits may be set beforehand
+scheduler = RateLimitScheduler(limits={"MarketDataService/GetCandles": 300})
+
+with Client(
+    TOKEN, interceptors=[RateLimitClientInterceptor(scheduler=scheduler)]
+) as client:
+    for candle in client.get_all_candles(
+        figi="BBG000B9XRY4",
+        from_=now() - timedelta(days=301),
+        interval=CandleInterval.CANDLE_INTERVAL_1_MIN,
+        max_concurrency=8,
+    ):
+        print(candle)
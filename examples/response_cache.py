@@ -0,0 +1,22 @@
+import logging
+import os
+from datetime import timedelta
+
+from tinkoff.invest import Client
+from tinkoff.invest.caching.response_cache.settings import ResponseCacheSettings
+from tinkoff.invest.caching.response_cache.sync.grpc_interceptor import (
+    ResponseCacheClientInterceptor,
+)
+
+logging.basicConfig(format="%(asctime)s %(levelname)s:%(message)s", level=logging.DEBUG)
+
+TOKEN = os.environ["INVEST_TOKEN"]
+
+settings = ResponseCacheSettings()
+settings.ttls["InstrumentsService/GetBrands"] = timedelta(hours=6)
+response_cache = ResponseCacheClientInterceptor(settings)
+
+with Client(TOKEN, interceptors=[response_cache]) as client:
+    for _ in range(3):
+        print(len(client.instruments.get_brands().brands))
+    print(response_cache.stats["InstrumentsService/GetBrands"])
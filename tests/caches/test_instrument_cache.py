@@ -1,6 +1,11 @@
+import os
 import random
+import threading
+import time
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from datetime import timedelta
+from pathlib import Path
 from typing import Any, Callable, Dict, Iterator, Type
 from unittest.mock import Mock
 
@@ -22,10 +27,12 @@ from tinkoff.invest import (
     FutureResponse,
     FuturesResponse,
     InstrumentIdType,
+    InstrumentType,
     Share,
     ShareResponse,
     SharesResponse,
 )
+from tinkoff.invest._grpc_helpers import MessageView
 from tinkoff.invest.caching.instruments_cache.instruments_cache import InstrumentsCache
 from tinkoff.invest.caching.instruments_cache.models import InstrumentsResponse
 from tinkoff.invest.caching.instruments_cache.settings import InstrumentsCacheSettings
@@ -273,3 +280,211 @@ class TestInstrumentCache:
         )
 
         get_instruments.assert_called_once()
+
+
+def wait_for_revalidation():
+    for thread in threading.enumerate():
+        if thread.name.startswith("instruments-cache-"):
+            thread.join(timeout=5)
+
+
+class TestInstrumentsCacheSnapshot:
+    @pytest.fixture()
+    def settings(self, tmp_path: Path) -> InstrumentsCacheSettings:
+        return InstrumentsCacheSettings(snapshot_dir=tmp_path)
+
+    @pytest.fixture()
+    def instruments_cache(
+        self, settings: InstrumentsCacheSettings, mocked_services
+    ) -> InstrumentsCache:
+        # time is not frozen, it runs in background threads anyway
+        return InstrumentsCache(
+            settings=settings, instruments_service=mocked_services.instruments
+        )
+
+    @pytest.mark.usefixtures("instruments_cache")
+    def test_loads_instruments_from_snapshot(
+        self,
+        mocked_services: Services,
+        settings: InstrumentsCacheSettings,
+        instrument_map,
+    ):
+        instruments = mocked_services.instruments
+        instruments.shares.reset_mock()
+        share = instrument_map[Share].instruments[3]
+
+        cache = InstrumentsCache(settings=settings, instruments_service=instruments)
+
+        instruments.shares.assert_not_called()
+        assert sorted(path.name for path in settings.snapshot_dir.iterdir()) == [
+            "bonds.pb",
+            "currencies.pb",
+            "etfs.pb",
+            "futures.pb",
+            "shares.pb",
+        ]
+        from_snapshot = cache.share_by(
+            id_type=InstrumentIdType.INSTRUMENT_ID_TYPE_TICKER,
+            class_code=share.class_code,
+            id=share.ticker,
+        ).instrument
+        assert isinstance(from_snapshot, Share)
+        assert (from_snapshot.name, from_snapshot.uid) == (share.name, share.uid)
+        assert [share.name for share in cache.shares().instruments] == [
+            share.name for share in instrument_map[Share].instruments
+        ]
+
+    @pytest.mark.usefixtures("instruments_cache")
+    def test_preloads_snapshot_without_decoding(
+        self, mocked_services: Services, settings: InstrumentsCacheSettings
+    ):
+        cache = InstrumentsCache(
+            settings=settings, instruments_service=mocked_services.instruments
+        )
+
+        # pylint:disable=protected-access
+        for storage in cache._storages.values():
+            assert isinstance(storage._instruments_response, MessageView)
+
+    @pytest.mark.usefixtures("instruments_cache")
+    def test_revalidates_outdated_snapshot_in_background(
+        self,
+        mocked_services: Services,
+        settings: InstrumentsCacheSettings,
+    ):
+        instruments = mocked_services.instruments
+        instruments.futures.reset_mock()
+        saved_at = time.time() - (settings.ttl + timedelta(seconds=1)).total_seconds()
+        for path in settings.snapshot_dir.iterdir():
+            os.utime(path, (saved_at, saved_at))
+
+        InstrumentsCache(settings=settings, instruments_service=instruments)
+        wait_for_revalidation()
+
+        instruments.futures.assert_called_once()
+
+    @pytest.mark.parametrize(
+        "settings", [InstrumentsCacheSettings(ttl=timedelta(seconds=1))]
+    )
+    def test_expires_snapshot_after_rest_of_ttl(
+        self, mocked_services: Services, settings: InstrumentsCacheSettings, tmp_path
+    ):
+        instruments = mocked_services.instruments
+        settings.snapshot_dir = tmp_path
+        InstrumentsCache(settings=settings, instruments_service=instruments)
+        saved_at = time.time() - 0.8
+        for path in tmp_path.iterdir():
+            os.utime(path, (saved_at, saved_at))
+        cache = InstrumentsCache(settings=settings, instruments_service=instruments)
+        instruments.shares.reset_mock()
+
+        cache.shares()
+        instruments.shares.assert_not_called()
+        time.sleep(0.3)
+        cache.shares()
+
+        instruments.shares.assert_called_once()
+
+
+class TestInstrumentsCacheLazyLoading:
+    @pytest.fixture()
+    def settings(self) -> InstrumentsCacheSettings:
+        return InstrumentsCacheSettings(
+            preload=frozenset({InstrumentType.INSTRUMENT_TYPE_SHARE})
+        )
+
+    def test_loads_other_types_once_on_first_access(
+        self,
+        mocked_services: Services,
+        instruments_cache: InstrumentsCache,
+        instrument_map,
+    ):
+        instruments = mocked_services.instruments
+        instruments.shares.assert_called_once()
+        instruments.bonds.assert_not_called()
+        bond = instrument_map[Bond].instruments[0]
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            bonds = list(
+                executor.map(
+                    lambda _: instruments_cache.bond_by(
+                        id_type=InstrumentIdType.INSTRUMENT_ID_TYPE_UID,
+                        class_code=bond.class_code,
+                        id=bond.uid,
+                    ),
+                    range(8),
+                )
+            )
+
+        instruments.bonds.assert_called_once()
+        assert {response.instrument.uid for response in bonds} == {bond.uid}
+        instruments.etfs.assert_not_called()
+
+    def test_accounts_memory_of_loaded_types(self, instruments_cache: InstrumentsCache):
+        shares_usage = instruments_cache.get_memory_usage()[
+            InstrumentType.INSTRUMENT_TYPE_SHARE
+        ]
+
+        assert list(instruments_cache.get_memory_usage()) == [
+            InstrumentType.INSTRUMENT_TYPE_SHARE
+        ]
+        assert shares_usage.instruments == 10
+        assert shares_usage.size_bytes > 0
+
+        instruments_cache.futures()
+
+        assert set(instruments_cache.get_memory_usage()) == {
+            InstrumentType.INSTRUMENT_TYPE_SHARE,
+            InstrumentType.INSTRUMENT_TYPE_FUTURES,
+        }
+
+
+class TestInstrumentsCacheStaleWhileRevalidate:
+    @pytest.fixture()
+    def settings(self) -> InstrumentsCacheSettings:
+        return InstrumentsCacheSettings(
+            ttl=timedelta(milliseconds=50), stale_while_revalidate=True
+        )
+
+    @pytest.fixture()
+    def instruments_cache(
+        self, settings: InstrumentsCacheSettings, mocked_services
+    ) -> InstrumentsCache:
+        return InstrumentsCache(
+            settings=settings, instruments_service=mocked_services.instruments
+        )
+
+    def test_serves_stale_instruments_while_refreshing(
+        self,
+        mocked_services: Services,
+        instruments_cache: InstrumentsCache,
+        instrument_map,
+    ):
+        refreshed = gen_instruments_response(SharesResponse, Share)
+        release = threading.Event()
+
+        def get_shares(**_):
+            release.wait(timeout=5)
+            return refreshed
+
+        mocked_services.instruments.shares.side_effect = get_shares
+        time.sleep(0.1)
+
+        stale = instruments_cache.shares()
+        stats = instruments_cache.get_refresh_stats()[
+            InstrumentType.INSTRUMENT_TYPE_SHARE
+        ]
+        release.set()
+        wait_for_revalidation()
+        fresh = instruments_cache.shares()
+
+        assert stale.instruments[0].uid == instrument_map[Share].instruments[0].uid
+        assert stats.in_progress
+        assert stats.age >= timedelta(milliseconds=100)
+        assert fresh.instruments[0].uid == refreshed.instruments[0].uid
+        refreshed_stats = instruments_cache.get_refresh_stats()[
+            InstrumentType.INSTRUMENT_TYPE_SHARE
+        ]
+        assert not refreshed_stats.in_progress
+        assert refreshed_stats.age < stats.age
+        assert refreshed_stats.duration > timedelta(0)
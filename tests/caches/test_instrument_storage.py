@@ -0,0 +1,223 @@
+import sys
+import uuid
+from pathlib import Path
+
+import pytest
+
+from tinkoff.invest import (
+    InstrumentIdType,
+    InstrumentType,
+    Quotation,
+    ResponseFormat,
+    Share,
+    SharesResponse,
+)
+from tinkoff.invest.caching.instruments_cache.instrument_storage import (
+    InstrumentStorage,
+    _get_size,
+)
+from tinkoff.invest.caching.instruments_cache.instruments_cache import InstrumentsCache
+from tinkoff.invest.caching.instruments_cache.settings import InstrumentsCacheSettings
+from tinkoff.invest.caching.instruments_cache.snapshot import InstrumentsSnapshot
+
+
+def uid() -> str:
+    return uuid.uuid4().hex
+
+
+def test_sizes_slotted_dataclass_by_its_fields():
+    quotation = Quotation(units=1000, nano=5)
+
+    assert _get_size(quotation, set()) == sum(
+        map(sys.getsizeof, (quotation, quotation.units, quotation.nano))
+    )
+
+
+@pytest.fixture()
+def shares_response() -> SharesResponse:
+    return SharesResponse(
+        instruments=[
+            Share(
+                name=f"Share_{i}",
+                # pairs of shares are traded in different class codes
+                isin=f"isin-{i // 2}",
+                position_uid=uid(),
+                class_code=uid(),
+                figi=uid(),
+                ticker=uid(),
+                uid=uid(),
+            )
+            for i in range(10)
+        ]
+    )
+
+
+class TestInstrumentStorage:
+    @pytest.fixture(params=["dataclass", "snapshot"])
+    def storage(self, request, shares_response: SharesResponse, tmp_path: Path):
+        if request.param == "dataclass":
+            return InstrumentStorage(instruments_response=shares_response)
+        snapshot = InstrumentsSnapshot(tmp_path)
+        snapshot.save("shares", shares_response)
+        instruments_response, _ = snapshot.load("shares")
+        return InstrumentStorage(instruments_response=instruments_response)
+
+    @pytest.mark.parametrize(
+        ("id_type", "get_id"),
+        [
+            (InstrumentIdType.INSTRUMENT_ID_UNSPECIFIED, lambda share: share.figi),
+            (InstrumentIdType.INSTRUMENT_ID_TYPE_FIGI, lambda share: share.figi),
+            (InstrumentIdType.INSTRUMENT_ID_TYPE_UID, lambda share: share.uid),
+            (
+                InstrumentIdType.INSTRUMENT_ID_TYPE_POSITION_UID,
+                lambda share: share.position_uid,
+            ),
+        ],
+    )
+    def test_gets_without_class_code(
+        self,
+        storage: InstrumentStorage,
+        shares_response: SharesResponse,
+        id_type,
+        get_id,
+    ):
+        share = shares_response.instruments[4]
+
+        found = storage.get(id_type=id_type, class_code="", id=get_id(share))
+
+        assert isinstance(found, Share)
+        assert found.uid == share.uid
+
+    def test_gets_by_isin(
+        self, storage: InstrumentStorage, shares_response: SharesResponse
+    ):
+        first, second = shares_response.instruments[2:4]
+
+        assert [share.uid for share in storage.get_by_isin(first.isin)] == [
+            first.uid,
+            second.uid,
+        ]
+        assert storage.get_by_isin("unknown") == []
+
+    def test_gets_many(
+        self, storage: InstrumentStorage, shares_response: SharesResponse
+    ):
+        first, second = shares_response.instruments[:2]
+
+        by_uid = storage.get_many(
+            id_type=InstrumentIdType.INSTRUMENT_ID_TYPE_UID,
+            ids=[first.uid, "unknown", second.uid],
+        )
+        by_ticker = storage.get_many(
+            id_type=InstrumentIdType.INSTRUMENT_ID_TYPE_TICKER,
+            class_code=first.class_code,
+            ids=[first.ticker, second.ticker],
+        )
+
+        assert {id_: share.name for id_, share in by_uid.items()} == {
+            first.uid: first.name,
+            second.uid: second.name,
+        }
+        assert [share.uid for share in by_ticker.values()] == [first.uid]
+
+    def test_decodes_instrument_once(
+        self, storage: InstrumentStorage, shares_response: SharesResponse
+    ):
+        share = shares_response.instruments[1]
+
+        first = storage.get(
+            id_type=InstrumentIdType.INSTRUMENT_ID_TYPE_UID, class_code="", id=share.uid
+        )
+        _, second = storage.get_by_isin(share.isin)
+
+        assert isinstance(first, Share)
+        assert first is second
+
+    @pytest.mark.parametrize(
+        ("id_type", "class_code"),
+        [
+            (InstrumentIdType.INSTRUMENT_ID_TYPE_FIGI, ""),
+            (InstrumentIdType.INSTRUMENT_ID_TYPE_UID, ""),
+            (InstrumentIdType.INSTRUMENT_ID_TYPE_FIGI, "TQBR"),
+            (InstrumentIdType.INSTRUMENT_ID_TYPE_TICKER, "TQBR"),
+            (InstrumentIdType.INSTRUMENT_ID_TYPE_UID, "TQBR"),
+        ],
+    )
+    def test_does_not_find_instruments_by_empty_id(self, id_type, class_code):
+        storage = InstrumentStorage(
+            instruments_response=SharesResponse(
+                instruments=[
+                    Share(
+                        name="without ids",
+                        isin="",
+                        position_uid="",
+                        class_code="TQBR",
+                        figi="",
+                        ticker="",
+                        uid="",
+                    )
+                ]
+            )
+        )
+
+        with pytest.raises(KeyError):
+            storage.get(id_type=id_type, class_code=class_code, id="")
+        assert storage.get_many(id_type=id_type, class_code=class_code, ids=[""]) == {}
+
+
+class TestInstrumentsCacheLookups:
+    @pytest.fixture()
+    def instruments_service(self, mocker, shares_response: SharesResponse):
+        instruments_service = mocker.Mock()
+        instruments_service.shares.__name__ = "shares"
+        instruments_service.shares.return_value = shares_response
+        return instruments_service
+
+    @pytest.fixture()
+    def instruments_cache(self, instruments_service) -> InstrumentsCache:
+        return InstrumentsCache(
+            settings=InstrumentsCacheSettings(
+                preload=frozenset({InstrumentType.INSTRUMENT_TYPE_SHARE})
+            ),
+            instruments_service=instruments_service,
+        )
+
+    def test_gets_shares_by_ids(
+        self, instruments_cache: InstrumentsCache, shares_response: SharesResponse
+    ):
+        share = shares_response.instruments[5]
+
+        shares = instruments_cache.shares_by_ids(
+            id_type=InstrumentIdType.INSTRUMENT_ID_TYPE_POSITION_UID,
+            ids=[share.position_uid, "unknown"],
+        )
+
+        assert list(shares) == [share.position_uid]
+        assert shares[share.position_uid].uid == share.uid
+
+    def test_gets_shares_by_isin(
+        self,
+        instruments_cache: InstrumentsCache,
+        instruments_service,
+        shares_response: SharesResponse,
+    ):
+        first, second = shares_response.instruments[6:8]
+
+        shares = instruments_cache.shares_by_isin(first.isin)
+
+        assert [(share.class_code, share.uid) for share in shares] == [
+            (first.class_code, first.uid),
+            (second.class_code, second.uid),
+        ]
+        instruments_service.shares.assert_called_once()
+
+
+def test_cache_rejects_bytes_response_format(mocker):
+    instruments_service = mocker.Mock(response_format=ResponseFormat.BYTES)
+
+    with pytest.raises(ValueError, match="InstrumentsCache .* got BYTES"):
+        InstrumentsCache(
+            settings=InstrumentsCacheSettings(),
+            instruments_service=instruments_service,
+        )
+    instruments_service.shares.assert_not_called()
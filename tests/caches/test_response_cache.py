@@ -0,0 +1,166 @@
+import asyncio
+from datetime import timedelta
+
+import grpc
+from pytest_freezegun import freeze_time
+
+from tinkoff.invest.caching.response_cache.aio.grpc_interceptor import (
+    AsyncResponseCacheClientInterceptor,
+)
+from tinkoff.invest.caching.response_cache.response_cache import ResponseCacheStats
+from tinkoff.invest.caching.response_cache.settings import ResponseCacheSettings
+from tinkoff.invest.caching.response_cache.sync.grpc_interceptor import (
+    ResponseCacheClientInterceptor,
+)
+from tinkoff.invest.grpc import instruments_pb2
+
+SERVICE = "/tinkoff.public.invest.api.contract.v1.InstrumentsService"
+GET_BRANDS = f"{SERVICE}/GetBrands"
+GET_BRAND_BY = f"{SERVICE}/GetBrandBy"
+
+
+def brand_request(id_):
+    return instruments_pb2.GetBrandRequest(id=id_)
+
+
+class TestResponseCacheClientInterceptor:
+    def test_returns_cached_call(self, mocker):
+        continuation = mocker.Mock(
+            side_effect=lambda *_: mocker.Mock(**{"exception.return_value": None})
+        )
+        details = mocker.Mock(method=GET_BRANDS, metadata=None)
+        interceptor = ResponseCacheClientInterceptor()
+
+        calls = [
+            interceptor.intercept_unary_unary(
+                continuation, details, instruments_pb2.GetBrandsRequest()
+            )
+            for _ in range(3)
+        ]
+
+        assert continuation.call_count == 1
+        assert calls[0] is calls[1] is calls[2]
+        assert interceptor.stats["InstrumentsService/GetBrands"] == ResponseCacheStats(
+            hits=2, misses=1
+        )
+
+    def test_expires_calls_after_ttl(self, mocker):
+        continuation = mocker.Mock(
+            return_value=mocker.Mock(**{"exception.return_value": None})
+        )
+        details = mocker.Mock(method=GET_BRANDS, metadata=None)
+
+        with freeze_time() as frozen_datetime:
+            interceptor = ResponseCacheClientInterceptor(
+                ResponseCacheSettings(
+                    ttls={"InstrumentsService/GetBrands": timedelta(minutes=1)}
+                )
+            )
+            for _ in range(2):
+                interceptor.intercept_unary_unary(
+                    continuation, details, instruments_pb2.GetBrandsRequest()
+                )
+                frozen_datetime.tick(timedelta(minutes=2))
+
+        assert continuation.call_count == 2
+
+    def test_evicts_least_recently_used_calls(self, mocker):
+        continuation = mocker.Mock(
+            return_value=mocker.Mock(**{"exception.return_value": None})
+        )
+        details = mocker.Mock(method=GET_BRAND_BY, metadata=None)
+        interceptor = ResponseCacheClientInterceptor(
+            ResponseCacheSettings(
+                ttls={"InstrumentsService/GetBrandBy": timedelta(days=1)}, maxsize=2
+            )
+        )
+
+        for id_ in ["a", "b", "a", "c", "a", "b"]:
+            interceptor.intercept_unary_unary(continuation, details, brand_request(id_))
+
+        requested = [call.args[1].id for call in continuation.call_args_list]
+        assert requested == ["a", "b", "c", "b"]
+
+    def test_does_not_cache_failed_and_other_calls(self, mocker):
+        continuation = mocker.Mock(
+            return_value=mocker.Mock(**{"exception.return_value": grpc.RpcError()})
+        )
+        interceptor = ResponseCacheClientInterceptor()
+
+        for method in [GET_BRANDS, GET_BRANDS, GET_BRAND_BY]:
+            interceptor.intercept_unary_unary(
+                continuation,
+                mocker.Mock(method=method, metadata=None),
+                brand_request("a"),
+            )
+
+        assert continuation.call_count == 3
+
+    def test_copies_cached_response_for_each_caller(self, mocker):
+        response = instruments_pb2.GetBrandsResponse(
+            brands=[instruments_pb2.Brand(uid="uid")]
+        )
+        continuation = mocker.Mock(
+            return_value=mocker.Mock(
+                **{"exception.return_value": None, "result.return_value": response}
+            )
+        )
+        details = mocker.Mock(method=GET_BRANDS, metadata=None)
+        interceptor = ResponseCacheClientInterceptor(copy_responses=True)
+
+        responses = [
+            interceptor.intercept_unary_unary(
+                continuation, details, instruments_pb2.GetBrandsRequest()
+            ).result()
+            for _ in range(2)
+        ]
+        responses[0].brands[0].uid = "changed"
+        cached = interceptor.intercept_unary_unary(
+            continuation, details, instruments_pb2.GetBrandsRequest()
+        ).result()
+
+        assert continuation.call_count == 1
+        assert [r.brands[0].uid for r in responses] == ["changed", "uid"]
+        assert cached.brands[0].uid == "uid"
+        assert response.brands[0].uid == "uid"
+
+    async def test_aio_copies_cached_response_for_each_caller(self, mocker):
+        response = instruments_pb2.GetBrandsResponse(
+            brands=[instruments_pb2.Brand(uid="uid")]
+        )
+        call = asyncio.ensure_future(asyncio.sleep(0, result=response))
+        continuation = mocker.AsyncMock(return_value=call)
+        details = mocker.Mock(method=GET_BRANDS.encode(), metadata=None)
+        interceptor = AsyncResponseCacheClientInterceptor(copy_responses=True)
+
+        responses = [
+            await (
+                await interceptor.intercept_unary_unary(
+                    continuation, details, instruments_pb2.GetBrandsRequest()
+                )
+            )
+            for _ in range(2)
+        ]
+        responses[0].brands[0].uid = "changed"
+
+        continuation.assert_awaited_once()
+        assert [r.brands[0].uid for r in responses] == ["changed", "uid"]
+        assert response.brands[0].uid == "uid"
+
+    async def test_aio_returns_cached_call(self, mocker):
+        call = asyncio.ensure_future(asyncio.sleep(0, result="response"))
+        continuation = mocker.AsyncMock(return_value=call)
+        details = mocker.Mock(method=GET_BRANDS.encode(), metadata=None)
+        interceptor = AsyncResponseCacheClientInterceptor()
+
+        calls = [
+            await interceptor.intercept_unary_unary(
+                continuation, details, instruments_pb2.GetBrandsRequest()
+            )
+            for _ in range(2)
+        ]
+
+        assert calls == [call, call]
+        assert await calls[1] == "response"
+        continuation.assert_awaited_once()
+        assert interceptor.stats["InstrumentsService/GetBrands"].hits == 1
@@ -0,0 +1,133 @@
+from datetime import timedelta
+
+import pytest
+
+from tinkoff.invest.data_loaders.async_bulk_candles_loader import AsyncBulkCandlesLoader
+from tinkoff.invest.data_loaders.bulk_candles_loader import BulkCandlesLoader
+from tinkoff.invest.data_loaders.candles_jobs import CandlesJob
+from tinkoff.invest.schemas import CandleInterval, HistoricCandle, Quotation
+from tinkoff.invest.utils import now
+
+FROM = now() - timedelta(days=2)
+
+
+def candles_of(figi):
+    quotation = Quotation(units=len(figi), nano=0)
+    return [
+        HistoricCandle(
+            open=quotation,
+            high=quotation,
+            low=quotation,
+            close=quotation,
+            volume=i,
+            time=FROM + timedelta(hours=i),
+            is_complete=True,
+        )
+        for i in range(len(figi))
+    ]
+
+
+def get_all_candles(*, figi, **_):
+    if figi == "broken":
+        raise ValueError(figi)
+    return iter(candles_of(figi))
+
+
+async def aget_all_candles(*, figi, **_):
+    for candle in get_all_candles(figi=figi):
+        yield candle
+
+
+def jobs_of(*figis):
+    return [
+        CandlesJob(figi=figi, interval=CandleInterval.CANDLE_INTERVAL_HOUR, from_=FROM)
+        for figi in figis
+    ]
+
+
+class TestBulkCandlesLoader:
+    def test_loads_all_jobs(self, mocker):
+        services = mocker.Mock()
+        services.get_all_candles.side_effect = get_all_candles
+        progress = []
+
+        results = list(
+            BulkCandlesLoader(
+                services,
+                max_workers=2,
+                on_progress=lambda p: progress.append(
+                    (p.jobs_done, p.jobs_failed, p.candles_loaded)
+                ),
+            ).load(jobs_of("a", "bb", "broken", "ccc"))
+        )
+
+        by_figi = {result.job.figi: result for result in results}
+        assert by_figi["ccc"].candles == candles_of("ccc")
+        assert isinstance(by_figi["broken"].error, ValueError)
+        assert by_figi["broken"].candles == []
+        assert progress[-1] == (4, 1, 6)
+        assert services.get_all_candles.call_count == 4
+
+    def test_loads_through_market_data_cache(self, mocker):
+        services = mocker.Mock()
+        cache = mocker.Mock()
+        cache.get_all_candles.side_effect = get_all_candles
+
+        results = list(
+            BulkCandlesLoader(services, market_data_cache=cache).load(jobs_of("a"))
+        )
+
+        assert results[0].candles == candles_of("a")
+        cache.get_all_candles.assert_called_once_with(
+            figi="a",
+            interval=CandleInterval.CANDLE_INTERVAL_HOUR,
+            from_=FROM,
+            to=None,
+        )
+        services.get_all_candles.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_async_loads_all_jobs(mocker):
+    services = mocker.Mock()
+    services.get_all_candles.side_effect = aget_all_candles
+    progress = []
+
+    results = [
+        result
+        async for result in AsyncBulkCandlesLoader(
+            services, max_concurrency=2, on_progress=progress.append
+        ).load(jobs_of("a", "bb", "broken"))
+    ]
+
+    assert {result.job.figi: len(result.candles) for result in results} == {
+        "a": 1,
+        "bb": 2,
+        "broken": 0,
+    }
+    assert progress[-1].jobs_done == 3
+    assert progress[-1].jobs_failed == 1
+    assert progress[-1].candles_per_second > 0
+
+
+@pytest.mark.asyncio
+async def test_async_loads_through_market_data_cache(mocker):
+    services = mocker.Mock()
+    cache = mocker.Mock()
+    cache.get_all_candles.side_effect = aget_all_candles
+
+    results = [
+        result
+        async for result in AsyncBulkCandlesLoader(
+            services, market_data_cache=cache
+        ).load(jobs_of("bb"))
+    ]
+
+    assert results[0].candles == candles_of("bb")
+    cache.get_all_candles.assert_called_once_with(
+        figi="bb",
+        interval=CandleInterval.CANDLE_INTERVAL_HOUR,
+        from_=FROM,
+        to=None,
+    )
+    services.get_all_candles.assert_not_called()
@@ -14,6 +14,7 @@ from tinkoff.invest import (
     HistoricCandle,
     Quotation,
 )
+from tinkoff.invest.async_services import AsyncMarketDataCache, AsyncServices
 from tinkoff.invest.caching.market_data_cache.cache_settings import (
     FileMetaData,
     MarketDataCacheSettings,
@@ -668,3 +669,115 @@ class TestCachedLoad:
         )
         self.assert_has_cached_ranges(cache_storage, [(A, E)])
         self.assert_file_count(cache_storage, 2)
+
+
+@pytest.fixture()
+def async_market_data_service(mocker):
+    service = mocker.Mock()
+
+    async def _get_candles(
+        figi: str,
+        from_: datetime,
+        to: datetime,
+        interval: CandleInterval = CandleInterval(0),
+        instrument_id: str = "",
+    ) -> GetCandlesResponse:
+        return get_candles_response(start=from_, end=to, interval=interval)
+
+    service.get_candles = mocker.AsyncMock(side_effect=_get_candles)
+    return service
+
+
+@pytest.fixture()
+def async_market_data_cache(
+    mocker, settings: MarketDataCacheSettings, async_market_data_service
+) -> AsyncMarketDataCache:
+    services = AsyncServices(mocker.Mock(), token="token")
+    services.market_data = async_market_data_service
+    return AsyncMarketDataCache(settings=settings, services=services)
+
+
+class TestAsyncCachedLoad:
+    async def _get_all_candles(self, cache: AsyncMarketDataCache, **kwargs):
+        return [candle async for candle in cache.get_all_candles(**kwargs)]
+
+    async def test_loads_from_net_then_from_cache(
+        self,
+        async_market_data_service,
+        async_market_data_cache: AsyncMarketDataCache,
+        market_data_cache: MarketDataCache,
+        figi: str,
+    ):
+        kwargs = {
+            "from_": now() - timedelta(days=30),
+            "to": now().replace(second=0, microsecond=0),
+            "interval": CandleInterval.CANDLE_INTERVAL_HOUR,
+        }
+        from_net = await self._get_all_candles(
+            async_market_data_cache, figi=figi, **kwargs
+        )
+        async_market_data_service.get_candles.reset_mock()
+
+        from_cache = await self._get_all_candles(
+            async_market_data_cache, figi=figi, **kwargs
+        )
+
+        async_market_data_service.get_candles.assert_not_called()
+        sync_figi = f"{figi}-sync"
+        sync_from_net = list(
+            market_data_cache.get_all_candles(figi=sync_figi, **kwargs)
+        )
+        sync_from_cache = list(
+            market_data_cache.get_all_candles(figi=sync_figi, **kwargs)
+        )
+        assert from_net
+        assert list(map(repr, from_net)) == list(map(repr, sync_from_net))
+        assert list(map(repr, from_cache)) == list(map(repr, sync_from_cache))
+
+    async def test_yields_candles_before_loading_whole_range(
+        self,
+        async_market_data_service,
+        async_market_data_cache: AsyncMarketDataCache,
+        figi: str,
+    ):
+        candles = async_market_data_cache.get_all_candles(
+            figi=figi,
+            from_=now() - timedelta(days=30),
+            to=now(),
+            interval=CandleInterval.CANDLE_INTERVAL_HOUR,
+        )
+
+        async for _ in candles:
+            break
+        await candles.aclose()
+
+        async_market_data_service.get_candles.assert_awaited_once()
+
+    async def test_loads_from_cache_and_left_from_net(
+        self,
+        async_market_data_service,
+        async_market_data_cache: AsyncMarketDataCache,
+        figi: str,
+    ):
+        interval = CandleInterval.CANDLE_INTERVAL_DAY
+        to = ceil_datetime(now(), timedelta(days=1))
+        from_ = to - timedelta(days=30)
+        await self._get_all_candles(
+            async_market_data_cache, figi=figi, from_=from_, to=to, interval=interval
+        )
+        async_market_data_service.get_candles.reset_mock()
+        from_early_uncached = from_ - timedelta(days=7)
+
+        cache_and_net = await self._get_all_candles(
+            async_market_data_cache,
+            figi=figi,
+            from_=from_early_uncached,
+            to=to,
+            interval=interval,
+        )
+
+        assert async_market_data_service.get_candles.await_count > 0
+        assert cache_and_net[0].time >= from_early_uncached
+        assert cache_and_net[-1].time == to
+        times = [candle.time for candle in cache_and_net]
+        assert times == sorted(set(times))
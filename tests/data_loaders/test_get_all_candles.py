@@ -1,10 +1,15 @@
 # pylint:disable=redefined-outer-name
 # pylint:disable=too-many-arguments
+import asyncio
+import threading
+import time
 from copy import copy
 from datetime import timedelta
 
 import pytest
 
+from tinkoff.invest.async_services import AsyncServices
+from tinkoff.invest.rate_limiting.scheduler import RateLimitScheduler
 from tinkoff.invest.schemas import (
     CandleInterval,
     GetCandlesResponse,
@@ -147,3 +152,210 @@ class TestGetAllCandles:
         )
 
         assert len(candles) == 1
+
+
+def _window_candles(from_, count=3):
+    # the last candle of a window is the first one of the next window
+    quotation = Quotation(units=100, nano=0)
+    return GetCandlesResponse(
+        candles=[
+            HistoricCandle(
+                open=quotation,
+                high=quotation,
+                low=quotation,
+                close=quotation,
+                volume=100,
+                time=from_ + timedelta(hours=12) * i,
+                is_complete=True,
+            )
+            for i in range(count)
+        ]
+    )
+
+
+class TestGetAllCandlesConcurrently:
+    def test_yields_in_time_order(self, mocker, from_, to):
+        services = mocker.Mock()
+        in_flight = []
+        max_in_flight = []
+        lock = threading.Lock()
+
+        def get_candles(*, from_, **_):
+            with lock:
+                in_flight.append(from_)
+                max_in_flight.append(len(in_flight))
+            # earlier windows are answered later
+            time.sleep((to - from_).days / 1000)
+            with lock:
+                in_flight.remove(from_)
+            return _window_candles(from_)
+
+        services.market_data.get_candles.side_effect = get_candles
+
+        candles = list(
+            Services.get_all_candles(
+                services,
+                figi="figi",
+                interval=CandleInterval.CANDLE_INTERVAL_1_MIN,
+                from_=from_,
+                to=to,
+                max_concurrency=4,
+            )
+        )
+
+        times = [candle.time for candle in candles]
+        assert times == sorted(set(times))
+        assert len(candles) == 31 * 2 + 1
+        assert max(max_in_flight) == 4
+
+    def test_stops_requesting_when_closed(self, mocker, from_, to):
+        services = mocker.Mock()
+        services.market_data.get_candles.side_effect = (
+            lambda *, from_, **_: _window_candles(from_)
+        )
+
+        candles = Services.get_all_candles(
+            services,
+            figi="figi",
+            interval=CandleInterval.CANDLE_INTERVAL_1_MIN,
+            from_=from_,
+            to=to,
+            max_concurrency=2,
+        )
+        next(candles)
+        candles.close()
+
+        assert services.market_data.get_candles.call_count <= 3
+
+    async def test_async_yields_in_time_order(self, mocker, from_, to):
+        services = mocker.Mock()
+        in_flight = []
+        max_in_flight = []
+
+        async def get_candles(*, from_, **_):
+            in_flight.append(from_)
+            max_in_flight.append(len(in_flight))
+            await asyncio.sleep((to - from_).days / 1000)
+            in_flight.remove(from_)
+            return _window_candles(from_)
+
+        services.market_data.get_candles = get_candles
+
+        candles = [
+            candle
+            async for candle in AsyncServices.get_all_candles(
+                services,
+                figi="figi",
+                interval=CandleInterval.CANDLE_INTERVAL_1_MIN,
+                from_=from_,
+                to=to,
+                max_concurrency=4,
+            )
+        ]
+
+        times = [candle.time for candle in candles]
+        assert times == sorted(set(times))
+        assert len(candles) == 31 * 2 + 1
+        assert max(max_in_flight) == 4
+
+    async def test_async_finishes_calls_when_closed(self, mocker, from_, to):
+        services = mocker.Mock()
+        in_flight = set()
+
+        async def get_candles(*, from_, **_):
+            in_flight.add(from_)
+            try:
+                await asyncio.sleep(0.01 if from_ == from_first else 5)
+            finally:
+                in_flight.discard(from_)
+            return _window_candles(from_)
+
+        from_first = from_
+        services.market_data.get_candles = get_candles
+        candles = AsyncServices.get_all_candles(
+            services,
+            figi="figi",
+            interval=CandleInterval.CANDLE_INTERVAL_1_MIN,
+            from_=from_,
+            to=to,
+            max_concurrency=4,
+        )
+
+        async for _ in candles:
+            break
+        await candles.aclose()
+
+        assert not in_flight
+
+    async def test_async_requests_windows_one_by_one_by_default(
+        self, mocker, from_, to
+    ):
+        services = mocker.Mock()
+        services.market_data.get_candles = mocker.AsyncMock(
+            side_effect=lambda *, from_, **_: _window_candles(from_)
+        )
+
+        async for _ in AsyncServices.get_all_candles(
+            services,
+            figi="figi",
+            interval=CandleInterval.CANDLE_INTERVAL_1_MIN,
+            from_=from_,
+            to=to,
+        ):
+            break
+
+        # the next window is not even scheduled before it is needed
+        assert services.market_data.get_candles.call_count == 1
+
+    def test_waits_for_rate_limit_tokens(self, mocker, from_, to):
+        sleep = mocker.patch("tinkoff.invest.services.time.sleep")
+        services = mocker.Mock()
+        services.market_data.get_candles.side_effect = (
+            lambda *, from_, **_: _window_candles(from_)
+        )
+        scheduler = RateLimitScheduler(
+            {"MarketDataService/GetCandles": 2}, clock=lambda: 0.0
+        )
+
+        list(
+            Services.get_all_candles(
+                services,
+                figi="figi",
+                interval=CandleInterval.CANDLE_INTERVAL_1_MIN,
+                from_=from_,
+                to=to,
+                max_concurrency=4,
+                rate_limit_scheduler=scheduler,
+            )
+        )
+
+        delays = sorted(call.args[0] for call in sleep.call_args_list)
+        assert len(delays) == services.market_data.get_candles.call_count
+        assert delays[:4] == [0.0, 0.0, 30.0, 60.0]
+
+    async def test_async_waits_for_rate_limit_tokens(self, mocker, from_, to):
+        sleep = mocker.patch(
+            "tinkoff.invest.async_services.asyncio.sleep", mocker.AsyncMock()
+        )
+        services = mocker.Mock()
+        services.market_data.get_candles = mocker.AsyncMock(
+            side_effect=lambda *, from_, **_: _window_candles(from_)
+        )
+        scheduler = RateLimitScheduler(
+            {"MarketDataService/GetCandles": 2}, clock=lambda: 0.0
+        )
+
+        async for _ in AsyncServices.get_all_candles(
+            services,
+            figi="figi",
+            interval=CandleInterval.CANDLE_INTERVAL_1_MIN,
+            from_=from_,
+            to=to,
+            max_concurrency=4,
+            rate_limit_scheduler=scheduler,
+        ):
+            pass
+
+        delays = [call.args[0] for call in sleep.await_args_list]
+        assert len(delays) == services.market_data.get_candles.call_count
+        assert delays[:4] == [0.0, 0.0, 30.0, 60.0]
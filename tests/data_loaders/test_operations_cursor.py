@@ -0,0 +1,136 @@
+# pylint:disable=redefined-outer-name
+import asyncio
+import threading
+
+import pytest
+
+from tinkoff.invest.async_services import AsyncServices
+from tinkoff.invest.data_loaders.operations_cursor import OperationsCursorCheckpoint
+from tinkoff.invest.schemas import (
+    GetOperationsByCursorRequest,
+    GetOperationsByCursorResponse,
+    OperationItem,
+)
+from tinkoff.invest.services import Services
+
+PAGES = {
+    "": (["1", "2"], "c1"),
+    "c1": (["3", "4"], "c2"),
+    "c2": (["5"], ""),
+}
+
+
+def get_page(request: GetOperationsByCursorRequest) -> GetOperationsByCursorResponse:
+    ids, next_cursor = PAGES[request.cursor]
+    return GetOperationsByCursorResponse(
+        has_next=bool(next_cursor),
+        next_cursor=next_cursor,
+        items=[OperationItem(id=id_, cursor=id_) for id_ in ids[: request.limit]],
+    )
+
+
+@pytest.fixture()
+def request_():
+    return GetOperationsByCursorRequest(account_id="account", limit=10)
+
+
+@pytest.fixture()
+def services(mocker):
+    services = Services(mocker.Mock(), token="token")
+    services.operations = mocker.Mock()
+    services.operations.get_operations_by_cursor.side_effect = get_page
+    return services
+
+
+@pytest.fixture()
+def async_services(mocker):
+    services = AsyncServices(mocker.Mock(), token="token")
+    services.operations = mocker.Mock()
+    services.operations.get_operations_by_cursor = mocker.AsyncMock(
+        side_effect=get_page
+    )
+    return services
+
+
+def requested_cursors(operations):
+    return [
+        call.args[0].cursor
+        for call in operations.get_operations_by_cursor.call_args_list
+    ]
+
+
+class TestGetAllOperationsByCursor:
+    @pytest.mark.parametrize("prefetch", [True, False])
+    def test_walks_all_pages(self, services, request_, prefetch):
+        items = services.get_all_operations_by_cursor(request_, prefetch=prefetch)
+
+        assert [item.id for item in items] == ["1", "2", "3", "4", "5"]
+        assert requested_cursors(services.operations) == ["", "c1", "c2"]
+
+    def test_prefetches_next_page(self, services, request_):
+        requested = threading.Event()
+
+        def get_page_and_notify(request):
+            if request.cursor == "c1":
+                requested.set()
+            return get_page(request)
+
+        services.operations.get_operations_by_cursor.side_effect = get_page_and_notify
+        items = services.get_all_operations_by_cursor(request_)
+
+        assert next(items).id == "1"
+        assert requested.wait(timeout=5)
+        items.close()
+
+    def test_overrides_limit_with_page_size(self, services, request_):
+        items = list(services.get_all_operations_by_cursor(request_, page_size=1))
+
+        assert [item.id for item in items] == ["1", "3", "5"]
+        assert request_.limit == 10
+
+    def test_resumes_from_checkpoint(self, services, request_):
+        checkpoint = OperationsCursorCheckpoint()
+        items = services.get_all_operations_by_cursor(
+            request_, checkpoint=checkpoint, prefetch=False
+        )
+        consumed = [next(items).id for _ in range(3)]
+        items.close()
+        assert checkpoint == OperationsCursorCheckpoint(cursor="c1", has_next=True)
+
+        resumed = services.get_all_operations_by_cursor(request_, checkpoint=checkpoint)
+
+        assert consumed + [item.id for item in resumed] == [
+            "1",
+            "2",
+            "3",
+            "3",
+            "4",
+            "5",
+        ]
+        assert checkpoint == OperationsCursorCheckpoint(cursor="", has_next=False)
+        assert not list(
+            services.get_all_operations_by_cursor(request_, checkpoint=checkpoint)
+        )
+
+    async def test_async_walks_all_pages(self, async_services, request_):
+        checkpoint = OperationsCursorCheckpoint()
+
+        items = [
+            item
+            async for item in async_services.get_all_operations_by_cursor(
+                request_, page_size=1, checkpoint=checkpoint
+            )
+        ]
+
+        assert [item.id for item in items] == ["1", "3", "5"]
+        assert requested_cursors(async_services.operations) == ["", "c1", "c2"]
+        assert not checkpoint.has_next
+
+    async def test_async_cancels_prefetch_on_close(self, async_services, request_):
+        items = async_services.get_all_operations_by_cursor(request_)
+
+        assert (await items.asend(None)).id == "1"
+        await items.aclose()
+        await asyncio.sleep(0)
+
+        assert requested_cursors(async_services.operations) == ["", "c1"]
@@ -0,0 +1,187 @@
+import asyncio
+import threading
+from datetime import timedelta
+
+import pytest
+
+from tinkoff.invest import ResponseFormat
+from tinkoff.invest.batching.async_market_data_batcher import AsyncMarketDataBatcher
+from tinkoff.invest.batching.batching_settings import BatchingSettings
+from tinkoff.invest.batching.market_data_batcher import MarketDataBatcher
+from tinkoff.invest.schemas import (
+    GetLastPricesResponse,
+    GetTradingStatusesResponse,
+    GetTradingStatusResponse,
+    LastPrice,
+    Quotation,
+    SecurityTradingStatus,
+)
+from tinkoff.invest.utils import now
+
+NORMAL_TRADING = SecurityTradingStatus.SECURITY_TRADING_STATUS_NORMAL_TRADING
+
+
+def last_prices_response(*, instrument_id):
+    return GetLastPricesResponse(
+        last_prices=[
+            LastPrice(
+                figi=f"figi-{uid}",
+                price=Quotation(units=100, nano=0),
+                time=now(),
+                instrument_uid=uid,
+            )
+            for uid in instrument_id
+            if uid != "unknown"
+        ]
+    )
+
+
+def trading_statuses_response(*, instrument_ids):
+    return GetTradingStatusesResponse(
+        trading_statuses=[
+            GetTradingStatusResponse(
+                figi=f"figi-{uid}",
+                trading_status=NORMAL_TRADING,
+                limit_order_available_flag=True,
+                market_order_available_flag=True,
+                api_trade_available_flag=True,
+                instrument_uid=uid,
+            )
+            for uid in instrument_ids
+        ]
+    )
+
+
+@pytest.fixture()
+def settings():
+    return BatchingSettings(window=timedelta(milliseconds=50), max_batch_size=3)
+
+
+class TestMarketDataBatcher:
+    def test_batches_requests_within_window(self, mocker, settings):
+        market_data = mocker.Mock()
+        market_data.get_last_prices.side_effect = last_prices_response
+
+        with MarketDataBatcher(market_data, settings) as batcher:
+            futures = [batcher.get_last_price(uid) for uid in ("a", "b", "a")]
+            prices = [future.result(timeout=5) for future in futures]
+
+        market_data.get_last_prices.assert_called_once_with(instrument_id=["a", "b"])
+        assert [price.instrument_uid for price in prices] == ["a", "b", "a"]
+
+    def test_sends_full_batch_at_once(self, mocker, settings):
+        market_data = mocker.Mock()
+        market_data.get_trading_statuses.side_effect = trading_statuses_response
+        settings.window = timedelta(hours=1)
+
+        with MarketDataBatcher(market_data, settings) as batcher:
+            futures = [batcher.get_trading_status(uid) for uid in ("a", "b", "c")]
+            statuses = [future.result(timeout=5) for future in futures]
+            late = batcher.get_trading_status("figi-d")
+
+        assert [status.figi for status in statuses] == ["figi-a", "figi-b", "figi-c"]
+        assert late.result(timeout=5).instrument_uid == "figi-d"
+        assert market_data.get_trading_statuses.call_count == 2
+
+    def test_fails_missing_instruments_and_errors(self, mocker, settings):
+        market_data = mocker.Mock()
+        market_data.get_last_prices.side_effect = last_prices_response
+        market_data.get_trading_statuses.side_effect = ValueError
+
+        with MarketDataBatcher(market_data, settings) as batcher:
+            missing = batcher.get_last_price("unknown")
+            failed = batcher.get_trading_status("a")
+
+        with pytest.raises(KeyError):
+            missing.result(timeout=5)
+        with pytest.raises(ValueError):
+            failed.result(timeout=5)
+
+    def test_does_not_start_thread_per_window(self, mocker, settings):
+        market_data = mocker.Mock()
+        market_data.get_last_prices.side_effect = last_prices_response
+
+        with MarketDataBatcher(market_data, settings) as batcher:
+            batcher.get_last_price("a").result(timeout=5)
+            start = mocker.spy(threading.Thread, "start")
+            for uid in "bcde":
+                batcher.get_last_price(uid).result(timeout=5)
+
+        start.assert_not_called()
+        assert market_data.get_last_prices.call_count == 5
+
+    def test_raises_after_close(self, mocker, settings):
+        batcher = MarketDataBatcher(mocker.Mock(), settings)
+        batcher.close()
+
+        with pytest.raises(RuntimeError):
+            batcher.get_last_price("a")
+
+
+class TestAsyncMarketDataBatcher:
+    async def test_batches_requests_within_window(self, mocker, settings):
+        market_data = mocker.Mock()
+        market_data.get_last_prices = mocker.AsyncMock(side_effect=last_prices_response)
+
+        async with AsyncMarketDataBatcher(market_data, settings) as batcher:
+            first = batcher.get_last_price("a")
+            second = batcher.get_last_price("figi-b")
+
+            assert (await first).instrument_uid == "a"
+            assert (await second).instrument_uid == "figi-b"
+
+        market_data.get_last_prices.assert_awaited_once_with(
+            instrument_id=["a", "figi-b"]
+        )
+
+    async def test_sends_full_batch_at_once(self, mocker, settings):
+        market_data = mocker.Mock()
+        market_data.get_trading_statuses = mocker.AsyncMock(
+            side_effect=trading_statuses_response
+        )
+        settings.window = timedelta(hours=1)
+
+        async with AsyncMarketDataBatcher(market_data, settings) as batcher:
+            futures = [batcher.get_trading_status(uid) for uid in "abcd"]
+            statuses = [await future for future in futures[:3]]
+
+        assert [status.instrument_uid for status in statuses] == ["a", "b", "c"]
+        assert (await futures[3]).instrument_uid == "d"
+        assert market_data.get_trading_statuses.await_count == 2
+
+    async def test_raises_for_missing_instruments(self, mocker, settings):
+        market_data = mocker.Mock()
+        market_data.get_last_prices = mocker.AsyncMock(side_effect=last_prices_response)
+
+        async with AsyncMarketDataBatcher(market_data, settings) as batcher:
+            with pytest.raises(KeyError):
+                await batcher.get_last_price("unknown")
+
+    async def test_raises_after_close(self, mocker, settings):
+        batcher = AsyncMarketDataBatcher(mocker.Mock(), settings)
+        await batcher.close()
+
+        with pytest.raises(RuntimeError):
+            batcher.get_last_price("a")
+
+    def test_creates_semaphore_on_loop_of_first_batch(self, mocker, settings):
+        market_data = mocker.Mock()
+        market_data.get_last_prices = mocker.AsyncMock(side_effect=last_prices_response)
+        semaphore = mocker.spy(asyncio, "Semaphore")
+        batcher = AsyncMarketDataBatcher(market_data, settings)
+        semaphore.assert_not_called()
+
+        async def get_last_price():
+            async with batcher:
+                return await batcher.get_last_price("a")
+
+        assert asyncio.run(get_last_price()).instrument_uid == "a"
+        semaphore.assert_called_once_with(settings.max_concurrent_batches)
+
+
+@pytest.mark.parametrize("batcher_type", [MarketDataBatcher, AsyncMarketDataBatcher])
+def test_rejects_bytes_response_format(mocker, batcher_type):
+    market_data = mocker.Mock(response_format=ResponseFormat.BYTES)
+
+    with pytest.raises(ValueError, match="Batcher .* got BYTES"):
+        batcher_type(market_data)
@@ -0,0 +1,89 @@
+import pytest
+
+from tinkoff.invest.channels import (
+    USE_LOCAL_SUBCHANNEL_POOL_OPTION,
+    AsyncChannelPool,
+    ChannelPool,
+    ChannelSelection,
+    create_channel_pool,
+)
+
+METHOD = "/tinkoff.public.invest.api.contract.v1.MarketDataService/GetLastPrices"
+
+
+@pytest.fixture()
+def create_channel(mocker):
+    return mocker.patch(
+        "tinkoff.invest.channels.create_channel",
+        side_effect=lambda **_: mocker.Mock(),
+    )
+
+
+def unary_callables(pool):
+    # pylint:disable=protected-access
+    return [channel.unary_unary.return_value for channel in pool._unary_channels]
+
+
+class TestChannelPool:
+    def test_creates_separate_connections(self, create_channel):
+        pool = create_channel_pool(size=3, options=[("grpc.primary_user_agent", "")])
+
+        assert isinstance(pool, ChannelPool)
+        assert create_channel.call_count == 4
+        options = create_channel.call_args.kwargs["options"]
+        assert (USE_LOCAL_SUBCHANNEL_POOL_OPTION, 1) in options
+
+    @pytest.mark.usefixtures("create_channel")
+    def test_selects_round_robin(self):
+        pool = create_channel_pool(size=2)
+        callables = unary_callables(pool)
+
+        multi_callable = pool.unary_unary(METHOD)
+        for _ in range(3):
+            multi_callable.with_call(b"request")
+
+        assert [c.with_call.call_count for c in callables] == [2, 1]
+
+    @pytest.mark.usefixtures("create_channel")
+    def test_selects_least_outstanding(self):
+        pool = create_channel_pool(size=2, selection=ChannelSelection.LEAST_OUTSTANDING)
+        callables = unary_callables(pool)
+        multi_callable = pool.unary_unary(METHOD)
+
+        # the first call is still running
+        multi_callable.future(b"request")
+        multi_callable.with_call(b"request")
+        multi_callable.with_call(b"request")
+
+        assert callables[0].future.call_count == 1
+        assert callables[0].with_call.call_count == 0
+        assert callables[1].with_call.call_count == 2
+
+    @pytest.mark.usefixtures("create_channel")
+    def test_pins_streams_to_dedicated_channel(self):
+        pool = create_channel_pool(size=2)
+
+        stream = pool.stream_stream(METHOD)
+
+        # pylint:disable=protected-access
+        assert stream is pool._stream_channel.stream_stream.return_value
+        for channel in pool._unary_channels:
+            channel.stream_stream.assert_not_called()
+
+
+class TestAsyncChannelPool:
+    @pytest.mark.usefixtures("create_channel")
+    def test_releases_channel_when_call_is_done(self):
+        pool = create_channel_pool(
+            size=2, force_async=True, selection=ChannelSelection.LEAST_OUTSTANDING
+        )
+        callables = unary_callables(pool)
+        multi_callable = pool.unary_unary(METHOD)
+
+        multi_callable(b"request")
+        done_callback = callables[0].return_value.add_done_callback.call_args.args[0]
+        done_callback(callables[0].return_value)
+        multi_callable(b"request")
+
+        assert isinstance(pool, AsyncChannelPool)
+        assert [c.call_count for c in callables] == [2, 0]
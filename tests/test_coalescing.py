@@ -0,0 +1,228 @@
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from tinkoff.invest import Client, ResponseFormat
+from tinkoff.invest.coalescing.aio.grpc_interceptor import (
+    AsyncCoalescingClientInterceptor,
+)
+from tinkoff.invest.coalescing.sync.grpc_interceptor import CoalescingClientInterceptor
+from tinkoff.invest.grpc import marketdata_pb2, orders_pb2
+
+SERVICE = "/tinkoff.public.invest.api.contract.v1.MarketDataService"
+GET_LAST_PRICES = f"{SERVICE}/GetLastPrices"
+POST_ORDER = "/tinkoff.public.invest.api.contract.v1.OrdersService/PostOrder"
+
+
+def last_prices_request(*figi):
+    return marketdata_pb2.GetLastPricesRequest(figi=figi)
+
+
+class TestCoalescingClientInterceptor:
+    def test_shares_call_between_identical_requests(self, mocker):
+        started = threading.Event()
+        release = threading.Event()
+
+        def continuation(client_call_details, request):
+            started.set()
+            release.wait(timeout=5)
+            return mocker.Mock(request=request)
+
+        continuation = mocker.Mock(side_effect=continuation)
+        details = mocker.Mock(method=GET_LAST_PRICES, metadata=[("x-app-name", "a")])
+        interceptor = CoalescingClientInterceptor()
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            leader = executor.submit(
+                interceptor.intercept_unary_unary,
+                continuation,
+                details,
+                last_prices_request("figi"),
+            )
+            started.wait(timeout=5)
+            followers = [
+                executor.submit(
+                    interceptor.intercept_unary_unary,
+                    continuation,
+                    details,
+                    last_prices_request("figi"),
+                )
+                for _ in range(3)
+            ]
+            release.set()
+            results = [leader.result()] + [future.result() for future in followers]
+
+        assert continuation.call_count == 1
+        assert all(result is results[0] for result in results)
+
+    def test_copies_response_for_each_joined_caller(self, mocker):
+        started = threading.Event()
+        release = threading.Event()
+        response = marketdata_pb2.GetLastPricesResponse(
+            last_prices=[marketdata_pb2.LastPrice(figi="figi")]
+        )
+
+        def continuation(_client_call_details, _request):
+            started.set()
+            release.wait(timeout=5)
+            return mocker.Mock(**{"result.return_value": response})
+
+        details = mocker.Mock(method=GET_LAST_PRICES, metadata=None)
+        interceptor = CoalescingClientInterceptor(copy_responses=True)
+
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            calls = [
+                executor.submit(
+                    interceptor.intercept_unary_unary,
+                    continuation,
+                    details,
+                    last_prices_request("figi"),
+                )
+            ]
+            started.wait(timeout=5)
+            calls.extend(
+                executor.submit(
+                    interceptor.intercept_unary_unary,
+                    continuation,
+                    details,
+                    last_prices_request("figi"),
+                )
+                for _ in range(2)
+            )
+            release.set()
+            responses = [future.result().result() for future in calls]
+
+        responses[1].last_prices[0].figi = "changed"
+        assert responses[0] is response
+        assert responses[1] is not responses[2]
+        assert [r.last_prices[0].figi for r in responses] == ["figi", "changed", "figi"]
+
+    def test_calls_again_after_completion(self, mocker):
+        continuation = mocker.Mock()
+        details = mocker.Mock(method=GET_LAST_PRICES, metadata=None)
+        interceptor = CoalescingClientInterceptor()
+
+        interceptor.intercept_unary_unary(
+            continuation, details, last_prices_request("figi")
+        )
+        interceptor.intercept_unary_unary(
+            continuation, details, last_prices_request("figi")
+        )
+
+        assert continuation.call_count == 2
+
+    def test_raises_error_of_call(self, mocker):
+        continuation = mocker.Mock(side_effect=ValueError)
+        details = mocker.Mock(method=GET_LAST_PRICES, metadata=None)
+
+        with pytest.raises(ValueError):
+            CoalescingClientInterceptor().intercept_unary_unary(
+                continuation, details, last_prices_request("figi")
+            )
+
+
+class TestAsyncCoalescingClientInterceptor:
+    @pytest.fixture()
+    def continuation(self, mocker):
+        async def continuation(client_call_details, request):
+            async def response():
+                await asyncio.sleep(0.01)
+                return request.figi
+
+            return asyncio.ensure_future(response())
+
+        return mocker.AsyncMock(side_effect=continuation)
+
+    async def test_shares_call_between_identical_requests(self, mocker, continuation):
+        details = mocker.Mock(method=GET_LAST_PRICES.encode(), metadata=None)
+        interceptor = AsyncCoalescingClientInterceptor()
+
+        calls = await asyncio.gather(
+            *[
+                interceptor.intercept_unary_unary(
+                    continuation, details, last_prices_request(figi)
+                )
+                for figi in ["a", "a", "b", "a"]
+            ]
+        )
+
+        assert continuation.await_count == 2
+        assert calls[0] is calls[1] is calls[3]
+        assert [await call for call in calls] == [["a"], ["a"], ["b"], ["a"]]
+
+    async def test_does_not_share_non_idempotent_calls(self, mocker, continuation):
+        details = mocker.Mock(method=POST_ORDER.encode(), metadata=None)
+        interceptor = AsyncCoalescingClientInterceptor()
+        request = orders_pb2.PostOrderRequest(figi="figi", order_id="1")
+
+        await asyncio.gather(
+            *[
+                interceptor.intercept_unary_unary(continuation, details, request)
+                for _ in range(2)
+            ]
+        )
+
+        assert continuation.await_count == 2
+
+    async def test_shares_only_given_methods(self, mocker, continuation):
+        details = mocker.Mock(method=GET_LAST_PRICES.encode(), metadata=None)
+        interceptor = AsyncCoalescingClientInterceptor(methods=["GetOrderBook"])
+
+        await asyncio.gather(
+            *[
+                interceptor.intercept_unary_unary(
+                    continuation, details, last_prices_request("a")
+                )
+                for _ in range(2)
+            ]
+        )
+
+        assert continuation.await_count == 2
+
+    async def test_copies_response_for_each_joined_caller(self, mocker):
+        response = marketdata_pb2.GetLastPricesResponse(
+            last_prices=[marketdata_pb2.LastPrice(figi="figi")]
+        )
+
+        async def continuation(_client_call_details, _request):
+            async def get_response():
+                await asyncio.sleep(0.01)
+                return response
+
+            return asyncio.ensure_future(get_response())
+
+        details = mocker.Mock(method=GET_LAST_PRICES.encode(), metadata=None)
+        interceptor = AsyncCoalescingClientInterceptor(copy_responses=True)
+
+        calls = await asyncio.gather(
+            *[
+                interceptor.intercept_unary_unary(
+                    continuation, details, last_prices_request("figi")
+                )
+                for _ in range(3)
+            ]
+        )
+        responses = [await call for call in calls]
+
+        responses[1].last_prices[0].figi = "changed"
+        assert responses[0] is response
+        assert responses[1] is not responses[2]
+        assert [r.last_prices[0].figi for r in responses] == ["figi", "changed", "figi"]
+
+
+@pytest.mark.parametrize(
+    ("response_format", "copy_responses"),
+    [(ResponseFormat.PROTOBUF, True), (ResponseFormat.DATACLASS, False)],
+)
+def test_client_copies_coalesced_protobuf_responses(
+    mocker, response_format, copy_responses
+):
+    interceptor = mocker.patch(
+        "tinkoff.invest.clients.CoalescingClientInterceptor", autospec=True
+    )
+
+    Client("token", response_format=response_format, coalesce_requests=True)
+
+    interceptor.assert_called_once_with(copy_responses=copy_responses)
@@ -0,0 +1,121 @@
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+import pytest
+
+from tinkoff.invest import CandleInterval
+from tinkoff.invest.async_services import AsyncServices
+from tinkoff.invest.columnar import (
+    HistoricCandleColumns,
+    candles_to_columns,
+    concatenate_candle_columns,
+)
+from tinkoff.invest.grpc import marketdata_pb2
+from tinkoff.invest.services import Services
+
+START = 1_600_000_000
+
+
+def make_candles(start: int, size: int):
+    response = marketdata_pb2.GetCandlesResponse()
+    for i in range(size):
+        candle = response.candles.add()
+        candle.open.units = 100
+        candle.open.nano = 250_000_000
+        candle.high.units = 101
+        candle.low.units = -1
+        candle.low.nano = -500_000_000
+        candle.close.units = 100 + i
+        candle.volume = 10 + i
+        candle.time.seconds = start + i * 60
+        candle.time.nanos = 5
+        candle.is_complete = i < size - 1
+    return response.candles
+
+
+def test_decodes_columns():
+    actual = candles_to_columns(make_candles(START, 3))
+
+    assert len(actual) == 3
+    assert actual.time.dtype == np.int64
+    assert actual.time.tolist() == [
+        START * 10**9 + 5,
+        (START + 60) * 10**9 + 5,
+        (START + 120) * 10**9 + 5,
+    ]
+    assert actual.open.tolist() == [100_250_000_000] * 3
+    assert actual.low.tolist() == [-1_500_000_000] * 3
+    assert actual.close.tolist() == [100 * 10**9, 101 * 10**9, 102 * 10**9]
+    assert actual.volume.tolist() == [10, 11, 12]
+    assert actual.is_complete.tolist() == [True, True, False]
+
+
+def test_decodes_float_prices():
+    actual = candles_to_columns(make_candles(START, 2), as_float=True)
+
+    assert actual.open.dtype == np.float64
+    assert actual.open.tolist() == [100.25, 100.25]
+    assert actual.low.tolist() == [-1.5, -1.5]
+
+
+def test_concatenates_without_repeated_candles():
+    parts = [
+        candles_to_columns(make_candles(START, 3)),
+        candles_to_columns(make_candles(START + 120, 2)),
+        candles_to_columns(make_candles(START + 240, 0)),
+    ]
+
+    actual = concatenate_candle_columns(parts)
+
+    assert np.all(np.diff(actual.time) == 60 * 10**9)
+    assert len(actual) == 4
+
+
+def test_concatenates_nothing():
+    actual = concatenate_candle_columns([], as_float=True)
+
+    assert len(actual) == 0
+    assert actual.close.dtype == np.float64
+
+
+@pytest.fixture()
+def intervals():
+    from_ = datetime.fromtimestamp(START, tz=timezone.utc)
+    return from_, from_ + timedelta(days=2)
+
+
+def test_gets_all_candles_columns(mocker, intervals):
+    services = mocker.create_autospec(Services)
+    services.market_data = mocker.Mock()
+    services.market_data.get_candles_columns.side_effect = [
+        candles_to_columns(make_candles(START, 3)),
+        candles_to_columns(make_candles(START + 120, 3)),
+    ]
+    from_, to = intervals
+
+    actual = Services.get_all_candles_columns(
+        services, from_=from_, to=to, interval=CandleInterval.CANDLE_INTERVAL_1_MIN
+    )
+
+    assert isinstance(actual, HistoricCandleColumns)
+    assert len(actual) == 5
+    assert services.market_data.get_candles_columns.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_gets_all_candles_columns_async(mocker, intervals):
+    services = mocker.create_autospec(AsyncServices)
+    services.market_data = mocker.Mock()
+    services.market_data.get_candles_columns = mocker.AsyncMock(
+        side_effect=[
+            candles_to_columns(make_candles(START, 3)),
+            candles_to_columns(make_candles(START + 120, 3)),
+        ]
+    )
+    from_, to = intervals
+
+    actual = await AsyncServices.get_all_candles_columns(
+        services, from_=from_, to=to, interval=CandleInterval.CANDLE_INTERVAL_1_MIN
+    )
+
+    assert len(actual) == 5
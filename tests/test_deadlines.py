@@ -0,0 +1,65 @@
+import pytest
+
+from tinkoff.invest.deadlines.aio.grpc_interceptor import AsyncDeadlineClientInterceptor
+from tinkoff.invest.deadlines.settings import DeadlineSettings
+from tinkoff.invest.deadlines.sync.grpc_interceptor import DeadlineClientInterceptor
+
+SERVICE = "/tinkoff.public.invest.api.contract.v1.MarketDataService"
+GET_CANDLES = f"{SERVICE}/GetCandles"
+GET_LAST_PRICES = f"{SERVICE}/GetLastPrices"
+GET_ACCOUNTS = "/tinkoff.public.invest.api.contract.v1.UsersService/GetAccounts"
+
+SETTINGS = DeadlineSettings(
+    default=30.0,
+    methods={"MarketDataService": 5.0, "MarketDataService/GetCandles": 10.0},
+)
+
+
+@pytest.mark.parametrize(
+    ("method", "expected"),
+    [(GET_CANDLES, 10.0), (GET_LAST_PRICES.encode(), 5.0), (GET_ACCOUNTS, 30.0)],
+)
+def test_gets_timeout_of_method(method, expected):
+    assert SETTINGS.get_timeout(method) == expected
+
+
+def test_gets_no_timeout_by_default():
+    assert DeadlineSettings().get_timeout(GET_CANDLES) is None
+
+
+class TestDeadlineClientInterceptor:
+    def test_sets_timeout_of_method(self, mocker):
+        continuation = mocker.Mock()
+        details = mocker.Mock(method=GET_CANDLES, timeout=None)
+
+        DeadlineClientInterceptor(SETTINGS).intercept_unary_unary(
+            continuation, details, "request"
+        )
+
+        (new_details, request), _ = continuation.call_args
+        assert new_details.timeout == 10.0
+        assert new_details.method == GET_CANDLES
+        assert new_details.metadata is details.metadata
+        assert request == "request"
+
+    def test_keeps_timeout_of_call(self, mocker):
+        continuation = mocker.Mock()
+        details = mocker.Mock(method=GET_CANDLES, timeout=1.0)
+
+        DeadlineClientInterceptor(SETTINGS).intercept_unary_unary(
+            continuation, details, "request"
+        )
+
+        continuation.assert_called_once_with(details, "request")
+
+    async def test_aio_sets_timeout_of_method(self, mocker):
+        continuation = mocker.AsyncMock()
+        details = mocker.Mock(method=GET_LAST_PRICES.encode(), timeout=None)
+
+        await AsyncDeadlineClientInterceptor(SETTINGS).intercept_unary_unary(
+            continuation, details, "request"
+        )
+
+        (new_details, _), _ = continuation.await_args
+        assert new_details.timeout == 5.0
+        assert new_details.method == GET_LAST_PRICES.encode()
@@ -0,0 +1,131 @@
+from decimal import Decimal
+
+import pytest
+
+from tinkoff.invest import FixedPoint, MoneyValue, Quotation
+from tinkoff.invest.utils import (
+    fixed_point_to_money,
+    fixed_point_to_quotation,
+    money_to_fixed_point,
+    quotation_to_decimal,
+    quotation_to_fixed_point,
+)
+
+
+@pytest.mark.parametrize(
+    ("quotation", "decimal"),
+    [
+        (Quotation(units=114, nano=250000000), Decimal("114.25")),
+        (Quotation(units=-200, nano=-200000000), Decimal("-200.20")),
+        (Quotation(units=-0, nano=-10000000), Decimal("-0.01")),
+    ],
+)
+def test_converts_quotation(quotation: Quotation, decimal: Decimal):
+    value = quotation_to_fixed_point(quotation)
+
+    assert value.to_decimal() == decimal
+    assert value == FixedPoint.from_decimal(decimal)
+    assert float(value) == float(decimal)
+    assert quotation_to_decimal(fixed_point_to_quotation(value)) == decimal
+
+
+def test_converts_money_keeping_sign_convention():
+    money = MoneyValue(currency="rub", units=-0, nano=-10000000)
+
+    value = money_to_fixed_point(money)
+
+    assert (value.units, value.nano) == (0, -10000000)
+    actual = fixed_point_to_money(value, "rub")
+    assert (actual.currency, actual.units, actual.nano) == ("rub", 0, -10000000)
+
+
+@pytest.mark.parametrize(
+    ("left", "right"),
+    [
+        (Decimal("114.25"), Decimal("0.000000001")),
+        (Decimal("-200.2"), Decimal("3.5")),
+        (Decimal("-0.01"), Decimal("-0.01")),
+    ],
+)
+def test_arithmetic_matches_decimal(left: Decimal, right: Decimal):
+    fixed_left = FixedPoint.from_decimal(left)
+    fixed_right = FixedPoint.from_decimal(right)
+
+    assert (fixed_left + fixed_right).to_decimal() == left + right
+    assert (fixed_left - fixed_right).to_decimal() == left - right
+    assert (fixed_left * 7).to_decimal() == left * 7
+    assert (fixed_left * fixed_right).to_decimal() == FixedPoint.from_decimal(
+        left * right
+    ).to_decimal()
+    assert (fixed_left < fixed_right) == (left < right)
+    assert (fixed_left >= fixed_right) == (left >= right)
+    assert abs(-fixed_left).to_decimal() == abs(left)
+
+
+def test_adds_quotation():
+    value = FixedPoint.from_units(1, 500000000)
+
+    actual = value + Quotation(units=2, nano=600000000)
+
+    assert actual == FixedPoint.from_units(4, 100000000)
+    assert Quotation(units=2, nano=600000000) - value == Quotation(
+        units=1, nano=100000000
+    )
+
+
+@pytest.mark.parametrize(
+    "money",
+    [
+        Quotation(units=2, nano=600000000),
+        MoneyValue(currency="rub", units=2, nano=600000000),
+    ],
+)
+def test_mixed_arithmetic_returns_fixed_point(money):
+    value = FixedPoint.from_units(1, 500000000)
+
+    assert isinstance(money + value, FixedPoint)
+    assert isinstance(value + money, FixedPoint)
+    assert money + value == value + money == FixedPoint.from_units(4, 100000000)
+    assert money - value == FixedPoint.from_units(1, 100000000)
+    assert value - money == FixedPoint.from_units(-1, -100000000)
+
+
+@pytest.mark.parametrize(
+    "money",
+    [
+        Quotation(units=-200, nano=-200000000),
+        MoneyValue(currency="rub", units=-200, nano=-200000000),
+    ],
+)
+def test_compares_with_money(money):
+    value = FixedPoint.from_decimal(Decimal("-200.2"))
+    greater = FixedPoint.from_decimal(Decimal("-200.1"))
+
+    assert value == money
+    assert money == value
+    assert value != greater
+    assert money != greater
+    assert greater > money
+    assert money < greater
+    assert money <= value <= money
+    assert greater >= money
+    assert not value < money
+
+
+def test_hashes_as_equal_quotation():
+    quotation = Quotation(units=-200, nano=-200000000)
+
+    assert hash(FixedPoint.from_quotation(quotation)) == hash(quotation)
+
+
+def test_sums_values():
+    values = [FixedPoint.from_units(1, 500000000), FixedPoint(1)]
+
+    assert sum(values) == FixedPoint.from_units(1, 500000001)
+    assert sum([FixedPoint(1), Quotation(units=1, nano=0)]) == FixedPoint(1000000001)
+    assert sum([]) == 0
+
+
+def test_divides_toward_zero():
+    assert FixedPoint(-10) / 3 == FixedPoint(-3)
+    assert FixedPoint.from_units(1) / FixedPoint.from_units(3) == FixedPoint(333333333)
@@ -0,0 +1,385 @@
+# pylint:disable=protected-access,no-name-in-module
+import copy
+import pickle  # nosec
+from datetime import datetime, timezone
+
+import numpy as np
+import pytest
+from google.protobuf.timestamp_pb2 import Timestamp
+
+from tinkoff.invest import _grpc_helpers
+from tinkoff.invest.grpc import (
+    instruments_pb2,
+    marketdata_pb2,
+    operations_pb2,
+    orders_pb2,
+)
+from tinkoff.invest.schemas import (
+    CandleInterval,
+    GetCandlesRequest,
+    GetCandlesResponse,
+    GetClosePricesRequest,
+    GetLastPricesResponse,
+    GetOperationsByCursorRequest,
+    HistoricCandle,
+    InstrumentClosePriceRequest,
+    LastPrice,
+    MarketDataResponse,
+    OperationType,
+    OrderDirection,
+    OrderType,
+    PostOrderRequest,
+    Quotation,
+    Share,
+)
+
+
+@pytest.fixture()
+def candles_response():
+    response = marketdata_pb2.GetCandlesResponse()
+    for i in range(3):
+        candle = response.candles.add()
+        candle.open.units = -200
+        candle.open.nano = -200000000
+        candle.close.units = i
+        candle.volume = i
+        candle.time.seconds = 1_600_000_000 + i * 60
+        candle.time.nanos = 1000
+        candle.is_complete = bool(i % 2)
+    return response
+
+
+@pytest.fixture()
+def market_data_response():
+    response = marketdata_pb2.MarketDataResponse()
+    response.orderbook.figi = "figi"
+    response.orderbook.depth = 2
+    response.orderbook.bids.add(quantity=1).price.units = 10
+    response.orderbook.asks.add(quantity=2).price.units = 11
+    return response
+
+
+class TestSlottedDataclass:
+    def test_has_no_instance_dict(self):
+        quotation = Quotation(units=1, nano=2)
+
+        with pytest.raises(AttributeError):
+            quotation.unknown = 1  # pylint:disable=assigning-non-slot
+        assert not hasattr(quotation, "__dict__")
+
+    def test_pickles_frozen(self):
+        candle = HistoricCandle(
+            open=Quotation(units=1, nano=0),
+            high=Quotation(units=2, nano=0),
+            low=Quotation(units=0, nano=0),
+            close=Quotation(units=1, nano=500),
+            volume=10,
+            time=datetime(2020, 9, 13, tzinfo=timezone.utc),
+            is_complete=True,
+        )
+
+        assert pickle.loads(pickle.dumps(candle)) == candle  # noqa:S301 # nosec
+        assert copy.deepcopy(candle) == candle
+
+
+class TestTimestamps:
+    @pytest.mark.parametrize(
+        ("seconds", "nanos", "expected"),
+        [
+            (
+                1_600_000_000,
+                123_456_789,
+                datetime(2020, 9, 13, 12, 26, 40, 123456, tzinfo=timezone.utc),
+            ),
+            (
+                -5,
+                999_999_999,
+                datetime(1969, 12, 31, 23, 59, 55, 999999, tzinfo=timezone.utc),
+            ),
+        ],
+    )
+    def test_converts_exactly(self, seconds, nanos, expected):
+        actual = _grpc_helpers.ts_to_datetime(Timestamp(seconds=seconds, nanos=nanos))
+
+        assert actual == expected
+        assert _grpc_helpers.datetime_to_ts(actual) == (seconds, nanos // 1000 * 1000)
+
+    def test_converts_naive_datetime_as_local(self):
+        value = datetime(2020, 9, 13, 12, 26, 40, 5)
+
+        actual = _grpc_helpers.datetime_to_ts(value)
+
+        assert actual == (int(value.timestamp()), 5000)
+
+    def test_converts_to_datetime64(self, candles_response):
+        actual = _grpc_helpers.ts_to_datetime64(
+            candle.time for candle in candles_response.candles
+        )
+
+        assert actual.dtype == np.dtype("datetime64[ns]")
+        assert actual.tolist() == [
+            1_600_000_000_000_001_000,
+            1_600_000_060_000_001_000,
+            1_600_000_120_000_001_000,
+        ]
+
+
+class TestCompiledDecoders:
+    def test_decodes_like_generic(self, candles_response):
+        expected = _grpc_helpers.protobuf_to_dataclass_generic(
+            candles_response, GetCandlesResponse
+        )
+
+        actual = _grpc_helpers.protobuf_to_dataclass(
+            candles_response, GetCandlesResponse
+        )
+
+        assert actual.candles == expected.candles
+        assert actual.candles[0].open == Quotation(units=-200, nano=-200000000)
+        assert actual.candles[1].time == datetime(
+            2020, 9, 13, 12, 27, 40, 1, tzinfo=timezone.utc
+        )
+
+    def test_decodes_oneof(self, market_data_response):
+        expected = _grpc_helpers.protobuf_to_dataclass_generic(
+            market_data_response, MarketDataResponse
+        )
+
+        actual = _grpc_helpers.protobuf_to_dataclass(
+            market_data_response, MarketDataResponse
+        )
+
+        assert repr(actual) == repr(expected)
+        assert actual.candle is None
+        assert actual.orderbook.bids[0].price == Quotation(units=10, nano=0)
+
+    def test_decodes_keyword_fields(self):
+        request = marketdata_pb2.GetCandlesRequest(figi="figi")
+        getattr(request, "from").seconds = 100
+
+        actual = _grpc_helpers.protobuf_to_dataclass(request, GetCandlesRequest)
+
+        assert actual.from_ == datetime(1970, 1, 1, 0, 1, 40, tzinfo=timezone.utc)
+
+    def test_decodes_repeated_enums(self):
+        request = operations_pb2.GetOperationsByCursorRequest(
+            operation_types=[OperationType.OPERATION_TYPE_BUY]
+        )
+
+        actual = _grpc_helpers.protobuf_to_dataclass(
+            request, GetOperationsByCursorRequest
+        )
+
+        assert actual.operation_types == [OperationType.OPERATION_TYPE_BUY]
+        assert isinstance(actual.operation_types[0], OperationType)
+
+    def test_compiles_once(self):
+        decoder = _grpc_helpers.get_decoder(GetCandlesResponse)
+
+        assert _grpc_helpers.get_decoder(GetCandlesResponse) is decoder
+
+
+class TestDecodingFastPaths:
+    @pytest.fixture()
+    def interning(self):
+        _grpc_helpers.set_string_interning(True)
+        yield
+        _grpc_helpers.set_string_interning(False)
+
+    def test_looks_up_enums(self):
+        table = _grpc_helpers.get_enum_table(OperationType)
+
+        assert table[OperationType.OPERATION_TYPE_BUY.value] is (
+            OperationType.OPERATION_TYPE_BUY
+        )
+        with pytest.raises(ValueError):
+            _ = table[-1]
+
+    @pytest.mark.usefixtures("interning")
+    def test_interns_identifiers(self):
+        figi = "".join(["BBG", "004730N88"])
+        first = marketdata_pb2.LastPrice(figi=figi)
+        second = marketdata_pb2.LastPrice(figi=figi)
+
+        first_price = _grpc_helpers.protobuf_to_dataclass(first, LastPrice)
+        second_price = _grpc_helpers.protobuf_to_dataclass(second, LastPrice)
+
+        assert first_price.figi is second_price.figi
+
+    def test_interns_identifiers_of_views_built_before(self):
+        def get_views():
+            return [
+                _grpc_helpers.protobuf_to_view(
+                    marketdata_pb2.GetLastPricesResponse(
+                        last_prices=[
+                            marketdata_pb2.LastPrice(figi="".join(["BBG", "004730N88"]))
+                        ]
+                    ),
+                    GetLastPricesResponse,
+                ),
+                _grpc_helpers.protobuf_to_view(
+                    instruments_pb2.Share(figi="".join(["BBG", "004730N88"])), Share
+                ),
+            ]
+
+        get_views()
+        _grpc_helpers.set_string_interning(True)
+        try:
+            first_prices, first_share = get_views()
+            second_prices, second_share = get_views()
+        finally:
+            _grpc_helpers.set_string_interning(False)
+
+        assert first_prices.last_prices[0].figi is second_prices.last_prices[0].figi
+        assert first_share.figi is second_share.figi
+
+    def test_keeps_strings_by_default(self):
+        first = marketdata_pb2.LastPrice(figi="".join(["BBG", "004730N88"]))
+        second = marketdata_pb2.LastPrice(figi="".join(["BBG", "004730N88"]))
+
+        first_price = _grpc_helpers.protobuf_to_dataclass(first, LastPrice)
+        second_price = _grpc_helpers.protobuf_to_dataclass(second, LastPrice)
+
+        assert first_price.figi == second_price.figi
+        assert first_price.figi is not second_price.figi
+
+
+class TestMessageViews:
+    def test_converts_fields_on_access(self, candles_response):
+        view = _grpc_helpers.protobuf_to_view(candles_response, GetCandlesResponse)
+
+        candle = view.candles[1]
+
+        assert "candles" in view.__dict__
+        assert "open" not in candle.__dict__
+        assert candle.open == Quotation(units=-200, nano=-200000000)
+        assert candle.time == datetime(2020, 9, 13, 12, 27, 40, 1, tzinfo=timezone.utc)
+        assert candle.open is candle.open
+        assert view.candles[1] is candle
+
+    def test_converts_to_dataclass(self, candles_response):
+        view = _grpc_helpers.protobuf_to_view(candles_response, GetCandlesResponse)
+
+        actual = view.to_dataclass()
+
+        assert isinstance(actual, GetCandlesResponse)
+        assert actual.candles == [candle.to_dataclass() for candle in view.candles]
+        assert _grpc_helpers.materialize(view.candles[0]) == actual.candles[0]
+
+    def test_reads_oneof(self, market_data_response):
+        view = _grpc_helpers.protobuf_to_view(market_data_response, MarketDataResponse)
+
+        assert view.candle is None
+        assert view.orderbook.figi == "figi"
+        assert view.orderbook.asks[0].price == Quotation(units=11, nano=0)
+
+    def test_is_read_only(self, candles_response):
+        view = _grpc_helpers.protobuf_to_view(candles_response, GetCandlesResponse)
+
+        with pytest.raises(AttributeError):
+            view.candles = []
+
+    def test_compares_by_message(self, candles_response):
+        view = _grpc_helpers.protobuf_to_view(candles_response, GetCandlesResponse)
+
+        candles = view.candles
+
+        assert candles[0] != candles[1]
+        assert candles[0] == _grpc_helpers.protobuf_to_view(
+            candles_response.candles[0], HistoricCandle
+        )
+        assert len({candles[0], candles[0], candles[1]}) == 2
+
+
+@pytest.fixture()
+def post_order_request():
+    return PostOrderRequest(
+        figi="figi",
+        quantity=1,
+        price=Quotation(units=10, nano=500000000),
+        direction=OrderDirection.ORDER_DIRECTION_SELL,
+        account_id="account_id",
+        order_type=OrderType.ORDER_TYPE_LIMIT,
+        order_id="order_id",
+    )
+
+
+class TestCompiledEncoders:
+    @pytest.mark.parametrize(
+        ("request_", "pb_type"),
+        [
+            (
+                GetCandlesRequest(
+                    figi="figi",
+                    from_=datetime(2022, 1, 1, 12, 0, 0, 500, tzinfo=timezone.utc),
+                    to=datetime(2022, 1, 2, tzinfo=timezone.utc),
+                    interval=CandleInterval.CANDLE_INTERVAL_HOUR,
+                ),
+                marketdata_pb2.GetCandlesRequest,
+            ),
+            (
+                GetClosePricesRequest(
+                    instruments=[
+                        InstrumentClosePriceRequest(instrument_id="1"),
+                        InstrumentClosePriceRequest(instrument_id="2"),
+                    ]
+                ),
+                marketdata_pb2.GetClosePricesRequest,
+            ),
+            (
+                GetOperationsByCursorRequest(
+                    account_id="account_id",
+                    operation_types=[OperationType.OPERATION_TYPE_BUY],
+                ),
+                operations_pb2.GetOperationsByCursorRequest,
+            ),
+        ],
+    )
+    def test_encodes_like_generic(self, request_, pb_type):
+        expected = _grpc_helpers.dataclass_to_protobuff_generic(request_, pb_type())
+
+        actual = _grpc_helpers.dataclass_to_protobuff(request_, pb_type())
+
+        assert actual == expected
+
+    def test_encodes_enum_values(self, post_order_request):
+        post_order_request.direction = 2
+
+        actual = _grpc_helpers.dataclass_to_protobuff(
+            post_order_request, orders_pb2.PostOrderRequest()
+        )
+
+        assert actual.direction == OrderDirection.ORDER_DIRECTION_SELL
+
+
+class TestRequestTemplate:
+    def test_encodes_changes(self, post_order_request):
+        template = _grpc_helpers.RequestTemplate(post_order_request)
+
+        actual = template.encode(
+            orders_pb2.PostOrderRequest,
+            quantity=5,
+            price=Quotation(units=11, nano=0),
+            order_id="other_order_id",
+        )
+
+        post_order_request.quantity = 5
+        post_order_request.price = Quotation(units=11, nano=0)
+        post_order_request.order_id = "other_order_id"
+        assert actual == _grpc_helpers.dataclass_to_protobuff(
+            post_order_request, orders_pb2.PostOrderRequest()
+        )
+
+    def test_keeps_prototype(self, post_order_request):
+        template = _grpc_helpers.RequestTemplate(post_order_request)
+        template.encode(orders_pb2.PostOrderRequest, quantity=5)
+
+        actual = template.encode(orders_pb2.PostOrderRequest)
+
+        assert actual.quantity == 1
+
+    def test_raises_on_unknown_field(self, post_order_request):
+        template = _grpc_helpers.RequestTemplate(post_order_request)
+
+        with pytest.raises(TypeError):
+            template.encode(orders_pb2.PostOrderRequest, unknown=1)
@@ -0,0 +1,175 @@
+import asyncio
+import threading
+import time
+
+import grpc
+import pytest
+
+from tinkoff.invest import Client
+from tinkoff.invest.hedging.aio.grpc_interceptor import AsyncHedgingClientInterceptor
+from tinkoff.invest.hedging.latency_tracker import LatencyTracker
+from tinkoff.invest.hedging.settings import HedgingSettings
+from tinkoff.invest.hedging.sync.grpc_interceptor import HedgingClientInterceptor
+
+SERVICE = "/tinkoff.public.invest.api.contract.v1.MarketDataService"
+GET_LAST_PRICES = f"{SERVICE}/GetLastPrices"
+GET_ACCOUNTS = "/tinkoff.public.invest.api.contract.v1.UsersService/GetAccounts"
+
+
+@pytest.fixture()
+def settings():
+    return HedgingSettings(initial_delay=0.05, min_samples=3)
+
+
+class TestLatencyTracker:
+    def test_waits_initial_delay_without_samples(self, settings):
+        tracker = LatencyTracker(settings)
+        tracker.record(GET_LAST_PRICES, 0.5)
+
+        assert tracker.get_delay(GET_LAST_PRICES) == 0.05
+
+    def test_waits_percentile_of_latencies(self, settings):
+        tracker = LatencyTracker(settings)
+        for latency in [0.1, 0.3, 0.2, 0.4]:
+            tracker.record(GET_LAST_PRICES.encode(), latency)
+
+        assert tracker.get_delay(GET_LAST_PRICES) == 0.4
+        settings.percentile = 50.0
+        assert tracker.get_delay(GET_LAST_PRICES) == 0.2
+
+    def test_hedges_only_given_methods(self, settings):
+        tracker = LatencyTracker(settings)
+
+        assert tracker.is_hedged(GET_LAST_PRICES)
+        assert not tracker.is_hedged(GET_ACCOUNTS)
+
+
+class TestHedgingClientInterceptor:
+    def test_takes_response_of_second_request(self, mocker, settings):
+        release = threading.Event()
+        fast_call = mocker.Mock(**{"exception.return_value": None})
+        slow_call = mocker.Mock(**{"exception.return_value": None})
+
+        def continuation(*_):
+            if continuation.call_count == 1:
+                release.wait(timeout=5)
+                return slow_call
+            return fast_call
+
+        continuation = mocker.Mock(side_effect=continuation)
+        details = mocker.Mock(method=GET_LAST_PRICES, timeout=None)
+        record = mocker.patch.object(LatencyTracker, "record")
+
+        call = HedgingClientInterceptor(settings).intercept_unary_unary(
+            continuation, details, "request"
+        )
+        release.set()
+
+        assert call is fast_call
+        assert continuation.call_count == 2
+        # the latency includes the delay before the second request
+        (_, latency), _ = record.call_args
+        assert latency >= settings.initial_delay
+
+    def test_calls_in_caller_thread_when_workers_are_busy(self, mocker, settings):
+        release = threading.Event()
+        threads = []
+
+        def continuation(*_):
+            threads.append(threading.current_thread())
+            if len(threads) == 1:
+                release.wait(timeout=5)
+            return mocker.Mock(**{"exception.return_value": None})
+
+        details = mocker.Mock(method=GET_LAST_PRICES, timeout=None)
+        interceptor = HedgingClientInterceptor(settings, max_workers=1)
+        busy = threading.Thread(
+            target=interceptor.intercept_unary_unary,
+            args=(continuation, details, "request"),
+        )
+        busy.start()
+        while not threads:
+            time.sleep(0.001)
+
+        interceptor.intercept_unary_unary(continuation, details, "request")
+        release.set()
+        busy.join(timeout=5)
+        interceptor.close()
+
+        assert threads[1:] == [threading.current_thread()]
+
+    def test_does_not_hedge_fast_calls(self, mocker, settings):
+        call = mocker.Mock(**{"exception.return_value": None})
+        continuation = mocker.Mock(return_value=call)
+        details = mocker.Mock(method=GET_LAST_PRICES, timeout=None)
+
+        result = HedgingClientInterceptor(settings).intercept_unary_unary(
+            continuation, details, "request"
+        )
+
+        assert result is call
+        continuation.assert_called_once_with(details, "request")
+
+    def test_returns_failed_call_if_no_request_succeeded(self, mocker, settings):
+        settings.initial_delay = 0
+        failed_call = mocker.Mock(**{"exception.return_value": grpc.RpcError()})
+        continuation = mocker.Mock(return_value=failed_call)
+        details = mocker.Mock(method=GET_LAST_PRICES, timeout=None)
+
+        result = HedgingClientInterceptor(settings).intercept_unary_unary(
+            continuation, details, "request"
+        )
+
+        assert result is failed_call
+
+    def test_does_not_hedge_other_methods(self, mocker, settings):
+        continuation = mocker.Mock()
+        details = mocker.Mock(method=GET_ACCOUNTS)
+
+        HedgingClientInterceptor(settings).intercept_unary_unary(
+            continuation, details, "request"
+        )
+
+        continuation.assert_called_once_with(details, "request")
+
+
+class TestAsyncHedgingClientInterceptor:
+    async def test_takes_response_of_second_request(self, mocker, settings):
+        slow_request = asyncio.Event()
+
+        async def continuation(*_):
+            if continuation.await_count == 1:
+                await asyncio.sleep(5)
+                slow_request.set()
+            return asyncio.ensure_future(asyncio.sleep(0, result="response"))
+
+        continuation = mocker.AsyncMock(side_effect=continuation)
+        details = mocker.Mock(
+            method=GET_LAST_PRICES.encode(),
+            timeout=1.0,
+            metadata=None,
+            credentials=None,
+            wait_for_ready=None,
+        )
+
+        record = mocker.patch.object(LatencyTracker, "record")
+
+        call = await AsyncHedgingClientInterceptor(settings).intercept_unary_unary(
+            continuation, details, "request"
+        )
+
+        assert await call == "response"
+        (_, latency), _ = record.call_args
+        assert latency >= settings.initial_delay
+        hedge_details, _ = continuation.await_args.args
+        assert hedge_details.timeout == pytest.approx(0.95)
+        assert not slow_request.is_set()
+
+
+def test_client_closes_hedging_interceptor(mocker):
+    close = mocker.patch.object(HedgingClientInterceptor, "close")
+
+    with Client("token", hedging=HedgingSettings()):
+        pass
+
+    close.assert_called_once_with()
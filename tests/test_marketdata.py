@@ -5,10 +5,20 @@ from unittest import mock
 import pytest
 from google.protobuf.json_format import MessageToDict
 
-from tinkoff.invest._grpc_helpers import dataclass_to_protobuff
+from tinkoff.invest._grpc_helpers import ResponseFormat, dataclass_to_protobuff
+from tinkoff.invest.async_services import AsyncMarketDataCache, AsyncServices
+from tinkoff.invest.caching.market_data_cache.cache_settings import (
+    MarketDataCacheSettings,
+)
 from tinkoff.invest.grpc import marketdata_pb2
 from tinkoff.invest.schemas import GetMySubscriptions, MarketDataRequest
-from tinkoff.invest.services import MarketDataService
+from tinkoff.invest.services import (
+    MarketDataCache,
+    MarketDataService,
+    MarketDataStreamService,
+    Services,
+)
+from tinkoff.invest.utils import now
 
 
 @pytest.fixture()
@@ -54,3 +64,66 @@ def test_market_data_request_get_my_subscriptions():
     )
 
     assert MessageToDict(result) == MessageToDict(expected)
+
+
+def test_market_data_stream_returns_protobuf(mocker):
+    service = MarketDataStreamService(mocker.Mock(), [], ResponseFormat.PROTOBUF)
+    service.stub = mocker.Mock()
+    response = marketdata_pb2.MarketDataResponse()
+    response.ping.SetInParent()
+    service.stub.MarketDataStream.return_value = iter([response])
+
+    (actual,) = service.market_data_stream(iter([]))
+
+    assert actual is response
+
+
+def test_get_last_prices_returns_bytes(mocker):
+    service = MarketDataService(mocker.Mock(), [], ResponseFormat.BYTES)
+    service.stub = mocker.Mock()
+    call = mocker.Mock()
+    call.initial_metadata.return_value = []
+    call.trailing_metadata.return_value = []
+    response = marketdata_pb2.GetLastPricesResponse(
+        last_prices=[marketdata_pb2.LastPrice(figi="figi")]
+    )
+    service.stub.GetLastPrices.with_call.return_value = (response, call)
+
+    actual = service.get_last_prices(figi=["figi"])
+
+    assert actual == response.SerializeToString()
+
+
+@pytest.mark.parametrize("response_format", [ResponseFormat.PROTOBUF, "bytes"])
+def test_get_all_candles_rejects_format_without_attributes(mocker, response_format):
+    services = Services(mocker.Mock(), "token", response_format=response_format)
+
+    with pytest.raises(ValueError, match="get_all_candles .* got (PROTOBUF|BYTES)"):
+        next(services.get_all_candles(from_=now()))
+    services.market_data.stub.GetCandles.with_call.assert_not_called()
+
+
+async def test_async_get_all_candles_rejects_protobuf_format(mocker):
+    services = AsyncServices(
+        mocker.Mock(), "token", response_format=ResponseFormat.PROTOBUF
+    )
+
+    with pytest.raises(ValueError, match="got PROTOBUF"):
+        async for _ in services.get_all_candles(from_=now()):
+            pass
+
+
+def test_market_data_cache_rejects_protobuf_format(mocker, tmp_path):
+    services = Services(mocker.Mock(), "token", response_format=ResponseFormat.PROTOBUF)
+
+    with pytest.raises(ValueError, match="MarketDataCache .* got PROTOBUF"):
+        MarketDataCache(MarketDataCacheSettings(base_cache_dir=tmp_path), services)
+
+
+def test_async_market_data_cache_rejects_bytes_format(mocker, tmp_path):
+    services = AsyncServices(
+        mocker.Mock(), "token", response_format=ResponseFormat.BYTES
+    )
+
+    with pytest.raises(ValueError, match="AsyncMarketDataCache .* got BYTES"):
+        AsyncMarketDataCache(MarketDataCacheSettings(base_cache_dir=tmp_path), services)
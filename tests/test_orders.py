@@ -4,6 +4,8 @@ from unittest import mock
 
 import pytest
 
+from tinkoff.invest import OrderDirection, OrderType, PostOrderRequest, RequestTemplate
+from tinkoff.invest.grpc import orders_pb2
 from tinkoff.invest.services import OrdersService
 
 
@@ -46,3 +48,35 @@ def test_get_orders(orders_service):
         account_id=mock.Mock(),
     )
     orders_service.get_orders.assert_called_once()
+
+
+def test_post_order_from_template(mocker):
+    orders_service = OrdersService(mocker.Mock(), [])
+    orders_service.stub = mocker.Mock()
+    call = mocker.Mock()
+    call.initial_metadata.return_value = []
+    call.trailing_metadata.return_value = []
+    orders_service.stub.PostOrder.with_call.return_value = (
+        orders_pb2.PostOrderResponse(order_id="order_id"),
+        call,
+    )
+    template = RequestTemplate(
+        PostOrderRequest(
+            figi="figi",
+            account_id="account_id",
+            direction=OrderDirection.ORDER_DIRECTION_BUY,
+            order_type=OrderType.ORDER_TYPE_MARKET,
+        )
+    )
+
+    response = orders_service.post_order_from_template(template, quantity=3)
+
+    assert response.order_id == "order_id"
+    request = orders_service.stub.PostOrder.with_call.call_args.kwargs["request"]
+    assert request == orders_pb2.PostOrderRequest(
+        figi="figi",
+        account_id="account_id",
+        direction=OrderDirection.ORDER_DIRECTION_BUY,
+        order_type=OrderType.ORDER_TYPE_MARKET,
+        quantity=3,
+    )
@@ -8,6 +8,7 @@ from tinkoff.invest import (
     GetOrdersResponse,
     GetStopOrdersResponse,
     OrderState,
+    ResponseFormat,
     StopOrder,
 )
 from tinkoff.invest.async_services import (
@@ -35,6 +36,7 @@ def async_services(
     async_services = mocker.create_autospec(AsyncServices)
     async_services.orders = orders_service
     async_services.stop_orders = stop_orders_service
+    async_services.response_format = ResponseFormat.DATACLASS
     return async_services
 
 
@@ -84,7 +86,9 @@ class TestAsyncOrdersCanceling:
             stop_orders=stop_orders
         )
 
-        await AsyncServices.cancel_all_orders(async_services, account_id=account_id)
+        result = await AsyncServices.cancel_all_orders(
+            async_services, account_id=account_id
+        )
 
         orders_service.get_orders.assert_called_once()
         orders_service.cancel_order.assert_has_calls(
@@ -95,3 +99,41 @@ class TestAsyncOrdersCanceling:
             call(account_id=account_id, stop_order_id=stop_order.stop_order_id)
             for stop_order in stop_orders
         )
+        assert [cancellation.order_id for cancellation in result.cancellations] == [
+            order.order_id for order in orders
+        ] + [stop_order.stop_order_id for stop_order in stop_orders]
+
+    async def test_does_not_stop_on_failed_cancellation(
+        self,
+        async_services: AsyncServices,
+        orders_service: OrdersService,
+        stop_orders_service: StopOrdersService,
+        account_id: AccountId,
+    ):
+        orders_service.get_orders.return_value = GetOrdersResponse(
+            orders=[OrderState(order_id="order")]
+        )
+        stop_orders_service.get_stop_orders.return_value = GetStopOrdersResponse(
+            stop_orders=[StopOrder(stop_order_id="failed")]
+        )
+        stop_orders_service.cancel_stop_order.side_effect = ValueError
+
+        result = await AsyncServices.cancel_all_orders(
+            async_services, account_id=account_id
+        )
+
+        assert result.cancellations[0].is_cancelled
+        assert [cancellation.order_id for cancellation in result.failed] == ["failed"]
+        assert isinstance(result.failed[0].error, ValueError)
+
+    async def test_rejects_bytes_response_format(
+        self,
+        async_services: AsyncServices,
+        orders_service: OrdersService,
+        account_id: AccountId,
+    ):
+        async_services.response_format = ResponseFormat.BYTES
+
+        with pytest.raises(ValueError, match="cancel_all_orders .* got BYTES"):
+            await AsyncServices.cancel_all_orders(async_services, account_id=account_id)
+        orders_service.get_orders.assert_not_called()
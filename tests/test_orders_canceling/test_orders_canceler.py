@@ -8,6 +8,7 @@ from tinkoff.invest import (
     GetOrdersResponse,
     GetStopOrdersResponse,
     OrderState,
+    ResponseFormat,
     StopOrder,
 )
 from tinkoff.invest.services import OrdersService, Services, StopOrdersService
@@ -31,6 +32,7 @@ def services(
     services = mocker.create_autospec(Services)
     services.orders = orders_service
     services.stop_orders = stop_orders_service
+    services.response_format = ResponseFormat.DATACLASS
     return services
 
 
@@ -80,14 +82,60 @@ class TestOrdersCanceler:
             stop_orders=stop_orders
         )
 
-        Services.cancel_all_orders(services, account_id=account_id)
+        result = Services.cancel_all_orders(services, account_id=account_id)
 
         orders_service.get_orders.assert_called_once()
         orders_service.cancel_order.assert_has_calls(
-            call(account_id=account_id, order_id=order.order_id) for order in orders
+            [call(account_id=account_id, order_id=order.order_id) for order in orders],
+            any_order=True,
         )
         stop_orders_service.get_stop_orders.assert_called_once()
         stop_orders_service.cancel_stop_order.assert_has_calls(
-            call(account_id=account_id, stop_order_id=stop_order.stop_order_id)
-            for stop_order in stop_orders
+            [
+                call(account_id=account_id, stop_order_id=stop_order.stop_order_id)
+                for stop_order in stop_orders
+            ],
+            any_order=True,
+        )
+        assert len(result.cancellations) == len(orders) + len(stop_orders)
+        assert not result.failed
+
+    def test_does_not_stop_on_failed_cancellation(
+        self,
+        services: Services,
+        orders_service: OrdersService,
+        stop_orders_service: StopOrdersService,
+        account_id: AccountId,
+    ):
+        orders_service.get_orders.return_value = GetOrdersResponse(
+            orders=[OrderState(order_id="failed"), OrderState(order_id="order")]
         )
+
+        def cancel_order(order_id, **_):
+            if order_id == "failed":
+                raise ValueError(order_id)
+
+        orders_service.cancel_order.side_effect = cancel_order
+        stop_orders_service.get_stop_orders.return_value = GetStopOrdersResponse(
+            stop_orders=[StopOrder(stop_order_id="stop")]
+        )
+
+        result = Services.cancel_all_orders(
+            services, account_id=account_id, max_workers=1
+        )
+
+        assert [
+            (cancellation.order_id, cancellation.is_stop_order)
+            for cancellation in result.cancellations
+        ] == [("failed", False), ("order", False), ("stop", True)]
+        assert [cancellation.order_id for cancellation in result.failed] == ["failed"]
+        assert isinstance(result.failed[0].error, ValueError)
+
+    def test_rejects_bytes_response_format(
+        self, services: Services, orders_service: OrdersService, account_id: AccountId
+    ):
+        services.response_format = ResponseFormat.BYTES
+
+        with pytest.raises(ValueError, match="cancel_all_orders .* got BYTES"):
+            Services.cancel_all_orders(services, account_id=account_id)
+        orders_service.get_orders.assert_not_called()
@@ -0,0 +1,140 @@
+# pylint:disable=redefined-outer-name
+import pytest
+
+from tinkoff.invest.logging import Metadata
+from tinkoff.invest.rate_limiting.aio.grpc_interceptor import (
+    AsyncRateLimitClientInterceptor,
+)
+from tinkoff.invest.rate_limiting.scheduler import (
+    RateLimitScheduler,
+    parse_ratelimit_limit,
+    split_method,
+)
+from tinkoff.invest.rate_limiting.sync.grpc_interceptor import (
+    RateLimitClientInterceptor,
+)
+
+GET_CANDLES = "/tinkoff.public.invest.api.contract.v1.MarketDataService/GetCandles"
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture()
+def clock():
+    return FakeClock()
+
+
+def ratelimit_metadata(remaining, reset=30, limit="60, 60;w=60"):
+    return Metadata("tracking-id", limit, remaining, reset, None)
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [("200", (200, 60.0)), ("200, 200;w=60", (200, 60.0)), ("5, 5;w=2", (5, 2.0))],
+)
+def test_parses_ratelimit_limit(value, expected):
+    assert parse_ratelimit_limit(value) == expected
+
+
+def test_splits_method():
+    assert split_method(GET_CANDLES.encode()) == ("MarketDataService", "GetCandles")
+
+
+class TestRateLimitScheduler:
+    def test_does_not_delay_unknown_methods(self, clock):
+        scheduler = RateLimitScheduler(clock=clock)
+
+        assert [scheduler.reserve(GET_CANDLES) for _ in range(100)] == [0.0] * 100
+
+    def test_delays_over_configured_service_limit(self, clock):
+        scheduler = RateLimitScheduler({"MarketDataService": 2}, clock=clock)
+
+        delays = [scheduler.reserve(GET_CANDLES) for _ in range(4)]
+
+        assert delays == [0.0, 0.0, 30.0, 60.0]
+
+    def test_refills_with_time(self, clock):
+        scheduler = RateLimitScheduler({"MarketDataService/GetCandles": 2}, clock=clock)
+        scheduler.reserve(GET_CANDLES)
+        scheduler.reserve(GET_CANDLES)
+
+        clock.now = 30.0
+
+        assert scheduler.reserve(GET_CANDLES) == 0.0
+        assert scheduler.reserve(GET_CANDLES) == 30.0
+
+    def test_learns_budget_from_metadata(self, clock):
+        scheduler = RateLimitScheduler(clock=clock)
+        scheduler.update(GET_CANDLES, ratelimit_metadata(remaining=1))
+
+        assert scheduler.reserve(GET_CANDLES) == 0.0
+        assert scheduler.reserve(GET_CANDLES) == 1.0
+
+    def test_waits_for_reset_when_exhausted(self, clock):
+        scheduler = RateLimitScheduler(clock=clock)
+        scheduler.update(GET_CANDLES, ratelimit_metadata(remaining=0, reset=20))
+
+        assert scheduler.reserve(GET_CANDLES) == 20.0
+
+    def test_ignores_metadata_without_limits(self, clock):
+        scheduler = RateLimitScheduler(clock=clock)
+        scheduler.update(GET_CANDLES, None)
+        scheduler.update(GET_CANDLES, Metadata("tracking-id", None, None, None, None))
+
+        assert scheduler.reserve(GET_CANDLES) == 0.0
+
+
+class TestRateLimitClientInterceptor:
+    def test_sleeps_before_call_and_learns_budget(self, mocker):
+        sleep = mocker.patch(
+            "tinkoff.invest.rate_limiting.sync.grpc_interceptor.time.sleep"
+        )
+        scheduler = mocker.Mock(spec=RateLimitScheduler)
+        scheduler.reserve.return_value = 1.5
+        call = mocker.Mock()
+        call.initial_metadata.return_value = [
+            mocker.Mock(key="x-ratelimit-limit", value="60"),
+            mocker.Mock(key="x-ratelimit-remaining", value="59"),
+        ]
+        continuation = mocker.Mock(return_value=call)
+        details = mocker.Mock(method=GET_CANDLES)
+
+        result = RateLimitClientInterceptor(scheduler).intercept_unary_unary(
+            continuation, details, "request"
+        )
+
+        assert result is call
+        sleep.assert_called_once_with(1.5)
+        continuation.assert_called_once_with(details, "request")
+        scheduler.update.assert_called_once_with(
+            GET_CANDLES, Metadata(None, "60", 59, None, None)
+        )
+
+    async def test_aio_sleeps_before_call_and_learns_budget(self, mocker):
+        sleep = mocker.patch(
+            "tinkoff.invest.rate_limiting.aio.grpc_interceptor.asyncio.sleep"
+        )
+        scheduler = mocker.Mock(spec=RateLimitScheduler)
+        scheduler.reserve.return_value = 1.5
+        call = mocker.Mock()
+        call.initial_metadata = mocker.AsyncMock(
+            return_value=[("x-ratelimit-limit", "60"), ("x-ratelimit-remaining", "0")]
+        )
+        continuation = mocker.AsyncMock(return_value=call)
+        details = mocker.Mock(method=GET_CANDLES.encode())
+
+        result = await AsyncRateLimitClientInterceptor(scheduler).intercept_unary_unary(
+            continuation, details, "request"
+        )
+
+        assert result is call
+        sleep.assert_awaited_once_with(1.5)
+        scheduler.update.assert_called_once_with(
+            GET_CANDLES.encode(), Metadata(None, "60", 0, None, None)
+        )
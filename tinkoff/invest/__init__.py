@@ -1,5 +1,7 @@
+from ._grpc_helpers import RequestTemplate, ResponseFormat, set_string_interning
 from .clients import AsyncClient, Client
 from .exceptions import AioRequestError, InvestError, RequestError
+from .fixed_point import FixedPoint
 from .logging import get_current_tracking_id
 from .schemas import (
     AccessLevel,
@@ -290,6 +292,7 @@ __all__ = (
     "FilterOptionsRequest",
     "FindInstrumentRequest",
     "FindInstrumentResponse",
+    "FixedPoint",
     "Future",
     "FutureResponse",
     "FuturesResponse",
@@ -423,9 +426,12 @@ __all__ = (
     "RealExchange",
     "ReplaceOrderRequest",
     "RequestError",
+    "RequestTemplate",
+    "ResponseFormat",
     "SandboxPayInRequest",
     "SandboxPayInResponse",
     "SecurityTradingStatus",
+    "set_string_interning",
     "Share",
     "ShareResponse",
     "SharesResponse",
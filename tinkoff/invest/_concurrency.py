@@ -0,0 +1,96 @@
+import asyncio
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from itertools import islice
+from typing import (
+    AsyncGenerator,
+    Awaitable,
+    Callable,
+    Deque,
+    Generator,
+    Iterable,
+    Iterator,
+    TypeVar,
+)
+
+T = TypeVar("T")
+R = TypeVar("R")
+F = TypeVar("F")
+
+
+def _submit_next(
+    pending: Deque[F], items_iter: Iterator[T], submit: Callable[[T], F]
+) -> None:
+    for item in islice(items_iter, 1):
+        pending.append(submit(item))
+
+
+def ordered_map(
+    func: Callable[[T], R], items: Iterable[T], max_workers: int
+) -> Generator[R, None, None]:
+    """Call `func` for items in up to `max_workers` threads.
+
+    Results are yielded in the order of `items`. Only `max_workers` calls run
+    ahead of the consumer, calls not started yet are cancelled when the
+    generator is closed.
+    """
+    if max_workers <= 1:
+        yield from map(func, items)
+        return
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        yield from _ordered_map_in_executor(executor, func, items, max_workers)
+
+
+def _ordered_map_in_executor(
+    executor: ThreadPoolExecutor,
+    func: Callable[[T], R],
+    items: Iterable[T],
+    max_workers: int,
+) -> Generator[R, None, None]:
+    items_iter = iter(items)
+
+    def submit(item: T) -> "Future[R]":
+        return executor.submit(func, item)
+
+    pending: Deque["Future[R]"] = deque(map(submit, islice(items_iter, max_workers)))
+    try:
+        while pending:
+            result = pending.popleft().result()
+            _submit_next(pending, items_iter, submit)
+            yield result
+    finally:
+        for future in pending:
+            future.cancel()
+
+
+async def aordered_map(
+    func: Callable[[T], Awaitable[R]], items: Iterable[T], max_concurrency: int
+) -> AsyncGenerator[R, None]:
+    """Awaits `func` for items with up to `max_concurrency` calls at once.
+
+    Asyncio counterpart of `ordered_map`.
+    """
+    if max_concurrency <= 1:
+        for item in items:
+            yield await func(item)
+        return
+
+    items_iter = iter(items)
+
+    def submit(item: T) -> "asyncio.Future[R]":
+        return asyncio.ensure_future(func(item))
+
+    pending: Deque["asyncio.Future[R]"] = deque(
+        map(submit, islice(items_iter, max_concurrency))
+    )
+    try:
+        while pending:
+            result = await pending.popleft()
+            _submit_next(pending, items_iter, submit)
+            yield result
+    finally:
+        for task in pending:
+            task.cancel()
+        # cancelled calls are finished before the generator is
+        await asyncio.gather(*pending, return_exceptions=True)
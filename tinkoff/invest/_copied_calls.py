@@ -0,0 +1,66 @@
+from typing import Any, Optional
+
+import grpc
+
+
+def copy_response(response: Any) -> Any:
+    copied = type(response)()
+    copied.CopyFrom(response)
+    return copied
+
+
+class CopiedResponseCall:
+    """Call shared between callers returning a copy of its response."""
+
+    def __init__(self, call: Any):
+        self._call = call
+        self._response: Any = None
+
+    def result(self, timeout: Optional[float] = None) -> Any:
+        if self._response is None:
+            self._response = copy_response(self._call.result(timeout))
+        return self._response
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._call, name)
+
+
+class AsyncCopiedResponseCall(grpc.aio.UnaryUnaryCall):
+    """Call shared between callers returning a copy of its response."""
+
+    def __init__(self, call: Any):
+        self._call = call
+
+    def cancel(self) -> bool:
+        return self._call.cancel()
+
+    def cancelled(self) -> bool:
+        return self._call.cancelled()
+
+    def done(self) -> bool:
+        return self._call.done()
+
+    def add_done_callback(self, callback) -> None:
+        self._call.add_done_callback(callback)
+
+    def time_remaining(self) -> Optional[float]:
+        return self._call.time_remaining()
+
+    async def initial_metadata(self):
+        return await self._call.initial_metadata()
+
+    async def trailing_metadata(self):
+        return await self._call.trailing_metadata()
+
+    async def code(self) -> grpc.StatusCode:
+        return await self._call.code()
+
+    async def details(self) -> str:
+        return await self._call.details()
+
+    async def wait_for_connection(self) -> None:
+        await self._call.wait_for_connection()
+
+    def __await__(self):
+        response = yield from self._call.__await__()
+        return copy_response(response)
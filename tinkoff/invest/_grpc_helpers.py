@@ -1,13 +1,24 @@
-# pylint:disable=no-name-in-module
+# pylint:disable=no-name-in-module,too-many-lines
 import dataclasses
 import enum
+import keyword
+import sys
+import threading
 from abc import ABC
+from collections.abc import Sequence
 from datetime import datetime, timedelta, timezone
 from decimal import Decimal
 from typing import (
     Any,
+    Callable,
     Dict,
+    FrozenSet,
+    Generic,
+    Iterable,
+    Iterator,
+    List,
     Optional,
+    Set,
     Tuple,
     Type,
     TypeVar,
@@ -24,15 +35,38 @@ _sym_db = symbol_database.Default()
 T = TypeVar("T")
 
 
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_SECONDS_IN_DAY = 86400
+_NANOS_IN_SECOND = 1_000_000_000
+
+
 def ts_to_datetime(value: Timestamp) -> datetime:
-    ts = value.seconds + (value.nanos / 1e9)
-    return datetime(1970, 1, 1, tzinfo=timezone.utc) + timedelta(seconds=ts)
+    return _EPOCH + timedelta(seconds=value.seconds, microseconds=value.nanos // 1000)
 
 
 def datetime_to_ts(value: datetime) -> Tuple[int, int]:
-    seconds = int(value.timestamp())
-    nanos = int(value.microsecond * 1e3)
-    return seconds, nanos
+    if value.tzinfo is None:
+        # naive datetimes are treated as local time, like `datetime.timestamp`
+        value = value.astimezone(timezone.utc)
+    delta = value - _EPOCH
+    return delta.days * _SECONDS_IN_DAY + delta.seconds, delta.microseconds * 1000
+
+
+def ts_to_datetime64(values: Iterable[Timestamp]) -> Any:
+    """Convert timestamps into a `numpy.datetime64[ns]` array.
+
+    Requires numpy, which is installed with the `all` extra.
+    """
+    import numpy as np  # pylint:disable=import-outside-toplevel
+
+    values = list(values)
+    seconds = np.fromiter(
+        (value.seconds for value in values), dtype=np.int64, count=len(values)
+    )
+    nanos = np.fromiter(
+        (value.nanos for value in values), dtype=np.int64, count=len(values)
+    )
+    return (seconds * _NANOS_IN_SECOND + nanos).view("datetime64[ns]")
 
 
 # Proto 3 data types
@@ -222,15 +256,89 @@ class Enum(enum.IntEnum):
 
 
 class Message:
-    ...
+    __slots__ = ()
+
+
+def _frozen_getstate(self: Any) -> List[Any]:
+    return [getattr(self, name) for name in self.__slots__]
+
+
+def _frozen_setstate(self: Any, state: List[Any]) -> None:
+    for name, value in zip(self.__slots__, state):
+        object.__setattr__(self, name, value)
+
+
+def _add_slots(cls: Any) -> Any:
+    field_names = tuple(field.name for field in dataclasses.fields(cls))
+    cls_dict = dict(cls.__dict__)
+    cls_dict["__slots__"] = field_names
+    for name in field_names:
+        cls_dict.pop(name, None)
+    cls_dict.pop("__dict__", None)
+    cls_dict.pop("__weakref__", None)
+    slotted_cls = type(cls)(cls.__name__, cls.__bases__, cls_dict)
+    slotted_cls.__qualname__ = cls.__qualname__
+    if cls.__dataclass_params__.frozen:
+        # default pickling restores slots with setattr, forbidden when frozen
+        slotted_cls.__getstate__ = _frozen_getstate
+        slotted_cls.__setstate__ = _frozen_setstate
+    return slotted_cls
+
+
+def slotted_dataclass(**kwargs: Any) -> Callable[[Type[T]], Type[T]]:
+    """Create a `dataclasses.dataclass` with `__slots__`.
+
+    Backport of `dataclass(slots=True)` from python 3.10. Instances have no
+    `__dict__`, which makes them several times smaller.
+    """
+
+    def wrap(cls: Type[T]) -> Type[T]:
+        return _add_slots(dataclasses.dataclass(**kwargs)(cls))
+
+    return wrap
+
+
+class ResponseFormat(str, enum.Enum):
+    """Form of the responses returned by services.
+
+    Helpers built on top of responses (`Services.get_all_candles`,
+    `Services.cancel_all_orders`, caches, batchers) need attribute access,
+    they support `DATACLASS` and `VIEW` formats only and raise `ValueError`
+    for the others.
+    """
+
+    # Responses are fully converted into schema dataclasses
+    DATACLASS = "dataclass"
+    # Responses are read-only views converting fields on first access
+    VIEW = "view"
+    # Responses are the received `*_pb2` messages as is
+    PROTOBUF = "protobuf"
+    # Responses are the received messages serialized into bytes
+    BYTES = "bytes"
+
+
+def check_response_format(response_format: ResponseFormat, helper: str) -> None:
+    """Raise for formats the helper can not read candles or instruments of."""
+    if response_format in (ResponseFormat.PROTOBUF, ResponseFormat.BYTES):
+        raise ValueError(
+            f"{helper} supports DATACLASS and VIEW response formats, "
+            f"got {ResponseFormat(response_format).name}"
+        )
 
 
 class Service(ABC):
     _stub_factory: Any
 
-    def __init__(self, channel, metadata):
+    def __init__(
+        self,
+        channel,
+        metadata,
+        response_format: ResponseFormat = ResponseFormat.DATACLASS,
+    ):
         self.stub = self._stub_factory(channel)
         self.metadata = metadata
+        self.response_format = response_format
+        self._convert_response = _get_response_converter(response_format)
 
 
 _UNKNOWN: Any = object()
@@ -293,7 +401,10 @@ def to_unsafe_field_name(field_name: str) -> str:
 # pylint:disable=too-many-locals
 # pylint:disable=too-many-nested-blocks
 # pylint:disable=too-many-statements
-def protobuf_to_dataclass(pb_obj: Any, dataclass_type: Type[T]) -> T:  # noqa:C901
+def protobuf_to_dataclass_generic(  # noqa:C901
+    pb_obj: Any, dataclass_type: Type[T]
+) -> T:
+    """Reflection based conversion, kept as a reference for compiled decoders."""
     dataclass_hints = get_type_hints(dataclass_type)
     dataclass_dict: Dict[str, Any] = {}
     dataclass_fields = dataclass_type.__dataclass_fields__  # type:ignore
@@ -315,7 +426,7 @@ def protobuf_to_dataclass(pb_obj: Any, dataclass_type: Type[T]) -> T:  # noqa:C9
             elif issubclass(field_type, datetime):
                 field_value = ts_to_datetime(pb_value)
             elif dataclasses.is_dataclass(field_type):
-                field_value = protobuf_to_dataclass(pb_value, field_type)
+                field_value = protobuf_to_dataclass_generic(pb_value, field_type)
             elif issubclass(field_type, Enum):
                 field_value = field_type(pb_value)
         elif origin == list:
@@ -325,7 +436,7 @@ def protobuf_to_dataclass(pb_obj: Any, dataclass_type: Type[T]) -> T:  # noqa:C9
                 field_value = pb_value
             elif dataclasses.is_dataclass(first_arg):
                 field_value = [
-                    protobuf_to_dataclass(item, first_arg) for item in pb_value
+                    protobuf_to_dataclass_generic(item, first_arg) for item in pb_value
                 ]
             elif first_arg == Decimal:
                 field_value = [Decimal(str(item)) for item in pb_value]
@@ -340,7 +451,250 @@ def protobuf_to_dataclass(pb_obj: Any, dataclass_type: Type[T]) -> T:  # noqa:C9
     return dataclass_type(**dataclass_dict)
 
 
-def dataclass_to_protobuff(dataclass_obj: Any, protobuff_obj: T) -> T:  # noqa:C901
+KIND_PRIMITIVE = "primitive"
+KIND_DECIMAL = "decimal"
+KIND_DATETIME = "datetime"
+KIND_MESSAGE = "message"
+KIND_ENUM = "enum"
+KIND_UNKNOWN = "unknown"
+
+
+@dataclasses.dataclass(frozen=True)
+class FieldSpec:
+    """Conversion plan for a single dataclass field, resolved once per type."""
+
+    # Dataclass attribute name
+    name: str
+    # Protobuf attribute name (keywords are not escaped there)
+    pb_name: str
+    # One of KIND_* constants
+    kind: str
+    # Field type, or the item type for repeated fields
+    type_: Any
+    repeated: bool
+    # Name of the "one-of" group the field belongs to
+    group: Optional[str]
+
+
+_FIELD_SPECS: Dict[type, Tuple[FieldSpec, ...]] = {}
+
+
+def _get_field_kind(  # pylint:disable=too-many-return-statements
+    field_type: Any,
+) -> str:
+    if field_type in PRIMITIVE_TYPES:
+        return KIND_PRIMITIVE
+    if field_type == Decimal:
+        return KIND_DECIMAL
+    if not isinstance(field_type, type):
+        return KIND_UNKNOWN
+    if issubclass(field_type, datetime):
+        return KIND_DATETIME
+    if dataclasses.is_dataclass(field_type):
+        return KIND_MESSAGE
+    if issubclass(field_type, Enum):
+        return KIND_ENUM
+    return KIND_UNKNOWN
+
+
+def get_field_specs(dataclass_type: type) -> Tuple[FieldSpec, ...]:
+    try:
+        return _FIELD_SPECS[dataclass_type]
+    except KeyError:
+        pass
+    dataclass_fields = getattr(dataclass_type, "__dataclass_fields__", {})
+    specs = []
+    for field_name, field_type in get_type_hints(dataclass_type).items():
+        repeated = get_origin(field_type) == list
+        item_type = get_args(field_type)[0] if repeated else field_type
+        specs.append(
+            FieldSpec(
+                name=field_name,
+                pb_name=to_unsafe_field_name(field_name),
+                kind=_get_field_kind(item_type),
+                type_=item_type,
+                repeated=repeated,
+                group=dataclass_fields[field_name].metadata["proto"].group,
+            )
+        )
+    _FIELD_SPECS[dataclass_type] = tuple(specs)
+    return _FIELD_SPECS[dataclass_type]
+
+
+def _pb_attribute(obj_name: str, attribute: str) -> str:
+    if keyword.iskeyword(attribute):
+        return f"getattr({obj_name}, {attribute!r})"
+    return f"{obj_name}.{attribute}"
+
+
+def _pb_assignment(obj_name: str, attribute: str, value: str) -> str:
+    if keyword.iskeyword(attribute):
+        return f"setattr({obj_name}, {attribute!r}, {value})"
+    return f"{obj_name}.{attribute} = {value}"
+
+
+_DECODERS: Dict[type, Callable[[Any], Any]] = {}
+_PENDING_DECODERS: Set[type] = set()
+_CODEGEN_LOCK = threading.RLock()
+
+
+def get_decoder(dataclass_type: Type[T]) -> Callable[[Any], T]:
+    """Return a decoder specialized for `dataclass_type`, compiling it once.
+
+    The decoder reads every protobuf attribute directly and calls the nested
+    decoders, so no type hints are inspected while decoding.
+    """
+    decoder = _DECODERS.get(dataclass_type)
+    if decoder is not None:
+        return decoder
+    with _CODEGEN_LOCK:
+        if dataclass_type in _DECODERS:
+            return _DECODERS[dataclass_type]
+        if dataclass_type in _PENDING_DECODERS:
+            # recursive message, resolved when the outer compilation is finished
+            return lambda pb_obj: protobuf_to_dataclass(pb_obj, dataclass_type)
+        _PENDING_DECODERS.add(dataclass_type)
+        try:
+            _DECODERS[dataclass_type] = _build_decoder(dataclass_type)
+        finally:
+            _PENDING_DECODERS.discard(dataclass_type)
+    return _DECODERS[dataclass_type]
+
+
+def _decimal_from_pb(value: Any) -> Decimal:
+    return Decimal(str(value))
+
+
+class EnumTable(dict):
+    """Maps protobuf enum values to members without calling the enum type."""
+
+    def __init__(self, enum_type: Type[enum.Enum]):
+        super().__init__((member.value, member) for member in enum_type)
+        self.enum_type = enum_type
+
+    def __missing__(self, value: int) -> Any:
+        # raises ValueError for values unknown to the enum, like before
+        return self.enum_type(value)
+
+
+_ENUM_TABLES: Dict[type, EnumTable] = {}
+
+
+def get_enum_table(enum_type: Type[enum.Enum]) -> EnumTable:
+    table = _ENUM_TABLES.get(enum_type)
+    if table is None:
+        table = _ENUM_TABLES[enum_type] = EnumTable(enum_type)
+    return table
+
+
+# Identifiers repeating across messages, candidates for interning
+INTERNED_FIELD_NAMES = frozenset(
+    {
+        "figi",
+        "ticker",
+        "class_code",
+        "isin",
+        "uid",
+        "instrument_uid",
+        "position_uid",
+        "asset_uid",
+        "account_id",
+        "currency",
+        "exchange",
+        "instrument_type",
+        "country_of_risk",
+        "sector",
+    }
+)
+_interned_field_names: FrozenSet[str] = frozenset()
+
+
+def set_string_interning(
+    enabled: bool, field_names: Iterable[str] = INTERNED_FIELD_NAMES
+) -> None:
+    """Turn on or off interning of string fields in decoded responses.
+
+    Interned strings with the same value are a single object, so long-running
+    stream consumers and instrument caches do not keep duplicates of the same
+    identifiers. Affects all clients; decoders and view types are rebuilt on
+    next use.
+    """
+    global _interned_field_names  # pylint:disable=global-statement
+    with _CODEGEN_LOCK:
+        _interned_field_names = frozenset(field_names) if enabled else frozenset()
+        _DECODERS.clear()
+        _VIEW_TYPES.clear()
+
+
+def _get_value_decoder(spec: FieldSpec) -> Optional[Callable[[Any], Any]]:
+    if spec.kind == KIND_PRIMITIVE:
+        return None
+    if spec.kind == KIND_DECIMAL:
+        return _decimal_from_pb
+    if spec.kind == KIND_DATETIME:
+        return ts_to_datetime
+    if spec.kind == KIND_MESSAGE:
+        return get_decoder(spec.type_)
+    if spec.kind == KIND_ENUM:
+        return get_enum_table(spec.type_).__getitem__
+    raise UnknownType(f'type "{spec.type_}" unknown')
+
+
+def _build_decoder(dataclass_type: type) -> Callable[[Any], Any]:
+    specs = get_field_specs(dataclass_type)
+    namespace: Dict[str, Any] = {"_cls": dataclass_type}
+    lines = ["def decode(pb_obj):"]
+    for group in sorted({spec.group for spec in specs if spec.group}):
+        lines.append(f"    _which_{group} = pb_obj.WhichOneof({group!r})")
+    arguments: List[str] = []
+    for index, spec in enumerate(specs):
+        pb_value = _pb_attribute("pb_obj", spec.pb_name)
+        value_decoder = _get_value_decoder(spec)
+        converter = f"_decode_{index}"
+        if spec.kind == KIND_ENUM:
+            # subscripting the table skips the method call of value_decoder
+            namespace[converter] = get_enum_table(spec.type_)
+            expression = (
+                f"list(map({converter}.__getitem__, {pb_value}))"
+                if spec.repeated
+                else f"{converter}[{pb_value}]"
+            )
+        elif spec.type_ is str and spec.name in _interned_field_names:
+            namespace["_intern"] = sys.intern
+            expression = (
+                f"list(map(_intern, {pb_value}))"
+                if spec.repeated
+                else f"_intern({pb_value})"
+            )
+        elif value_decoder is None:
+            expression = f"list({pb_value})" if spec.repeated else pb_value
+        elif spec.repeated:
+            namespace[converter] = value_decoder
+            expression = f"list(map({converter}, {pb_value}))"
+        else:
+            namespace[converter] = value_decoder
+            expression = f"{converter}({pb_value})"
+        if spec.group:
+            expression = (
+                f"({expression} if _which_{spec.group} == {spec.name!r} else None)"
+            )
+        arguments.append(f"        {spec.name}={expression},")
+    lines.extend(["    return _cls(", *arguments, "    )"])
+    exec("\n".join(lines), namespace)  # noqa:S102 # nosec # pylint:disable=exec-used
+    return namespace["decode"]
+
+
+def protobuf_to_dataclass(pb_obj: Any, dataclass_type: Type[T]) -> T:
+    decoder = _DECODERS.get(dataclass_type)
+    if decoder is None:
+        decoder = get_decoder(dataclass_type)
+    return decoder(pb_obj)
+
+
+def dataclass_to_protobuff_generic(  # noqa:C901
+    dataclass_obj: Any, protobuff_obj: T
+) -> T:
+    """Reflection based conversion, kept as a reference for compiled encoders."""
     dataclass_type = type(dataclass_obj)
     dataclass_hints = get_type_hints(dataclass_type)
     if not dataclass_hints:
@@ -364,7 +718,7 @@ def dataclass_to_protobuff(dataclass_obj: Any, protobuff_obj: T) -> T:  # noqa:C
                 pb_value.nanos = nanos
             elif dataclasses.is_dataclass(field_type):
                 pb_value = getattr(protobuff_obj, field_name)
-                dataclass_to_protobuff(field_value, pb_value)
+                dataclass_to_protobuff_generic(field_value, pb_value)
             elif issubclass(field_type, Enum):
                 if isinstance(field_value, int):
                     field_value = field_type(field_value)
@@ -382,7 +736,8 @@ def dataclass_to_protobuff(dataclass_obj: Any, protobuff_obj: T) -> T:  # noqa:C
                 field_descriptor = descriptor.fields_by_name[field_name].message_type
                 type_ = _sym_db.GetPrototype(field_descriptor)
                 pb_value.extend(
-                    dataclass_to_protobuff(item, type_()) for item in field_value
+                    dataclass_to_protobuff_generic(item, type_())
+                    for item in field_value
                 )
             elif issubclass(first_arg, Enum):
                 pb_value.extend(item.value for item in field_value)
@@ -392,3 +747,344 @@ def dataclass_to_protobuff(dataclass_obj: Any, protobuff_obj: T) -> T:  # noqa:C
             raise UnknownType(f"type {field_type} unknown")
 
     return protobuff_obj
+
+
+_ENCODERS: Dict[type, Callable[[Any, Any], Any]] = {}
+_FIELD_ENCODERS: Dict[type, Dict[str, Callable[[Any, Any], None]]] = {}
+
+
+def _encode_enum(enum_type: Type[Enum]) -> Callable[[Any], Any]:
+    def encode(value: Any) -> Any:
+        if value.__class__ is enum_type:
+            return value
+        return enum_type(value)
+
+    return encode
+
+
+def _encode_datetime(value: datetime, pb_value: Any) -> None:
+    pb_value.seconds, pb_value.nanos = datetime_to_ts(value)
+
+
+def _field_encoder_lines(  # pylint:disable=too-many-return-statements
+    spec: FieldSpec, index: int, namespace: Dict[str, Any]
+) -> List[str]:
+    pb_value = _pb_attribute("pb_obj", spec.pb_name)
+    encoder = f"_encode_{index}"
+    if spec.kind == KIND_PRIMITIVE:
+        if spec.repeated:
+            return [f"{pb_value}.extend(value)"]
+        return [_pb_assignment("pb_obj", spec.pb_name, "value")]
+    if spec.kind == KIND_MESSAGE:
+        namespace["_encode_message"] = dataclass_to_protobuff
+        if spec.repeated:
+            return [
+                f"_add = {pb_value}.add",
+                "for item in value:",
+                "    _encode_message(item, _add())",
+            ]
+        return [f"_encode_message(value, {pb_value})"]
+    if spec.kind == KIND_ENUM:
+        namespace[encoder] = _encode_enum(spec.type_)
+        if spec.repeated:
+            return [f"{pb_value}.extend([{encoder}(item) for item in value])"]
+        return [_pb_assignment("pb_obj", spec.pb_name, f"{encoder}(value)")]
+    if spec.kind == KIND_DATETIME and not spec.repeated:
+        namespace["_encode_datetime"] = _encode_datetime
+        return [f"_encode_datetime(value, {pb_value})"]
+    namespace["_UnknownType"] = UnknownType
+    field_type = List[spec.type_] if spec.repeated else spec.type_  # type:ignore
+    return [f"raise _UnknownType({f'type {field_type} unknown'!r})"]
+
+
+def _indent(lines: List[str], level: int) -> List[str]:
+    return [" " * 4 * level + line for line in lines]
+
+
+def _build_encoder(dataclass_type: type) -> Callable[[Any, Any], Any]:
+    specs = get_field_specs(dataclass_type)
+    namespace: Dict[str, Any] = {"_PLACEHOLDER": PLACEHOLDER}
+    lines = ["def encode(dataclass_obj, pb_obj):"]
+    if not specs:
+        lines.append("    pb_obj.SetInParent()")
+    for index, spec in enumerate(specs):
+        lines.append(f"    value = dataclass_obj.{spec.name}")
+        lines.append("    if value is not _PLACEHOLDER:")
+        lines.extend(_indent(_field_encoder_lines(spec, index, namespace), 2))
+    lines.append("    return pb_obj")
+    exec("\n".join(lines), namespace)  # noqa:S102 # nosec # pylint:disable=exec-used
+    return namespace["encode"]
+
+
+def _build_field_encoder(spec: FieldSpec) -> Callable[[Any, Any], None]:
+    namespace: Dict[str, Any] = {}
+    lines = ["def encode_field(value, pb_obj):"]
+    if spec.repeated or spec.kind == KIND_MESSAGE:
+        lines.append(f"    pb_obj.ClearField({spec.pb_name!r})")
+    lines.extend(_indent(_field_encoder_lines(spec, 0, namespace), 1))
+    exec("\n".join(lines), namespace)  # noqa:S102 # nosec # pylint:disable=exec-used
+    return namespace["encode_field"]
+
+
+def get_encoder(dataclass_type: type) -> Callable[[Any, Any], Any]:
+    """Return an encoder specialized for `dataclass_type`, compiling it once."""
+    encoder = _ENCODERS.get(dataclass_type)
+    if encoder is None:
+        with _CODEGEN_LOCK:
+            encoder = _ENCODERS.get(dataclass_type)
+            if encoder is None:
+                encoder = _ENCODERS[dataclass_type] = _build_encoder(dataclass_type)
+    return encoder
+
+
+def get_field_encoders(dataclass_type: type) -> Dict[str, Callable[[Any, Any], None]]:
+    """Return encoders that overwrite a single field of a protobuf message."""
+    encoders = _FIELD_ENCODERS.get(dataclass_type)
+    if encoders is None:
+        with _CODEGEN_LOCK:
+            encoders = {
+                spec.name: _build_field_encoder(spec)
+                for spec in get_field_specs(dataclass_type)
+            }
+            _FIELD_ENCODERS[dataclass_type] = encoders
+    return encoders
+
+
+def dataclass_to_protobuff(dataclass_obj: Any, protobuff_obj: T) -> T:
+    encoder = _ENCODERS.get(dataclass_obj.__class__)
+    if encoder is None:
+        encoder = get_encoder(dataclass_obj.__class__)
+    return encoder(dataclass_obj, protobuff_obj)
+
+
+TMessage = TypeVar("TMessage")
+
+
+class RequestTemplate(Generic[T]):
+    """Request that is encoded once and then re-encoded only where it changes.
+
+    ```python
+    template = RequestTemplate(
+        PostOrderRequest(
+            account_id=account_id,
+            figi=figi,
+            direction=OrderDirection.ORDER_DIRECTION_BUY,
+            order_type=OrderType.ORDER_TYPE_MARKET,
+        )
+    )
+    client.orders.post_order_from_template(
+        template, quantity=1, order_id=str(uuid.uuid4())
+    )
+    ```
+    """
+
+    def __init__(self, request: T):
+        self._request = request
+        self._field_encoders = get_field_encoders(type(request))
+        self._prototypes: Dict[type, Any] = {}
+
+    @property
+    def request(self) -> T:
+        return self._request
+
+    def encode(self, protobuff_type: Type[TMessage], **changes: Any) -> TMessage:
+        prototype = self._prototypes.get(protobuff_type)
+        if prototype is None:
+            prototype = dataclass_to_protobuff(self._request, protobuff_type())
+            self._prototypes[protobuff_type] = prototype
+        protobuff_obj = protobuff_type()
+        protobuff_obj.CopyFrom(prototype)  # type:ignore
+        for field_name, value in changes.items():
+            try:
+                field_encoder = self._field_encoders[field_name]
+            except KeyError as e:
+                raise TypeError(
+                    f"{type(self._request).__name__} has no field {field_name}"
+                ) from e
+            field_encoder(value, protobuff_obj)
+        return protobuff_obj
+
+
+class MessageView:
+    """Read-only proxy over a protobuf message.
+
+    Fields are converted like in the schema dataclass, but only on first
+    access, and the result is memoized. Nested messages become views too,
+    except for the ones without nested messages (e.g. `Quotation`), which are
+    decoded into dataclasses right away.
+    """
+
+    _dataclass_type: type
+    _field_readers: Dict[str, Callable[[Any], Any]]
+
+    def __init__(self, pb_obj: Any):
+        object.__setattr__(self, "_pb_obj", pb_obj)
+
+    def __getattr__(self, name: str) -> Any:
+        try:
+            field_reader = self._field_readers[name]
+        except KeyError:
+            raise AttributeError(
+                f"{type(self).__name__!r} object has no attribute {name!r}"
+            ) from None
+        value = self.__dict__[name] = field_reader(self._pb_obj)
+        return value
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(f"{type(self).__name__} is read-only")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f"{type(self).__name__} is read-only")
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, MessageView):
+            return NotImplemented
+        return (
+            self._dataclass_type is other._dataclass_type
+            and self._pb_obj == other._pb_obj
+        )
+
+    def __hash__(self) -> int:
+        return hash(
+            (self._dataclass_type, self._pb_obj.SerializeToString(deterministic=True))
+        )
+
+    def __repr__(self) -> str:
+        fields = ", ".join(
+            f"{name}={getattr(self, name)!r}" for name in self._field_readers
+        )
+        return f"{type(self).__name__}({fields})"
+
+    @property
+    def protobuf(self) -> Any:
+        return self._pb_obj
+
+    def to_dataclass(self) -> Any:
+        return protobuf_to_dataclass(self._pb_obj, self._dataclass_type)
+
+
+class LazySequence(Sequence):
+    """Repeated protobuf field converting its items on first access."""
+
+    def __init__(self, pb_values: Any, convert: Callable[[Any], Any]):
+        self._pb_values = pb_values
+        self._convert = convert
+        self._items: List[Any] = [_UNKNOWN] * len(pb_values)
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __getitem__(self, index: Any) -> Any:
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self._items)))]
+        item = self._items[index]
+        if item is _UNKNOWN:
+            item = self._items[index] = self._convert(self._pb_values[index])
+        return item
+
+    def __iter__(self) -> Iterator[Any]:
+        for index in range(len(self._items)):
+            yield self[index]
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Sequence):
+            return NotImplemented
+        return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+
+    def __repr__(self) -> str:
+        return repr(list(self))
+
+
+_VIEW_TYPES: Dict[type, Type[MessageView]] = {}
+
+
+def _is_leaf_message(dataclass_type: type) -> bool:
+    return all(
+        spec.kind != KIND_MESSAGE and not spec.repeated
+        for spec in get_field_specs(dataclass_type)
+    )
+
+
+def _get_field_converter(spec: FieldSpec) -> Optional[Callable[[Any], Any]]:
+    if spec.kind == KIND_MESSAGE and not _is_leaf_message(spec.type_):
+        return get_view_type(spec.type_)
+    if spec.type_ is str and spec.name in _interned_field_names:
+        return sys.intern
+    return _get_value_decoder(spec)
+
+
+def _build_field_reader(spec: FieldSpec) -> Callable[[Any], Any]:
+    pb_name = spec.pb_name
+    convert = _get_field_converter(spec)
+
+    def read_field(pb_obj: Any) -> Any:
+        pb_value = getattr(pb_obj, pb_name)
+        if convert is None:
+            return list(pb_value) if spec.repeated else pb_value
+        if spec.repeated:
+            return LazySequence(pb_value, convert)
+        return convert(pb_value)
+
+    if spec.group is None:
+        return read_field
+
+    def read_oneof_field(pb_obj: Any) -> Any:
+        if pb_obj.WhichOneof(spec.group) != spec.name:
+            return None
+        return read_field(pb_obj)
+
+    return read_oneof_field
+
+
+def get_view_type(dataclass_type: type) -> Type[MessageView]:
+    view_type = _VIEW_TYPES.get(dataclass_type)
+    if view_type is not None:
+        return view_type
+    with _CODEGEN_LOCK:
+        if dataclass_type not in _VIEW_TYPES:
+            field_readers: Dict[str, Callable[[Any], Any]] = {}
+            _VIEW_TYPES[dataclass_type] = type(
+                f"{dataclass_type.__name__}View",
+                (MessageView,),
+                {"_dataclass_type": dataclass_type, "_field_readers": field_readers},
+            )
+            # filled after registration, so recursive messages find the view
+            for spec in get_field_specs(dataclass_type):
+                field_readers[spec.name] = _build_field_reader(spec)
+    return _VIEW_TYPES[dataclass_type]
+
+
+def protobuf_to_view(pb_obj: Any, dataclass_type: Type[T]) -> T:
+    view_type = _VIEW_TYPES.get(dataclass_type)
+    if view_type is None:
+        view_type = get_view_type(dataclass_type)
+    return view_type(pb_obj)  # type:ignore
+
+
+def materialize(value: Any) -> Any:
+    """Convert a message view into its dataclass, other values are kept."""
+    if isinstance(value, MessageView):
+        return value.to_dataclass()
+    return value
+
+
+def _keep_protobuf(pb_obj: Any, _dataclass_type: Any) -> Any:
+    return pb_obj
+
+
+def _serialize_protobuf(pb_obj: Any, _dataclass_type: Any) -> bytes:
+    return pb_obj.SerializeToString()
+
+
+_RESPONSE_CONVERTERS: Dict[ResponseFormat, Callable[[Any, Any], Any]] = {
+    ResponseFormat.DATACLASS: protobuf_to_dataclass,
+    ResponseFormat.VIEW: protobuf_to_view,
+    ResponseFormat.PROTOBUF: _keep_protobuf,
+    ResponseFormat.BYTES: _serialize_protobuf,
+}
+
+
+def _get_response_converter(
+    response_format: ResponseFormat,
+) -> Callable[[Any, Any], Any]:
+    return _RESPONSE_CONVERTERS[ResponseFormat(response_format)]
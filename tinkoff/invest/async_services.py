@@ -1,13 +1,41 @@
 # pylint:disable=redefined-builtin,too-many-lines
 import asyncio
+import functools
+import logging
+import threading
 from datetime import datetime
-from typing import AsyncGenerator, AsyncIterable, List, Optional
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncGenerator,
+    AsyncIterable,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    TypeVar,
+)
 
 import grpc
 from deprecation import deprecated
 
 from . import _grpc_helpers
+from ._concurrency import aordered_map
 from ._errors import handle_aio_request_error, handle_aio_request_error_gen
+from .caching.market_data_cache.cache_settings import MarketDataCacheSettings
+from .caching.market_data_cache.instrument_date_range_market_data import (
+    InstrumentDateRangeData,
+)
+from .caching.market_data_cache.instrument_market_data_storage import (
+    InstrumentMarketDataStorage,
+)
+from .data_loaders.operations_cursor import (
+    OperationsCursorCheckpoint,
+    aiter_pages,
+    get_page_request,
+)
 from .grpc import (
     instruments_pb2,
     instruments_pb2_grpc,
@@ -29,6 +57,8 @@ from .market_data_stream.async_market_data_stream_manager import (
     AsyncMarketDataStreamManager,
 )
 from .metadata import get_metadata
+from .orders_canceling import CancelAllOrdersResult, acancel_order, acancel_stop_order
+from .rate_limiting.scheduler import GET_CANDLES_METHOD, RateLimitScheduler
 from .schemas import (
     AssetRequest,
     AssetResponse,
@@ -122,6 +152,7 @@ from .schemas import (
     MoneyValue,
     OpenSandboxAccountRequest,
     OpenSandboxAccountResponse,
+    OperationItem,
     OperationsRequest,
     OperationsResponse,
     OperationState,
@@ -159,7 +190,16 @@ from .schemas import (
     WithdrawLimitsResponse,
 )
 from .typedefs import AccountId
-from .utils import get_intervals, now
+from .utils import (
+    candle_interval_to_timedelta,
+    datetime_range_floor,
+    floor_datetime,
+    get_intervals,
+    now,
+)
+
+if TYPE_CHECKING:
+    from .columnar import HistoricCandleColumns
 
 __all__ = (
     "AsyncServices",
@@ -173,58 +213,241 @@ __all__ = (
     "UsersService",
     "SandboxService",
     "StopOrdersService",
+    "AsyncMarketDataCache",
 )
 
+logger = logging.getLogger(__name__)
+
+
+async def _wait_for_get_candles(scheduler: Optional[RateLimitScheduler]) -> None:
+    if scheduler is not None:
+        await asyncio.sleep(scheduler.reserve(GET_CANDLES_METHOD))
+
 
-class AsyncServices:
+T = TypeVar("T")
+
+
+class AsyncMarketDataCache:
+    """Candles cache for `AsyncServices`, see `MarketDataCache`.
+
+    Cache files are read and written in the default executor of the loop.
+    """
+
+    def __init__(self, settings: MarketDataCacheSettings, services: "AsyncServices"):
+        _grpc_helpers.check_response_format(
+            services.response_format, "AsyncMarketDataCache"
+        )
+        self._settings = settings
+        self._settings.base_cache_dir.mkdir(parents=True, exist_ok=True)
+        self._services = services
+        self._lock = threading.Lock()
+        self._figi_cache_storages: Dict[
+            Tuple[str, CandleInterval], InstrumentMarketDataStorage
+        ] = {}
+
+    async def get_all_candles(
+        self,
+        *,
+        from_: datetime,
+        to: Optional[datetime] = None,
+        interval: CandleInterval = CandleInterval(0),
+        figi: str = "",
+    ) -> AsyncGenerator[HistoricCandle, None]:
+        to = to or now()
+        from_, to = datetime_range_floor((from_, to))
+        logger.debug("Request [\n%s\n%s\n]", str(from_), str(to))
+
+        storage = await self._run(self._get_figi_cache_storage, figi, interval)
+        cached_ranges = await self._run(self._read_cache, storage, (from_, to))
+        # of candles with the same time only the last one is yielded
+        previous: Optional[HistoricCandle] = None
+        async for candle in self._get_candles(
+            storage, figi, interval, (from_, to), cached_ranges
+        ):
+            if previous is not None and candle.time > previous.time:
+                yield previous
+            previous = candle
+        if previous is not None:
+            yield previous
+
+    async def _get_candles(
+        self,
+        storage: InstrumentMarketDataStorage,
+        figi: str,
+        interval: CandleInterval,
+        request_range: Tuple[datetime, datetime],
+        cached_ranges: List[InstrumentDateRangeData],
+    ) -> AsyncGenerator[HistoricCandle, None]:
+        processed_time, to = request_range
+        for cached in cached_ranges:
+            cached_start, cached_end = cached.date_range
+            if cached_start > processed_time:
+                async for candle in self._get_candles_with_saving(
+                    storage, figi, interval, (processed_time, cached_start)
+                ):
+                    yield candle
+            logger.debug(
+                "Returning from cache [\n%s\n%s\n]", str(cached_start), str(cached_end)
+            )
+            for candle in cached.historic_candles:
+                yield candle
+            processed_time = cached_end
+
+        if processed_time + candle_interval_to_timedelta(interval) <= to:
+            async for candle in self._get_candles_with_saving(
+                storage, figi, interval, (processed_time, to)
+            ):
+                yield candle
+
+    async def _get_candles_with_saving(
+        self,
+        storage: InstrumentMarketDataStorage,
+        figi: str,
+        interval: CandleInterval,
+        net_range: Tuple[datetime, datetime],
+    ) -> AsyncGenerator[HistoricCandle, None]:
+        start, end = net_range
+        received = False
+        complete_candles = []
+        async for candle in self._services.get_all_candles(
+            figi=figi, interval=interval, from_=start, to=end
+        ):
+            # cached candles are written as dataclasses, views are materialized
+            candle = _grpc_helpers.materialize(candle)
+            received = True
+            if candle.is_complete:
+                complete_candles.append(candle)
+            yield candle
+        if not received:
+            return
+        interval_delta = candle_interval_to_timedelta(interval)
+        data = InstrumentDateRangeData(
+            date_range=(start, floor_datetime(end, interval_delta)),
+            historic_candles=complete_candles,
+        )
+        await self._run(storage.update, [data])
+        logger.debug("From net [\n%s\n%s\n]", str(start), str(end))
+
+    def _get_figi_cache_storage(
+        self, figi: str, interval: CandleInterval
+    ) -> InstrumentMarketDataStorage:
+        figi_tuple = (figi, interval)
+        # storages are created in executor threads
+        with self._lock:
+            storage = self._figi_cache_storages.get(figi_tuple)
+            if storage is None:
+                storage = InstrumentMarketDataStorage(
+                    figi=figi, interval=interval, settings=self._settings
+                )
+                self._figi_cache_storages[figi_tuple] = storage
+        return storage  # noqa:R504
+
+    @staticmethod
+    def _read_cache(
+        storage: InstrumentMarketDataStorage, request_range: Tuple[datetime, datetime]
+    ) -> List[InstrumentDateRangeData]:
+        # files of later ranges may be merged while the net is requested
+        return [
+            InstrumentDateRangeData(
+                date_range=cached.date_range,
+                historic_candles=list(cached.historic_candles),
+            )
+            for cached in storage.get(request_range=request_range)
+        ]
+
+    @staticmethod
+    async def _run(func: Callable[..., T], *args: Any) -> T:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, functools.partial(func, *args))
+
+
+class AsyncServices:  # pylint:disable=too-many-instance-attributes
     def __init__(
         self,
         channel: grpc.aio.Channel,
         token: str,
         sandbox_token: Optional[str] = None,
         app_name: Optional[str] = None,
+        response_format: _grpc_helpers.ResponseFormat = (
+            _grpc_helpers.ResponseFormat.DATACLASS
+        ),
     ) -> None:
         metadata = get_metadata(token, app_name)
         sandbox_metadata = get_metadata(sandbox_token or token, app_name)
-        self.instruments = InstrumentsService(channel, metadata)
-        self.market_data = MarketDataService(channel, metadata)
-        self.market_data_stream = MarketDataStreamService(channel, metadata)
-        self.operations = OperationsService(channel, metadata)
-        self.operations_stream = OperationsStreamService(channel, metadata)
-        self.orders_stream = OrdersStreamService(channel, metadata)
-        self.orders = OrdersService(channel, metadata)
-        self.users = UsersService(channel, metadata)
-        self.sandbox = SandboxService(channel, sandbox_metadata)
-        self.stop_orders = StopOrdersService(channel, metadata)
+        self.response_format = response_format
+        self.instruments = InstrumentsService(channel, metadata, response_format)
+        self.market_data = MarketDataService(channel, metadata, response_format)
+        self.market_data_stream = MarketDataStreamService(
+            channel, metadata, response_format
+        )
+        self.operations = OperationsService(channel, metadata, response_format)
+        self.operations_stream = OperationsStreamService(
+            channel, metadata, response_format
+        )
+        self.orders_stream = OrdersStreamService(channel, metadata, response_format)
+        self.orders = OrdersService(channel, metadata, response_format)
+        self.users = UsersService(channel, metadata, response_format)
+        self.sandbox = SandboxService(channel, sandbox_metadata, response_format)
+        self.stop_orders = StopOrdersService(channel, metadata, response_format)
 
     def create_market_data_stream(self) -> AsyncMarketDataStreamManager:
         return AsyncMarketDataStreamManager(market_data_stream=self.market_data_stream)
 
-    async def cancel_all_orders(self, account_id: AccountId) -> None:
+    async def cancel_all_orders(self, account_id: AccountId) -> CancelAllOrdersResult:
+        """Cancel all orders and stop orders of the account at once.
+
+        A failed cancellation does not stop the others, see `failed` of
+        the result.
+        """
+        _grpc_helpers.check_response_format(self.response_format, "cancel_all_orders")
         orders_service: OrdersService = self.orders
         stop_orders_service: StopOrdersService = self.stop_orders
 
-        orders_response = await orders_service.get_orders(account_id=account_id)
-        await asyncio.gather(
+        orders_response, stop_orders_response = await asyncio.gather(
+            orders_service.get_orders(account_id=account_id),
+            stop_orders_service.get_stop_orders(account_id=account_id),
+        )
+        cancellations = await asyncio.gather(
             *[
-                orders_service.cancel_order(
-                    account_id=account_id, order_id=order.order_id
-                )
+                acancel_order(orders_service, account_id, order.order_id)
                 for order in orders_response.orders
-            ]
-        )
-
-        stop_orders_response = await stop_orders_service.get_stop_orders(
-            account_id=account_id
-        )
-        await asyncio.gather(
+            ],
             *[
-                stop_orders_service.cancel_stop_order(
-                    account_id=account_id, stop_order_id=stop_order.stop_order_id
+                acancel_stop_order(
+                    stop_orders_service, account_id, stop_order.stop_order_id
                 )
                 for stop_order in stop_orders_response.stop_orders
-            ]
+            ],
         )
+        return CancelAllOrdersResult(cancellations=list(cancellations))
+
+    async def get_all_operations_by_cursor(
+        self,
+        request: GetOperationsByCursorRequest,
+        *,
+        page_size: Optional[int] = None,
+        checkpoint: Optional[OperationsCursorCheckpoint] = None,
+        prefetch: bool = True,
+    ) -> AsyncGenerator[OperationItem, None]:
+        """Yield operations of all pages starting from `request.cursor`.
+
+        `page_size` overrides `request.limit`. With `prefetch` the next page is
+        requested in a task while the current one is consumed. A given
+        `checkpoint` is resumed from and moved forward page by page.
+        """
+        checkpoint = checkpoint or OperationsCursorCheckpoint.of_request(request)
+        if not checkpoint.has_next:
+            return
+
+        async def get_page(cursor: str) -> GetOperationsByCursorResponse:
+            return await self.operations.get_operations_by_cursor(
+                get_page_request(request, cursor, page_size)
+            )
+
+        async for page in aiter_pages(get_page, checkpoint.cursor, prefetch):
+            for item in page.items:
+                yield item
+            checkpoint.advance(page)
 
     async def get_all_candles(
         self,
@@ -234,19 +457,87 @@ class AsyncServices:
         interval: CandleInterval = CandleInterval(0),
         figi: str = "",
         instrument_id: str = "",
+        max_concurrency: int = 1,
+        rate_limit_scheduler: Optional[RateLimitScheduler] = None,
     ) -> AsyncGenerator[HistoricCandle, None]:
+        """Yield candles of the period requested window by window.
+
+        With `max_concurrency` above one, up to that many windows are requested
+        at once. Candles are still yielded in time order. Requests wait for
+        tokens of `rate_limit_scheduler` if it is given; a client with
+        `AsyncRateLimitClientInterceptor` throttles them already.
+        """
+        _grpc_helpers.check_response_format(self.response_format, "get_all_candles")
         to = to or now()
 
-        for local_from_, local_to in get_intervals(interval, from_, to):
-            candles_response = await self.market_data.get_candles(
+        async def get_candles(window: Tuple[datetime, datetime]) -> GetCandlesResponse:
+            await _wait_for_get_candles(rate_limit_scheduler)
+            local_from_, local_to = window
+            return await self.market_data.get_candles(
                 figi=figi,
                 interval=interval,
                 from_=local_from_,
                 to=local_to,
                 instrument_id=instrument_id,
             )
-            for candle in candles_response.candles:
-                yield candle
+
+        previous_candles: Set[HistoricCandle] = set()
+        candles_responses = aordered_map(
+            get_candles, get_intervals(interval, from_, to), max_concurrency
+        )
+        try:
+            async for candles_response in candles_responses:
+                for candle in candles_response.candles:
+                    if candle not in previous_candles:
+                        yield candle
+                        previous_candles.add(candle)
+
+                previous_candles = set(candles_response.candles)
+        finally:
+            # requests in flight are cancelled once candles are not needed
+            await candles_responses.aclose()
+
+    async def get_all_candles_columns(
+        self,
+        *,
+        from_: datetime,
+        to: Optional[datetime] = None,
+        interval: CandleInterval = CandleInterval(0),
+        figi: str = "",
+        instrument_id: str = "",
+        as_float: bool = False,
+        max_concurrency: int = 1,
+        rate_limit_scheduler: Optional[RateLimitScheduler] = None,
+    ) -> "HistoricCandleColumns":
+        from .columnar import (  # pylint:disable=import-outside-toplevel
+            concatenate_candle_columns,
+        )
+
+        to = to or now()
+
+        async def get_candles_columns(
+            window: Tuple[datetime, datetime]
+        ) -> "HistoricCandleColumns":
+            await _wait_for_get_candles(rate_limit_scheduler)
+            local_from_, local_to = window
+            return await self.market_data.get_candles_columns(
+                figi=figi,
+                interval=interval,
+                from_=local_from_,
+                to=local_to,
+                instrument_id=instrument_id,
+                as_float=as_float,
+            )
+
+        parts = [
+            part
+            async for part in aordered_map(
+                get_candles_columns,
+                get_intervals(interval, from_, to),
+                max_concurrency,
+            )
+        ]
+        return concatenate_candle_columns(parts, as_float=as_float)
 
 
 class InstrumentsService(_grpc_helpers.Service):
@@ -274,7 +565,7 @@ class InstrumentsService(_grpc_helpers.Service):
         )
         response = await response_coro
         log_request(await get_tracking_id_from_coro(response_coro), "TradingSchedules")
-        return _grpc_helpers.protobuf_to_dataclass(response, TradingSchedulesResponse)
+        return self._convert_response(response, TradingSchedulesResponse)
 
     @handle_aio_request_error("BondBy")
     async def bond_by(
@@ -296,7 +587,7 @@ class InstrumentsService(_grpc_helpers.Service):
         )
         response = await response_coro
         log_request(await get_tracking_id_from_coro(response_coro), "BondBy")
-        return _grpc_helpers.protobuf_to_dataclass(response, BondResponse)
+        return self._convert_response(response, BondResponse)
 
     @handle_aio_request_error("Bonds")
     async def bonds(
@@ -312,7 +603,7 @@ class InstrumentsService(_grpc_helpers.Service):
         )
         response = await response_coro
         log_request(await get_tracking_id_from_coro(response_coro), "Bonds")
-        return _grpc_helpers.protobuf_to_dataclass(response, BondsResponse)
+        return self._convert_response(response, BondsResponse)
 
     @handle_aio_request_error("CurrencyBy")
     async def currency_by(
@@ -334,7 +625,7 @@ class InstrumentsService(_grpc_helpers.Service):
         )
         response = await response_coro
         log_request(await get_tracking_id_from_coro(response_coro), "CurrencyBy")
-        return _grpc_helpers.protobuf_to_dataclass(response, CurrencyResponse)
+        return self._convert_response(response, CurrencyResponse)
 
     @handle_aio_request_error("Currencies")
     async def currencies(
@@ -350,7 +641,7 @@ class InstrumentsService(_grpc_helpers.Service):
         )
         response = await response_coro
         log_request(await get_tracking_id_from_coro(response_coro), "Currencies")
-        return _grpc_helpers.protobuf_to_dataclass(response, CurrenciesResponse)
+        return self._convert_response(response, CurrenciesResponse)
 
     @handle_aio_request_error("EtfBy")
     async def etf_by(
@@ -372,7 +663,7 @@ class InstrumentsService(_grpc_helpers.Service):
         )
         response = await response_coro
         log_request(await get_tracking_id_from_coro(response_coro), "EtfBy")
-        return _grpc_helpers.protobuf_to_dataclass(response, EtfResponse)
+        return self._convert_response(response, EtfResponse)
 
     @handle_aio_request_error("Etfs")
     async def etfs(
@@ -388,7 +679,7 @@ class InstrumentsService(_grpc_helpers.Service):
         )
         response = await response_coro
         log_request(await get_tracking_id_from_coro(response_coro), "Etfs")
-        return _grpc_helpers.protobuf_to_dataclass(response, EtfsResponse)
+        return self._convert_response(response, EtfsResponse)
 
     @handle_aio_request_error("FutureBy")
     async def future_by(
@@ -410,7 +701,7 @@ class InstrumentsService(_grpc_helpers.Service):
         )
         response = await response_coro
         log_request(await get_tracking_id_from_coro(response_coro), "FutureBy")
-        return _grpc_helpers.protobuf_to_dataclass(response, FutureResponse)
+        return self._convert_response(response, FutureResponse)
 
     @handle_aio_request_error("Futures")
     async def futures(
@@ -426,7 +717,7 @@ class InstrumentsService(_grpc_helpers.Service):
         )
         response = await response_coro
         log_request(await get_tracking_id_from_coro(response_coro), "Futures")
-        return _grpc_helpers.protobuf_to_dataclass(response, FuturesResponse)
+        return self._convert_response(response, FuturesResponse)
 
     @handle_aio_request_error("OptionBy")
     async def option_by(
@@ -448,7 +739,7 @@ class InstrumentsService(_grpc_helpers.Service):
         )
         response = await response_coro
         log_request(await get_tracking_id_from_coro(response_coro), "OptionBy")
-        return _grpc_helpers.protobuf_to_dataclass(response, OptionResponse)
+        return self._convert_response(response, OptionResponse)
 
     @deprecated(details="Use `Client.instruments.options_by(...)` method instead")
     @handle_aio_request_error("Options")
@@ -465,7 +756,7 @@ class InstrumentsService(_grpc_helpers.Service):
         )
         response = await response_coro
         log_request(await get_tracking_id_from_coro(response_coro), "Options")
-        return _grpc_helpers.protobuf_to_dataclass(response, OptionsResponse)
+        return self._convert_response(response, OptionsResponse)
 
     @handle_aio_request_error("OptionsBy")
     async def options_by(
@@ -482,7 +773,7 @@ class InstrumentsService(_grpc_helpers.Service):
         )
         response = await response_coro
         log_request(await get_tracking_id_from_coro(response_coro), "OptionsBy")
-        return _grpc_helpers.protobuf_to_dataclass(response, OptionsResponse)
+        return self._convert_response(response, OptionsResponse)
 
     @handle_aio_request_error("ShareBy")
     async def share_by(
@@ -504,7 +795,7 @@ class InstrumentsService(_grpc_helpers.Service):
         )
         response = await response_coro
         log_request(await get_tracking_id_from_coro(response_coro), "ShareBy")
-        return _grpc_helpers.protobuf_to_dataclass(response, ShareResponse)
+        return self._convert_response(response, ShareResponse)
 
     @handle_aio_request_error("Shares")
     async def shares(
@@ -520,7 +811,7 @@ class InstrumentsService(_grpc_helpers.Service):
         )
         response = await response_coro
         log_request(await get_tracking_id_from_coro(response_coro), "Shares")
-        return _grpc_helpers.protobuf_to_dataclass(response, SharesResponse)
+        return self._convert_response(response, SharesResponse)
 
     @handle_aio_request_error("GetAccruedInterests")
     async def get_accrued_interests(
@@ -546,9 +837,7 @@ class InstrumentsService(_grpc_helpers.Service):
         log_request(
             await get_tracking_id_from_coro(response_coro), "GetAccruedInterests"
         )
-        return _grpc_helpers.protobuf_to_dataclass(
-            response, GetAccruedInterestsResponse
-        )
+        return self._convert_response(response, GetAccruedInterestsResponse)
 
     @handle_aio_request_error("GetFuturesMargin")
     async def get_futures_margin(self, *, figi: str = "") -> GetFuturesMarginResponse:
@@ -562,7 +851,7 @@ class InstrumentsService(_grpc_helpers.Service):
         )
         response = await response_coro
         log_request(await get_tracking_id_from_coro(response_coro), "GetFuturesMargin")
-        return _grpc_helpers.protobuf_to_dataclass(response, GetFuturesMarginResponse)
+        return self._convert_response(response, GetFuturesMarginResponse)
 
     @handle_aio_request_error("GetInstrumentBy")
     async def get_instrument_by(
@@ -584,7 +873,7 @@ class InstrumentsService(_grpc_helpers.Service):
         )
         response = await response_coro
         log_request(await get_tracking_id_from_coro(response_coro), "GetInstrumentBy")
-        return _grpc_helpers.protobuf_to_dataclass(response, InstrumentResponse)
+        return self._convert_response(response, InstrumentResponse)
 
     @handle_aio_request_error("GetDividends")
     async def get_dividends(
@@ -608,7 +897,7 @@ class InstrumentsService(_grpc_helpers.Service):
         )
         response = await response_coro
         log_request(await get_tracking_id_from_coro(response_coro), "GetDividends")
-        return _grpc_helpers.protobuf_to_dataclass(response, GetDividendsResponse)
+        return self._convert_response(response, GetDividendsResponse)
 
     @handle_aio_request_error("GetBondCoupons")
     async def get_bond_coupons(
@@ -632,7 +921,7 @@ class InstrumentsService(_grpc_helpers.Service):
         )
         response = await response_coro
         log_request(await get_tracking_id_from_coro(response_coro), "GetBondCoupons")
-        return _grpc_helpers.protobuf_to_dataclass(response, GetBondCouponsResponse)
+        return self._convert_response(response, GetBondCouponsResponse)
 
     @handle_aio_request_error("GetAssetBy")
     async def get_asset_by(
@@ -650,7 +939,7 @@ class InstrumentsService(_grpc_helpers.Service):
         )
         response = await response_coro
         log_request(await get_tracking_id_from_coro(response_coro), "GetAssetBy")
-        return _grpc_helpers.protobuf_to_dataclass(response, AssetResponse)
+        return self._convert_response(response, AssetResponse)
 
     @handle_aio_request_error("GetAssets")
     async def get_assets(
@@ -665,7 +954,7 @@ class InstrumentsService(_grpc_helpers.Service):
         )
         response = await response_coro
         log_request(await get_tracking_id_from_coro(response_coro), "GetAssets")
-        return _grpc_helpers.protobuf_to_dataclass(response, AssetsResponse)
+        return self._convert_response(response, AssetsResponse)
 
     @handle_aio_request_error("GetFavorites")
     async def get_favorites(
@@ -680,7 +969,7 @@ class InstrumentsService(_grpc_helpers.Service):
         )
         response = await response_coro
         log_request(await get_tracking_id_from_coro(response_coro), "GetFavorites")
-        return _grpc_helpers.protobuf_to_dataclass(response, GetFavoritesResponse)
+        return self._convert_response(response, GetFavoritesResponse)
 
     @handle_aio_request_error("EditFavorites")
     async def edit_favorites(
@@ -702,7 +991,7 @@ class InstrumentsService(_grpc_helpers.Service):
         )
         response = await response_coro
         log_request(await get_tracking_id_from_coro(response_coro), "EditFavorites")
-        return _grpc_helpers.protobuf_to_dataclass(response, EditFavoritesResponse)
+        return self._convert_response(response, EditFavoritesResponse)
 
     @handle_aio_request_error("GetCountries")
     async def get_countries(
@@ -717,7 +1006,7 @@ class InstrumentsService(_grpc_helpers.Service):
         )
         response = await response_coro
         log_request(await get_tracking_id_from_coro(response_coro), "GetCountries")
-        return _grpc_helpers.protobuf_to_dataclass(response, GetCountriesResponse)
+        return self._convert_response(response, GetCountriesResponse)
 
     @handle_aio_request_error("FindInstrument")
     async def find_instrument(
@@ -741,7 +1030,7 @@ class InstrumentsService(_grpc_helpers.Service):
         )
         response = await response_coro
         log_request(await get_tracking_id_from_coro(response_coro), "FindInstrument")
-        return _grpc_helpers.protobuf_to_dataclass(response, FindInstrumentResponse)
+        return self._convert_response(response, FindInstrumentResponse)
 
     @handle_aio_request_error("GetBrands")
     async def get_brands(
@@ -756,7 +1045,7 @@ class InstrumentsService(_grpc_helpers.Service):
         )
         response = await response_coro
         log_request(await get_tracking_id_from_coro(response_coro), "GetBrands")
-        return _grpc_helpers.protobuf_to_dataclass(response, GetBrandsResponse)
+        return self._convert_response(response, GetBrandsResponse)
 
     @handle_aio_request_error("GetBrandBy")
     async def get_brands_by(self, id: str = "") -> Brand:
@@ -770,7 +1059,7 @@ class InstrumentsService(_grpc_helpers.Service):
         )
         response = await response_coro
         log_request(await get_tracking_id_from_coro(response_coro), "GetBrandBy")
-        return _grpc_helpers.protobuf_to_dataclass(response, Brand)
+        return self._convert_response(response, Brand)
 
 
 class MarketDataService(_grpc_helpers.Service):
@@ -802,7 +1091,40 @@ class MarketDataService(_grpc_helpers.Service):
         )
         response = await response_coro
         log_request(await get_tracking_id_from_coro(response_coro), "GetCandles")
-        return _grpc_helpers.protobuf_to_dataclass(response, GetCandlesResponse)
+        return self._convert_response(response, GetCandlesResponse)
+
+    @handle_aio_request_error("GetCandles")
+    async def get_candles_columns(
+        self,
+        *,
+        figi: str = "",
+        from_: Optional[datetime] = None,
+        to: Optional[datetime] = None,
+        interval: CandleInterval = CandleInterval(0),
+        instrument_id: str = "",
+        as_float: bool = False,
+    ) -> "HistoricCandleColumns":
+        from .columnar import (  # pylint:disable=import-outside-toplevel
+            candles_to_columns,
+        )
+
+        request = GetCandlesRequest()
+        request.figi = figi
+        request.instrument_id = instrument_id
+        if from_ is not None:
+            request.from_ = from_
+        if to is not None:
+            request.to = to
+        request.interval = interval
+        response_coro = self.stub.GetCandles(
+            request=_grpc_helpers.dataclass_to_protobuff(
+                request, marketdata_pb2.GetCandlesRequest()
+            ),
+            metadata=self.metadata,
+        )
+        response = await response_coro
+        log_request(await get_tracking_id_from_coro(response_coro), "GetCandles")
+        return candles_to_columns(response.candles, as_float=as_float)
 
     @handle_aio_request_error("GetLastPrices")
     async def get_last_prices(
@@ -825,7 +1147,7 @@ class MarketDataService(_grpc_helpers.Service):
         )
         response = await response_coro
         log_request(await get_tracking_id_from_coro(response_coro), "GetLastPrices")
-        return _grpc_helpers.protobuf_to_dataclass(response, GetLastPricesResponse)
+        return self._convert_response(response, GetLastPricesResponse)
 
     @handle_aio_request_error("GetOrderBook")
     async def get_order_book(
@@ -843,7 +1165,7 @@ class MarketDataService(_grpc_helpers.Service):
         )
         response = await response_coro
         log_request(await get_tracking_id_from_coro(response_coro), "GetOrderBook")
-        return _grpc_helpers.protobuf_to_dataclass(response, GetOrderBookResponse)
+        return self._convert_response(response, GetOrderBookResponse)
 
     @handle_aio_request_error("GetTradingStatus")
     async def get_trading_status(
@@ -860,7 +1182,7 @@ class MarketDataService(_grpc_helpers.Service):
         )
         response = await response_coro
         log_request(await get_tracking_id_from_coro(response_coro), "GetTradingStatus")
-        return _grpc_helpers.protobuf_to_dataclass(response, GetTradingStatusResponse)
+        return self._convert_response(response, GetTradingStatusResponse)
 
     @handle_aio_request_error("GetTradingStatuses")
     async def get_trading_statuses(
@@ -879,7 +1201,7 @@ class MarketDataService(_grpc_helpers.Service):
         log_request(
             await get_tracking_id_from_coro(response_coro), "GetTradingStatuses"
         )
-        return _grpc_helpers.protobuf_to_dataclass(response, GetTradingStatusesResponse)
+        return self._convert_response(response, GetTradingStatusesResponse)
 
     @handle_aio_request_error("GetLastTrades")
     async def get_last_trades(
@@ -905,7 +1227,7 @@ class MarketDataService(_grpc_helpers.Service):
         )
         response = await response_coro
         log_request(await get_tracking_id_from_coro(response_coro), "GetLastTrades")
-        return _grpc_helpers.protobuf_to_dataclass(response, GetLastTradesResponse)
+        return self._convert_response(response, GetLastTradesResponse)
 
     @handle_aio_request_error("GetClosePrices")
     async def get_close_prices(
@@ -924,7 +1246,7 @@ class MarketDataService(_grpc_helpers.Service):
         )
         response = await response_coro
         log_request(await get_tracking_id_from_coro(response_coro), "GetClosePrices")
-        return _grpc_helpers.protobuf_to_dataclass(response, GetClosePricesResponse)
+        return self._convert_response(response, GetClosePricesResponse)
 
 
 class MarketDataStreamService(_grpc_helpers.Service):
@@ -948,7 +1270,7 @@ class MarketDataStreamService(_grpc_helpers.Service):
             request_iterator=self._convert_market_data_stream_request(request_iterator),
             metadata=self.metadata,
         ):
-            yield _grpc_helpers.protobuf_to_dataclass(response, MarketDataResponse)
+            yield self._convert_response(response, MarketDataResponse)
 
 
 class OperationsService(_grpc_helpers.Service):
@@ -980,7 +1302,7 @@ class OperationsService(_grpc_helpers.Service):
         )
         response = await response_coro
         log_request(await get_tracking_id_from_coro(response_coro), "GetOperations")
-        return _grpc_helpers.protobuf_to_dataclass(response, OperationsResponse)
+        return self._convert_response(response, OperationsResponse)
 
     @handle_aio_request_error("GetPortfolio")
     async def get_portfolio(self, *, account_id: str = "") -> PortfolioResponse:
@@ -994,7 +1316,7 @@ class OperationsService(_grpc_helpers.Service):
         )
         response = await response_coro
         log_request(await get_tracking_id_from_coro(response_coro), "GetPortfolio")
-        return _grpc_helpers.protobuf_to_dataclass(response, PortfolioResponse)
+        return self._convert_response(response, PortfolioResponse)
 
     @handle_aio_request_error("GetPositions")
     async def get_positions(self, *, account_id: str = "") -> PositionsResponse:
@@ -1008,7 +1330,7 @@ class OperationsService(_grpc_helpers.Service):
         )
         response = await response_coro
         log_request(await get_tracking_id_from_coro(response_coro), "GetPositions")
-        return _grpc_helpers.protobuf_to_dataclass(response, PositionsResponse)
+        return self._convert_response(response, PositionsResponse)
 
     @handle_aio_request_error("GetWithdrawLimits")
     async def get_withdraw_limits(
@@ -1024,7 +1346,7 @@ class OperationsService(_grpc_helpers.Service):
         )
         response = await response_coro
         log_request(await get_tracking_id_from_coro(response_coro), "GetWithdrawLimits")
-        return _grpc_helpers.protobuf_to_dataclass(response, WithdrawLimitsResponse)
+        return self._convert_response(response, WithdrawLimitsResponse)
 
     @handle_aio_request_error("GetBrokerReport")
     async def get_broker_report(
@@ -1046,7 +1368,7 @@ class OperationsService(_grpc_helpers.Service):
         )
         response = await response_coro
         log_request(await get_tracking_id_from_coro(response_coro), "GetBrokerReport")
-        return _grpc_helpers.protobuf_to_dataclass(response, BrokerReportResponse)
+        return self._convert_response(response, BrokerReportResponse)
 
     @handle_aio_request_error("GetDividendsForeignIssuer")
     async def get_dividends_foreign_issuer(
@@ -1076,9 +1398,7 @@ class OperationsService(_grpc_helpers.Service):
         log_request(
             await get_tracking_id_from_coro(response_coro), "GetDividendsForeignIssuer"
         )
-        return _grpc_helpers.protobuf_to_dataclass(
-            response, GetDividendsForeignIssuerResponse
-        )
+        return self._convert_response(response, GetDividendsForeignIssuerResponse)
 
     @handle_aio_request_error("GetOperationsByCursor")
     async def get_operations_by_cursor(
@@ -1095,9 +1415,7 @@ class OperationsService(_grpc_helpers.Service):
         log_request(
             await get_tracking_id_from_coro(response_coro), "GetOperationsByCursor"
         )
-        return _grpc_helpers.protobuf_to_dataclass(
-            response, GetOperationsByCursorResponse
-        )
+        return self._convert_response(response, GetOperationsByCursorResponse)
 
 
 class OperationsStreamService(_grpc_helpers.Service):
@@ -1118,7 +1436,7 @@ class OperationsStreamService(_grpc_helpers.Service):
             ),
             metadata=self.metadata,
         ):
-            yield _grpc_helpers.protobuf_to_dataclass(response, PortfolioStreamResponse)
+            yield self._convert_response(response, PortfolioStreamResponse)
 
     @handle_aio_request_error_gen("PositionsStream")
     async def positions_stream(
@@ -1135,7 +1453,7 @@ class OperationsStreamService(_grpc_helpers.Service):
             ),
             metadata=self.metadata,
         ):
-            yield _grpc_helpers.protobuf_to_dataclass(response, PositionsStreamResponse)
+            yield self._convert_response(response, PositionsStreamResponse)
 
 
 class OrdersStreamService(_grpc_helpers.Service):
@@ -1156,7 +1474,7 @@ class OrdersStreamService(_grpc_helpers.Service):
             ),
             metadata=self.metadata,
         ):
-            yield _grpc_helpers.protobuf_to_dataclass(response, TradesStreamResponse)
+            yield self._convert_response(response, TradesStreamResponse)
 
 
 class OrdersService(_grpc_helpers.Service):
@@ -1193,7 +1511,19 @@ class OrdersService(_grpc_helpers.Service):
         )
         response = await response_coro
         log_request(await get_tracking_id_from_coro(response_coro), "PostOrder")
-        return _grpc_helpers.protobuf_to_dataclass(response, PostOrderResponse)
+        return self._convert_response(response, PostOrderResponse)
+
+    @handle_aio_request_error("PostOrder")
+    async def post_order_from_template(
+        self, template: _grpc_helpers.RequestTemplate[PostOrderRequest], **changes: Any
+    ) -> PostOrderResponse:
+        response_coro = self.stub.PostOrder(
+            request=template.encode(orders_pb2.PostOrderRequest, **changes),
+            metadata=self.metadata,
+        )
+        response = await response_coro
+        log_request(await get_tracking_id_from_coro(response_coro), "PostOrder")
+        return self._convert_response(response, PostOrderResponse)
 
     @handle_aio_request_error("CancelOrder")
     async def cancel_order(
@@ -1210,7 +1540,7 @@ class OrdersService(_grpc_helpers.Service):
         )
         response = await response_coro
         log_request(await get_tracking_id_from_coro(response_coro), "CancelOrder")
-        return _grpc_helpers.protobuf_to_dataclass(response, CancelOrderResponse)
+        return self._convert_response(response, CancelOrderResponse)
 
     @handle_aio_request_error("GetOrderState")
     async def get_order_state(
@@ -1227,7 +1557,7 @@ class OrdersService(_grpc_helpers.Service):
         )
         response = await response_coro
         log_request(await get_tracking_id_from_coro(response_coro), "GetOrderState")
-        return _grpc_helpers.protobuf_to_dataclass(response, OrderState)
+        return self._convert_response(response, OrderState)
 
     @handle_aio_request_error("GetOrders")
     async def get_orders(self, *, account_id: str = "") -> GetOrdersResponse:
@@ -1241,7 +1571,7 @@ class OrdersService(_grpc_helpers.Service):
         )
         response = await response_coro
         log_request(await get_tracking_id_from_coro(response_coro), "GetOrders")
-        return _grpc_helpers.protobuf_to_dataclass(response, GetOrdersResponse)
+        return self._convert_response(response, GetOrdersResponse)
 
     @handle_aio_request_error("ReplaceOrder")
     async def replace_order(self, request: ReplaceOrderRequest) -> PostOrderResponse:
@@ -1253,7 +1583,21 @@ class OrdersService(_grpc_helpers.Service):
         )
         response = await response_coro
         log_request(await get_tracking_id_from_coro(response_coro), "ReplaceOrder")
-        return _grpc_helpers.protobuf_to_dataclass(response, PostOrderResponse)
+        return self._convert_response(response, PostOrderResponse)
+
+    @handle_aio_request_error("ReplaceOrder")
+    async def replace_order_from_template(
+        self,
+        template: _grpc_helpers.RequestTemplate[ReplaceOrderRequest],
+        **changes: Any,
+    ) -> PostOrderResponse:
+        response_coro = self.stub.ReplaceOrder(
+            request=template.encode(orders_pb2.ReplaceOrderRequest, **changes),
+            metadata=self.metadata,
+        )
+        response = await response_coro
+        log_request(await get_tracking_id_from_coro(response_coro), "ReplaceOrder")
+        return self._convert_response(response, PostOrderResponse)
 
 
 class UsersService(_grpc_helpers.Service):
@@ -1270,7 +1614,7 @@ class UsersService(_grpc_helpers.Service):
         )
         response = await response_coro
         log_request(await get_tracking_id_from_coro(response_coro), "GetAccounts")
-        return _grpc_helpers.protobuf_to_dataclass(response, GetAccountsResponse)
+        return self._convert_response(response, GetAccountsResponse)
 
     @handle_aio_request_error("GetMarginAttributes")
     async def get_margin_attributes(
@@ -1288,9 +1632,7 @@ class UsersService(_grpc_helpers.Service):
         log_request(
             await get_tracking_id_from_coro(response_coro), "GetMarginAttributes"
         )
-        return _grpc_helpers.protobuf_to_dataclass(
-            response, GetMarginAttributesResponse
-        )
+        return self._convert_response(response, GetMarginAttributesResponse)
 
     @handle_aio_request_error("GetUserTariff")
     async def get_user_tariff(self) -> GetUserTariffResponse:
@@ -1303,7 +1645,7 @@ class UsersService(_grpc_helpers.Service):
         )
         response = await response_coro
         log_request(await get_tracking_id_from_coro(response_coro), "GetUserTariff")
-        return _grpc_helpers.protobuf_to_dataclass(response, GetUserTariffResponse)
+        return self._convert_response(response, GetUserTariffResponse)
 
     @handle_aio_request_error("GetInfo")
     async def get_info(self) -> GetInfoResponse:
@@ -1316,7 +1658,7 @@ class UsersService(_grpc_helpers.Service):
         )
         response = await response_coro
         log_request(await get_tracking_id_from_coro(response_coro), "GetInfo")
-        return _grpc_helpers.protobuf_to_dataclass(response, GetInfoResponse)
+        return self._convert_response(response, GetInfoResponse)
 
 
 class SandboxService(_grpc_helpers.Service):
@@ -1335,7 +1677,7 @@ class SandboxService(_grpc_helpers.Service):
         log_request(
             await get_tracking_id_from_coro(response_coro), "OpenSandboxAccount"
         )
-        return _grpc_helpers.protobuf_to_dataclass(response, OpenSandboxAccountResponse)
+        return self._convert_response(response, OpenSandboxAccountResponse)
 
     @handle_aio_request_error("GetSandboxAccounts")
     async def get_sandbox_accounts(self) -> GetAccountsResponse:
@@ -1350,7 +1692,7 @@ class SandboxService(_grpc_helpers.Service):
         log_request(
             await get_tracking_id_from_coro(response_coro), "GetSandboxAccounts"
         )
-        return _grpc_helpers.protobuf_to_dataclass(response, GetAccountsResponse)
+        return self._convert_response(response, GetAccountsResponse)
 
     @handle_aio_request_error("CloseSandboxAccount")
     async def close_sandbox_account(
@@ -1368,9 +1710,7 @@ class SandboxService(_grpc_helpers.Service):
         log_request(
             await get_tracking_id_from_coro(response_coro), "CloseSandboxAccount"
         )
-        return _grpc_helpers.protobuf_to_dataclass(
-            response, CloseSandboxAccountResponse
-        )
+        return self._convert_response(response, CloseSandboxAccountResponse)
 
     @handle_aio_request_error("PostSandboxOrder")
     async def post_sandbox_order(
@@ -1403,7 +1743,7 @@ class SandboxService(_grpc_helpers.Service):
         )
         response = await response_coro
         log_request(await get_tracking_id_from_coro(response_coro), "PostSandboxOrder")
-        return _grpc_helpers.protobuf_to_dataclass(response, PostOrderResponse)
+        return self._convert_response(response, PostOrderResponse)
 
     @handle_aio_request_error("ReplaceSandboxOrder")
     async def replace_sandbox_order(
@@ -1420,7 +1760,7 @@ class SandboxService(_grpc_helpers.Service):
         log_request(
             await get_tracking_id_from_coro(response_coro), "ReplaceSandboxOrder"
         )
-        return _grpc_helpers.protobuf_to_dataclass(response, PostOrderResponse)
+        return self._convert_response(response, PostOrderResponse)
 
     @handle_aio_request_error("GetSandboxOrders")
     async def get_sandbox_orders(self, *, account_id: str = "") -> GetOrdersResponse:
@@ -1434,7 +1774,7 @@ class SandboxService(_grpc_helpers.Service):
         )
         response = await response_coro
         log_request(await get_tracking_id_from_coro(response_coro), "GetSandboxOrders")
-        return _grpc_helpers.protobuf_to_dataclass(response, GetOrdersResponse)
+        return self._convert_response(response, GetOrdersResponse)
 
     @handle_aio_request_error("CancelSandboxOrder")
     async def cancel_sandbox_order(
@@ -1453,7 +1793,7 @@ class SandboxService(_grpc_helpers.Service):
         log_request(
             await get_tracking_id_from_coro(response_coro), "CancelSandboxOrder"
         )
-        return _grpc_helpers.protobuf_to_dataclass(response, CancelOrderResponse)
+        return self._convert_response(response, CancelOrderResponse)
 
     @handle_aio_request_error("GetSandboxOrderState")
     async def get_sandbox_order_state(
@@ -1472,7 +1812,7 @@ class SandboxService(_grpc_helpers.Service):
         log_request(
             await get_tracking_id_from_coro(response_coro), "GetSandboxOrderState"
         )
-        return _grpc_helpers.protobuf_to_dataclass(response, OrderState)
+        return self._convert_response(response, OrderState)
 
     @handle_aio_request_error("GetSandboxPositions")
     async def get_sandbox_positions(self, *, account_id: str = "") -> PositionsResponse:
@@ -1488,7 +1828,7 @@ class SandboxService(_grpc_helpers.Service):
         log_request(
             await get_tracking_id_from_coro(response_coro), "GetSandboxPositions"
         )
-        return _grpc_helpers.protobuf_to_dataclass(response, PositionsResponse)
+        return self._convert_response(response, PositionsResponse)
 
     @handle_aio_request_error("GetSandboxOperations")
     async def get_sandbox_operations(
@@ -1518,7 +1858,7 @@ class SandboxService(_grpc_helpers.Service):
         log_request(
             await get_tracking_id_from_coro(response_coro), "GetSandboxOperations"
         )
-        return _grpc_helpers.protobuf_to_dataclass(response, OperationsResponse)
+        return self._convert_response(response, OperationsResponse)
 
     @handle_aio_request_error("GetSandboxPortfolio")
     async def get_sandbox_portfolio(self, *, account_id: str = "") -> PortfolioResponse:
@@ -1534,7 +1874,7 @@ class SandboxService(_grpc_helpers.Service):
         log_request(
             await get_tracking_id_from_coro(response_coro), "GetSandboxPortfolio"
         )
-        return _grpc_helpers.protobuf_to_dataclass(response, PortfolioResponse)
+        return self._convert_response(response, PortfolioResponse)
 
     @handle_aio_request_error("SandboxPayIn")
     async def sandbox_pay_in(
@@ -1552,7 +1892,7 @@ class SandboxService(_grpc_helpers.Service):
         )
         response = await response_coro
         log_request(await get_tracking_id_from_coro(response_coro), "SandboxPayIn")
-        return _grpc_helpers.protobuf_to_dataclass(response, SandboxPayInResponse)
+        return self._convert_response(response, SandboxPayInResponse)
 
     @handle_aio_request_error("GetSandboxWithdrawLimits")
     async def get_sandbox_withdraw_limits(
@@ -1572,7 +1912,7 @@ class SandboxService(_grpc_helpers.Service):
         log_request(
             await get_tracking_id_from_coro(response_coro), "GetSandboxWithdrawLimits"
         )
-        return _grpc_helpers.protobuf_to_dataclass(response, WithdrawLimitsResponse)
+        return self._convert_response(response, WithdrawLimitsResponse)
 
 
 class StopOrdersService(_grpc_helpers.Service):
@@ -1615,7 +1955,21 @@ class StopOrdersService(_grpc_helpers.Service):
         )
         response = await response_coro
         log_request(await get_tracking_id_from_coro(response_coro), "PostStopOrder")
-        return _grpc_helpers.protobuf_to_dataclass(response, PostStopOrderResponse)
+        return self._convert_response(response, PostStopOrderResponse)
+
+    @handle_aio_request_error("PostStopOrder")
+    async def post_stop_order_from_template(
+        self,
+        template: _grpc_helpers.RequestTemplate[PostStopOrderRequest],
+        **changes: Any,
+    ) -> PostStopOrderResponse:
+        response_coro = self.stub.PostStopOrder(
+            request=template.encode(stoporders_pb2.PostStopOrderRequest, **changes),
+            metadata=self.metadata,
+        )
+        response = await response_coro
+        log_request(await get_tracking_id_from_coro(response_coro), "PostStopOrder")
+        return self._convert_response(response, PostStopOrderResponse)
 
     @handle_aio_request_error("GetStopOrders")
     async def get_stop_orders(self, *, account_id: str = "") -> GetStopOrdersResponse:
@@ -1629,7 +1983,7 @@ class StopOrdersService(_grpc_helpers.Service):
         )
         response = await response_coro
         log_request(await get_tracking_id_from_coro(response_coro), "GetStopOrders")
-        return _grpc_helpers.protobuf_to_dataclass(response, GetStopOrdersResponse)
+        return self._convert_response(response, GetStopOrdersResponse)
 
     @handle_aio_request_error("CancelStopOrder")
     async def cancel_stop_order(
@@ -1646,4 +2000,4 @@ class StopOrdersService(_grpc_helpers.Service):
         )
         response = await response_coro
         log_request(await get_tracking_id_from_coro(response_coro), "CancelStopOrder")
-        return _grpc_helpers.protobuf_to_dataclass(response, CancelStopOrderResponse)
+        return self._convert_response(response, CancelStopOrderResponse)
@@ -0,0 +1,154 @@
+import asyncio
+import logging
+from typing import (
+    TYPE_CHECKING,
+    Awaitable,
+    Callable,
+    Dict,
+    Generic,
+    List,
+    Mapping,
+    Optional,
+    Set,
+)
+
+from tinkoff.invest._grpc_helpers import check_response_format
+from tinkoff.invest.batching.batch import (
+    T,
+    fail_futures,
+    index_by_instrument,
+    resolve_futures,
+)
+from tinkoff.invest.batching.batching_settings import BatchingSettings
+from tinkoff.invest.schemas import GetTradingStatusResponse, LastPrice
+
+if TYPE_CHECKING:
+    from tinkoff.invest.async_services import MarketDataService
+
+logger = logging.getLogger(__name__)
+
+
+class _AsyncBatch(Generic[T]):
+    def __init__(
+        self,
+        fetch: Callable[[List[str]], Awaitable[Mapping[str, T]]],
+        settings: BatchingSettings,
+        get_semaphore: Callable[[], asyncio.Semaphore],
+    ):
+        self._fetch = fetch
+        self._settings = settings
+        self._get_semaphore = get_semaphore
+        self._pending: Dict[str, List["asyncio.Future[T]"]] = {}
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._tasks: Set["asyncio.Task[None]"] = set()
+        self._closed = False
+
+    def submit(self, instrument_id: str) -> "asyncio.Future[T]":
+        if self._closed:
+            raise RuntimeError("Batcher is closed")
+        loop = asyncio.get_running_loop()
+        future: "asyncio.Future[T]" = loop.create_future()
+        self._pending.setdefault(instrument_id, []).append(future)
+        if len(self._pending) >= self._settings.max_batch_size:
+            self.flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(
+                self._settings.window.total_seconds(), self.flush
+            )
+        return future
+
+    def flush(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if not self._pending:
+            return
+        pending, self._pending = self._pending, {}
+        task = asyncio.ensure_future(self._resolve(pending))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def close(self) -> None:
+        self._closed = True
+        self.flush()
+        if self._tasks:
+            await asyncio.wait(self._tasks)
+
+    async def _resolve(self, pending: Dict[str, List["asyncio.Future[T]"]]) -> None:
+        async with self._get_semaphore():
+            logger.debug("Sending batch of %s instruments", len(pending))
+            try:
+                results = await self._fetch(list(pending))
+            except Exception as error:  # pylint:disable=broad-except
+                fail_futures(pending, error)
+            else:
+                resolve_futures(pending, results)
+
+
+class AsyncMarketDataBatcher:
+    """Joins single instrument requests of many coroutines into batched calls.
+
+    ```python
+    async with AsyncClient(TOKEN) as client:
+        async with AsyncMarketDataBatcher(client.market_data) as batcher:
+            print(await batcher.get_last_price("BBG004730N88"))
+    ```
+
+    Instruments are given by figi or instrument uid. `KeyError` is raised if
+    the response has no data for the instrument.
+    """
+
+    def __init__(
+        self,
+        market_data: "MarketDataService",
+        settings: Optional[BatchingSettings] = None,
+    ):
+        check_response_format(market_data.response_format, type(self).__name__)
+        self._market_data = market_data
+        self._settings = settings or BatchingSettings()
+        # created on the loop of the first batch, python < 3.10 binds it to a loop
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._last_prices: _AsyncBatch[LastPrice] = _AsyncBatch(
+            self._fetch_last_prices, self._settings, self._get_semaphore
+        )
+        self._trading_statuses: _AsyncBatch[GetTradingStatusResponse] = _AsyncBatch(
+            self._fetch_trading_statuses, self._settings, self._get_semaphore
+        )
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self._settings.max_concurrent_batches)
+        return self._semaphore
+
+    async def __aenter__(self) -> "AsyncMarketDataBatcher":
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+        return False
+
+    def get_last_price(self, instrument_id: str) -> "asyncio.Future[LastPrice]":
+        return self._last_prices.submit(instrument_id)
+
+    def get_trading_status(
+        self, instrument_id: str
+    ) -> "asyncio.Future[GetTradingStatusResponse]":
+        return self._trading_statuses.submit(instrument_id)
+
+    async def close(self) -> None:
+        """Send pending requests and wait for their responses."""
+        await asyncio.gather(self._last_prices.close(), self._trading_statuses.close())
+
+    async def _fetch_last_prices(
+        self, instrument_ids: List[str]
+    ) -> Dict[str, LastPrice]:
+        response = await self._market_data.get_last_prices(instrument_id=instrument_ids)
+        return index_by_instrument(response.last_prices)
+
+    async def _fetch_trading_statuses(
+        self, instrument_ids: List[str]
+    ) -> Dict[str, GetTradingStatusResponse]:
+        response = await self._market_data.get_trading_statuses(
+            instrument_ids=instrument_ids
+        )
+        return index_by_instrument(response.trading_statuses)
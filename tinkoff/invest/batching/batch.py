@@ -0,0 +1,42 @@
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Tuple, TypeVar
+
+T = TypeVar("T")
+
+
+def index_by_instrument(items: Iterable[T]) -> Dict[str, T]:
+    """Indexes items of a batched response by their figi and instrument uid."""
+    return {
+        key: item
+        for item in items
+        for key in (item.figi, item.instrument_uid)  # type: ignore[attr-defined]
+        if key
+    }
+
+
+def resolve_futures(
+    pending: Mapping[str, List[Any]], results: Mapping[str, Any]
+) -> None:
+    """Fans results of a batch out to the futures waiting for them.
+
+    Futures of instruments missing in the response get `KeyError`.
+    """
+    for instrument_id, future in _waiting(pending):
+        if instrument_id in results:
+            future.set_result(results[instrument_id])
+        else:
+            future.set_exception(KeyError(instrument_id))
+
+
+def fail_futures(pending: Mapping[str, List[Any]], error: BaseException) -> None:
+    for _, future in _waiting(pending):
+        future.set_exception(error)
+
+
+def _waiting(pending: Mapping[str, List[Any]]) -> Iterator[Tuple[str, Any]]:
+    # futures cancelled by callers are done already
+    return (
+        (instrument_id, future)
+        for instrument_id, futures in pending.items()
+        for future in futures
+        if not future.done()
+    )
@@ -0,0 +1,11 @@
+import dataclasses
+from datetime import timedelta
+
+
+@dataclasses.dataclass()
+class BatchingSettings:
+    # Requests made within the window are sent in one batch
+    window: timedelta = timedelta(milliseconds=2)
+    # A batch is sent at once when it has this many instruments
+    max_batch_size: int = 100
+    max_concurrent_batches: int = 4
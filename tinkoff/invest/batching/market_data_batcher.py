@@ -0,0 +1,168 @@
+import logging
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import TYPE_CHECKING, Callable, Dict, Generic, List, Mapping, Optional
+
+from tinkoff.invest._grpc_helpers import check_response_format
+from tinkoff.invest.batching.batch import (
+    T,
+    fail_futures,
+    index_by_instrument,
+    resolve_futures,
+)
+from tinkoff.invest.batching.batching_settings import BatchingSettings
+from tinkoff.invest.schemas import GetTradingStatusResponse, LastPrice
+
+if TYPE_CHECKING:
+    from tinkoff.invest.services import MarketDataService
+
+logger = logging.getLogger(__name__)
+
+
+class _Batch(Generic[T]):
+    """Collects instruments of a request and sends them in batches.
+
+    A single flusher thread sends a batch when its window is over.
+    """
+
+    def __init__(
+        self,
+        fetch: Callable[[List[str]], Mapping[str, T]],
+        settings: BatchingSettings,
+        executor: ThreadPoolExecutor,
+    ):
+        self._fetch = fetch
+        self._settings = settings
+        self._executor = executor
+        self._condition = threading.Condition()
+        self._pending: Dict[str, List["Future[T]"]] = {}
+        # monotonic time the pending batch is sent at
+        self._deadline: Optional[float] = None
+        self._closed = False
+        self._flusher = threading.Thread(
+            target=self._run_flusher, name="market-data-batcher", daemon=True
+        )
+        self._flusher.start()
+
+    def submit(self, instrument_id: str) -> "Future[T]":
+        future: "Future[T]" = Future()
+        with self._condition:
+            if self._closed:
+                raise RuntimeError("Batcher is closed")
+            self._pending.setdefault(instrument_id, []).append(future)
+            if len(self._pending) >= self._settings.max_batch_size:
+                self._send_pending()
+            elif self._deadline is None:
+                self._deadline = (
+                    time.monotonic() + self._settings.window.total_seconds()
+                )
+                self._condition.notify()
+        return future
+
+    def close(self) -> None:
+        """Send pending instruments and stop the flusher thread."""
+        with self._condition:
+            self._closed = True
+            self._send_pending()
+            self._condition.notify()
+        self._flusher.join()
+
+    def _run_flusher(self) -> None:
+        with self._condition:
+            while self._wait_for_deadline():
+                self._send_pending()
+
+    def _wait_for_deadline(self) -> bool:
+        """Wait until the pending batch is due, return False once closed."""
+        while not self._closed:
+            if self._deadline is None:
+                self._condition.wait()
+            elif self._deadline <= time.monotonic():
+                return True
+            else:
+                self._condition.wait(self._deadline - time.monotonic())
+        return False
+
+    def _send_pending(self) -> None:
+        # called under the lock, so the executor is not shut down yet
+        pending, self._pending = self._pending, {}
+        self._deadline = None
+        if pending:
+            self._executor.submit(self._resolve, pending)
+
+    def _resolve(self, pending: Dict[str, List["Future[T]"]]) -> None:
+        logger.debug("Sending batch of %s instruments", len(pending))
+        try:
+            results = self._fetch(list(pending))
+        except Exception as error:  # pylint:disable=broad-except
+            fail_futures(pending, error)
+        else:
+            resolve_futures(pending, results)
+
+
+class MarketDataBatcher:
+    """Joins single instrument requests of many callers into batched calls.
+
+    ```python
+    with Client(TOKEN) as client:
+        with MarketDataBatcher(client.market_data) as batcher:
+            future = batcher.get_last_price("BBG004730N88")
+            print(future.result())
+    ```
+
+    Instruments are given by figi or instrument uid. A future fails with
+    `KeyError` if the response has no data for its instrument.
+    """
+
+    def __init__(
+        self,
+        market_data: "MarketDataService",
+        settings: Optional[BatchingSettings] = None,
+    ):
+        check_response_format(market_data.response_format, type(self).__name__)
+        self._market_data = market_data
+        self._settings = settings or BatchingSettings()
+        self._executor = ThreadPoolExecutor(
+            max_workers=self._settings.max_concurrent_batches
+        )
+        self._last_prices: _Batch[LastPrice] = _Batch(
+            self._fetch_last_prices, self._settings, self._executor
+        )
+        self._trading_statuses: _Batch[GetTradingStatusResponse] = _Batch(
+            self._fetch_trading_statuses, self._settings, self._executor
+        )
+
+    def __enter__(self) -> "MarketDataBatcher":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+        return False
+
+    def get_last_price(self, instrument_id: str) -> "Future[LastPrice]":
+        return self._last_prices.submit(instrument_id)
+
+    def get_trading_status(
+        self, instrument_id: str
+    ) -> "Future[GetTradingStatusResponse]":
+        return self._trading_statuses.submit(instrument_id)
+
+    def close(self) -> None:
+        """Send pending requests and wait for their responses.
+
+        Requests made after closing raise `RuntimeError`.
+        """
+        self._last_prices.close()
+        self._trading_statuses.close()
+        self._executor.shutdown(wait=True)
+
+    def _fetch_last_prices(self, instrument_ids: List[str]) -> Dict[str, LastPrice]:
+        response = self._market_data.get_last_prices(instrument_id=instrument_ids)
+        return index_by_instrument(response.last_prices)
+
+    def _fetch_trading_statuses(
+        self, instrument_ids: List[str]
+    ) -> Dict[str, GetTradingStatusResponse]:
+        response = self._market_data.get_trading_statuses(instrument_ids=instrument_ids)
+        return index_by_instrument(response.trading_statuses)
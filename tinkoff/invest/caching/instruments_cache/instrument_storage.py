@@ -1,42 +1,100 @@
-import logging
+import dataclasses
+import itertools
+import sys
+import threading
 from dataclasses import replace
-from typing import Dict, Generic, Tuple, TypeVar, cast
+from typing import (
+    Any,
+    Dict,
+    Generic,
+    Iterable,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    TypeVar,
+    cast,
+)
 
-from tinkoff.invest import InstrumentIdType
+from tinkoff.invest import InstrumentIdType, _grpc_helpers
 from tinkoff.invest.caching.instruments_cache.models import (
     InstrumentResponse,
+    InstrumentsMemoryUsage,
     InstrumentsResponse,
 )
 
-logger = logging.getLogger(__name__)
-
-
 TInstrumentResponse = TypeVar("TInstrumentResponse", bound=InstrumentResponse)
 TInstrumentsResponse = TypeVar("TInstrumentsResponse", bound=InstrumentsResponse)
 
 
+def _get_size(value: Any, seen: Set[int]) -> int:
+    if id(value) in seen:
+        return 0
+    seen.add(id(value))
+    size = sys.getsizeof(value)
+    children: Iterable[Any] = ()
+    if isinstance(value, _grpc_helpers.MessageView):
+        # views share the message of the response, it is counted once
+        pass
+    elif dataclasses.is_dataclass(value):
+        if hasattr(value, "__dict__"):
+            size += sys.getsizeof(value.__dict__)
+        children = (getattr(value, field.name) for field in dataclasses.fields(value))
+    elif isinstance(value, (list, tuple)):
+        children = value
+    elif isinstance(value, dict):
+        children = itertools.chain.from_iterable(value.items())
+    return size + sum(_get_size(child, seen) for child in children)
+
+
 class InstrumentStorage(Generic[TInstrumentResponse, TInstrumentsResponse]):
     def __init__(self, instruments_response: TInstrumentsResponse):
         self._instruments_response = instruments_response
+        self._lock = threading.Lock()
+        self._memory_usage: Optional[InstrumentsMemoryUsage] = None
+        # indexes keep positions of instruments, so views loaded from
+        # a snapshot are replaced with their dataclasses once decoded
+        self._instruments: List[Any] = list(self._instruments_response.instruments)
+        ids = self._instruments
+        if isinstance(instruments_response, _grpc_helpers.MessageView):
+            # ids are read from the message without decoding the views
+            ids = instruments_response.protobuf.instruments
 
-        self._instrument_by_class_code_figi: Dict[
-            Tuple[str, str], InstrumentResponse
-        ] = {
-            (instrument.class_code, instrument.figi): instrument
-            for instrument in self._instruments_response.instruments
-        }
-        self._instrument_by_class_code_ticker: Dict[
-            Tuple[str, str], InstrumentResponse
-        ] = {
-            (instrument.class_code, instrument.ticker): instrument
-            for instrument in self._instruments_response.instruments
-        }
-        self._instrument_by_class_code_uid: Dict[
-            Tuple[str, str], InstrumentResponse
-        ] = {
-            (instrument.class_code, instrument.uid): instrument
-            for instrument in self._instruments_response.instruments
-        }
+        self._instrument_by_class_code_figi: Dict[Tuple[str, str], int] = {}
+        self._instrument_by_class_code_ticker: Dict[Tuple[str, str], int] = {}
+        self._instrument_by_class_code_uid: Dict[Tuple[str, str], int] = {}
+        instrument_by_figi: Dict[str, int] = {}
+        instrument_by_uid: Dict[str, int] = {}
+        instrument_by_position_uid: Dict[str, int] = {}
+        # an isin is shared by instruments of different class codes
+        self._instruments_by_isin: Dict[str, List[int]] = {}
+        class_codes = set()
+        for position, ids_ in enumerate(ids):
+            class_codes.add(ids_.class_code)
+            self._instrument_by_class_code_figi[(ids_.class_code, ids_.figi)] = position
+            self._instrument_by_class_code_ticker[
+                (ids_.class_code, ids_.ticker)
+            ] = position
+            self._instrument_by_class_code_uid[(ids_.class_code, ids_.uid)] = position
+            instrument_by_figi[ids_.figi] = position
+            instrument_by_uid[ids_.uid] = position
+            instrument_by_position_uid[ids_.position_uid] = position
+            # futures have no isin
+            self._instruments_by_isin.setdefault(getattr(ids_, "isin", ""), []).append(
+                position
+            )
+        # instruments without an id are not found by it
+        for index in (
+            instrument_by_figi,
+            instrument_by_uid,
+            instrument_by_position_uid,
+            self._instruments_by_isin,
+        ):
+            index.pop("", None)
+        for class_code in class_codes:
+            self._instrument_by_class_code_figi.pop((class_code, ""), None)
+            self._instrument_by_class_code_ticker.pop((class_code, ""), None)
+            self._instrument_by_class_code_uid.pop((class_code, ""), None)
 
         # fmt: off
         self._instrument_by_class_code_id_index = {
@@ -49,22 +107,83 @@ class InstrumentStorage(Generic[TInstrumentResponse, TInstrumentsResponse]):
             InstrumentIdType.INSTRUMENT_ID_TYPE_UID:
                 self._instrument_by_class_code_uid,
         }
+        # tickers are unique only within a class code
+        self._instrument_by_id_index = {
+            InstrumentIdType.INSTRUMENT_ID_UNSPECIFIED: instrument_by_figi,
+            InstrumentIdType.INSTRUMENT_ID_TYPE_FIGI: instrument_by_figi,
+            InstrumentIdType.INSTRUMENT_ID_TYPE_UID: instrument_by_uid,
+            InstrumentIdType.INSTRUMENT_ID_TYPE_POSITION_UID:
+                instrument_by_position_uid,
+        }
         # fmt: on
 
+    def _get_instrument(self, position: int) -> TInstrumentResponse:
+        instrument = self._instruments[position]
+        if isinstance(instrument, _grpc_helpers.MessageView):
+            instrument = self._instruments[position] = instrument.to_dataclass()
+            self._memory_usage = None
+        return cast(TInstrumentResponse, instrument)
+
+    def _get_index_and_keys(
+        self, id_type: InstrumentIdType, class_code: str, ids: Iterable[str]
+    ) -> Tuple[Dict[Any, int], List[Tuple[str, Any]]]:
+        if class_code and id_type in self._instrument_by_class_code_id_index:
+            return self._instrument_by_class_code_id_index[id_type], [
+                (id_, (class_code, id_)) for id_ in ids
+            ]
+        return self._instrument_by_id_index[id_type], [(id_, id_) for id_ in ids]
+
     def get(
         self, *, id_type: InstrumentIdType, class_code: str, id: str
     ) -> TInstrumentResponse:
-        logger.debug(
-            "Cache request id_type=%s, class_code=%s, id=%s", id_type, class_code, id
-        )
-        instrument_by_class_code_id = self._instrument_by_class_code_id_index[id_type]
-        logger.debug(
-            "Index for %s found: \n%s", id_type, instrument_by_class_code_id.keys()
-        )
-        key = (class_code, id)
-        logger.debug("Cache request key=%s", key)
+        """Without class_code, the instrument is found by figi, uid or position_uid."""
+        index, ((_, key),) = self._get_index_and_keys(id_type, class_code, [id])
+        return self._get_instrument(index[key])
 
-        return cast(TInstrumentResponse, instrument_by_class_code_id[key])
+    def get_many(
+        self, *, id_type: InstrumentIdType, ids: Iterable[str], class_code: str = ""
+    ) -> Dict[str, TInstrumentResponse]:
+        """Instruments by the given ids, unknown ids are omitted."""
+        index, keys = self._get_index_and_keys(id_type, class_code, ids)
+        return {
+            id_: self._get_instrument(index[key]) for id_, key in keys if key in index
+        }
+
+    def get_by_isin(self, isin: str) -> List[TInstrumentResponse]:
+        """Instruments of all class codes with the isin, empty if it is unknown."""
+        return [
+            self._get_instrument(position)
+            for position in self._instruments_by_isin.get(isin, [])
+        ]
 
     def get_instruments_response(self) -> TInstrumentsResponse:
-        return replace(self._instruments_response, **{})
+        # responses loaded from a snapshot are decoded once they are needed
+        with self._lock:
+            if isinstance(self._instruments_response, _grpc_helpers.MessageView):
+                self._instruments_response = _grpc_helpers.materialize(
+                    self._instruments_response
+                )
+                self._instruments = list(self._instruments_response.instruments)
+                self._memory_usage = None
+            instruments_response = self._instruments_response
+        return replace(instruments_response, **{})
+
+    def get_memory_usage(self) -> InstrumentsMemoryUsage:
+        if self._memory_usage is None:
+            seen: Set[int] = set()
+            size_bytes = _get_size(self._instruments_response, seen) + sum(
+                _get_size(index, seen)
+                for index in (
+                    self._instruments,
+                    self._instrument_by_class_code_id_index,
+                    self._instrument_by_id_index,
+                    self._instruments_by_isin,
+                )
+            )
+            if isinstance(self._instruments_response, _grpc_helpers.MessageView):
+                size_bytes += self._instruments_response.protobuf.ByteSize()
+            self._memory_usage = InstrumentsMemoryUsage(
+                instruments=len(self._instruments_response.instruments),
+                size_bytes=size_bytes,
+            )
+        return self._memory_usage
@@ -1,5 +1,8 @@
 import logging
-from typing import cast
+import threading
+import time
+from datetime import timedelta
+from typing import Dict, Iterable, List, Optional, Set, Tuple, cast
 
 from tinkoff.invest import (
     Bond,
@@ -16,22 +19,27 @@ from tinkoff.invest import (
     FuturesResponse,
     InstrumentIdType,
     InstrumentStatus,
+    InstrumentType,
     Share,
     ShareResponse,
     SharesResponse,
 )
+from tinkoff.invest._grpc_helpers import check_response_format
 from tinkoff.invest.caching.instruments_cache.instrument_storage import (
     InstrumentStorage,
 )
 from tinkoff.invest.caching.instruments_cache.interface import IInstrumentsGetter
 from tinkoff.invest.caching.instruments_cache.models import (
     InstrumentResponse,
+    InstrumentsMemoryUsage,
+    InstrumentsRefreshStats,
     InstrumentsResponse,
 )
 from tinkoff.invest.caching.instruments_cache.protocol import (
     InstrumentsResponseCallable,
 )
 from tinkoff.invest.caching.instruments_cache.settings import InstrumentsCacheSettings
+from tinkoff.invest.caching.instruments_cache.snapshot import InstrumentsSnapshot
 from tinkoff.invest.caching.overrides import TTLCache
 from tinkoff.invest.services import InstrumentsService
 
@@ -44,52 +52,208 @@ class InstrumentsCache(IInstrumentsGetter):
         settings: InstrumentsCacheSettings,
         instruments_service: InstrumentsService,
     ):
+        check_response_format(instruments_service.response_format, "InstrumentsCache")
         self._settings = settings
         self._instruments_service = instruments_service
 
         logger.debug("Initialising instruments cache")
-        self._instruments_methods = [
-            self.shares,
-            self.futures,
-            self.etfs,
-            self.bonds,
-            self.currencies,
-        ]
+        self._instruments_methods: Dict[InstrumentType, InstrumentsResponseCallable] = {
+            InstrumentType.INSTRUMENT_TYPE_SHARE: instruments_service.shares,
+            InstrumentType.INSTRUMENT_TYPE_FUTURES: instruments_service.futures,
+            InstrumentType.INSTRUMENT_TYPE_ETF: instruments_service.etfs,
+            InstrumentType.INSTRUMENT_TYPE_BOND: instruments_service.bonds,
+            InstrumentType.INSTRUMENT_TYPE_CURRENCY: instruments_service.currencies,
+        }
         self._cache: TTLCache = TTLCache(
             maxsize=len(self._instruments_methods),
             ttl=self._settings.ttl.total_seconds(),
         )
+        self._snapshot: Optional[InstrumentsSnapshot] = None
+        if self._settings.snapshot_dir is not None:
+            self._snapshot = InstrumentsSnapshot(self._settings.snapshot_dir)
+        self._lock = threading.Lock()
+        self._revalidating: Set[str] = set()
+        self._loading_locks: Dict[str, threading.Lock] = {}
+        # the latest storages are kept after expiry to be served while stale
+        self._storages: Dict[
+            str, InstrumentStorage[InstrumentResponse, InstrumentsResponse]
+        ] = {}
+        # monotonic time the instruments were downloaded at and load duration
+        self._refreshes: Dict[str, Tuple[float, timedelta]] = {}
         self._refresh_cache()
 
+    def _get_preloaded_methods(self):
+        return [
+            instruments_method
+            for instrument_type, instruments_method in self._instruments_methods.items()
+            if instrument_type in self._settings.preload
+        ]
+
     def _refresh_cache(self):
         logger.debug("Refreshing instruments cache")
-        for instruments_method in self._instruments_methods:
-            instruments_method()
+        # storages are built without decoding instruments of a snapshot
+        for instruments_method in self._get_preloaded_methods():
+            self._get_instrument_storage(instruments_method)
         self._assert_cache()
 
     def _assert_cache(self):
-        if self._cache.keys() != {f.__name__ for f in self._instruments_methods}:
-            raise KeyError(f"Cache does not have all instrument types {self._cache}")
+        preloaded_keys = {f.__name__ for f in self._get_preloaded_methods()}
+        if not preloaded_keys.issubset(self._cache.keys()):
+            raise KeyError(
+                f"Cache does not have all preloaded instrument types {self._cache}"
+            )
+
+    def get_memory_usage(self) -> Dict[InstrumentType, InstrumentsMemoryUsage]:
+        """Memory used by the loaded instrument types, others are omitted."""
+        memory_usage = {}
+        for instrument_type, instruments_method in self._instruments_methods.items():
+            with self._lock:
+                storage = self._storages.get(instruments_method.__name__)
+            if storage is not None:
+                memory_usage[instrument_type] = storage.get_memory_usage()
+        return memory_usage
+
+    def get_refresh_stats(self) -> Dict[InstrumentType, InstrumentsRefreshStats]:
+        """Refresh metrics of the loaded instrument types, others are omitted."""
+        refresh_stats = {}
+        for instrument_type, instruments_method in self._instruments_methods.items():
+            storage_key = instruments_method.__name__
+            with self._lock:
+                refresh = self._refreshes.get(storage_key)
+                in_progress = storage_key in self._revalidating
+            if refresh is not None:
+                refreshed_at, duration = refresh
+                refresh_stats[instrument_type] = InstrumentsRefreshStats(
+                    age=timedelta(seconds=time.monotonic() - refreshed_at),
+                    duration=duration,
+                    in_progress=in_progress,
+                )
+        return refresh_stats
+
+    def _get_cached_storage(
+        self, storage_key: str
+    ) -> Optional[InstrumentStorage[InstrumentResponse, InstrumentsResponse]]:
+        with self._lock:
+            storage = self._cache.get(storage_key)
+            refresh = self._refreshes.get(storage_key)
+        if storage is None or refresh is None:
+            return storage
+        # instruments from a snapshot are as old as the snapshot
+        refreshed_at, _ = refresh
+        if time.monotonic() - refreshed_at >= self._cache.ttl:
+            return None
+        return storage
+
+    def _get_loading_lock(self, storage_key: str) -> threading.Lock:
+        with self._lock:
+            return self._loading_locks.setdefault(storage_key, threading.Lock())
 
     def _get_instrument_storage(
         self, get_instruments_method: InstrumentsResponseCallable
     ) -> InstrumentStorage[InstrumentResponse, InstrumentsResponse]:
         storage_key = get_instruments_method.__name__
-        storage = self._cache.get(storage_key)
+        storage = self._get_cached_storage(storage_key)
         if storage is not None:
             logger.debug("Got storage for key %s from cache", storage_key)
             return storage
-        logger.debug(
-            "Storage for key %s not found, creating new storage with ttl=%s",
-            storage_key,
-            self._cache.ttl,
-        )
+        with self._lock:
+            stale_storage = self._storages.get(storage_key)
+            revalidating = storage_key in self._revalidating
+        if stale_storage is not None and (
+            self._settings.stale_while_revalidate or revalidating
+        ):
+            logger.debug("Serving stale storage for key %s", storage_key)
+            self._revalidate_in_background(storage_key, get_instruments_method)
+            return stale_storage
+        # concurrent first accesses to a type wait for a single load
+        with self._get_loading_lock(storage_key):
+            storage = self._get_cached_storage(storage_key)
+            if storage is not None:
+                return storage
+            if stale_storage is None:
+                storage = self._load_snapshot(storage_key, get_instruments_method)
+            if storage is not None:
+                return storage
+            logger.debug(
+                "Storage for key %s not found, creating new storage with ttl=%s",
+                storage_key,
+                self._cache.ttl,
+            )
+            return self._download(storage_key, get_instruments_method)
+
+    def _download(
+        self, storage_key: str, get_instruments_method: InstrumentsResponseCallable
+    ) -> InstrumentStorage[InstrumentResponse, InstrumentsResponse]:
+        started_at = time.monotonic()
         instruments_response = get_instruments_method(
             instrument_status=InstrumentStatus.INSTRUMENT_STATUS_ALL
         )
         storage = InstrumentStorage(instruments_response=instruments_response)
-        self._cache[storage_key] = storage
-        return storage  # noqa:R504
+        self._set_storage(storage_key, storage, started_at=started_at, age=0.0)
+        if self._snapshot is not None:
+            self._snapshot.save(storage_key, instruments_response)
+        return storage
+
+    def _load_snapshot(
+        self, storage_key: str, get_instruments_method: InstrumentsResponseCallable
+    ) -> Optional[InstrumentStorage[InstrumentResponse, InstrumentsResponse]]:
+        if self._snapshot is None:
+            return None
+        started_at = time.monotonic()
+        loaded = self._snapshot.load(storage_key)
+        if loaded is None:
+            return None
+        instruments_response, age = loaded
+        storage = InstrumentStorage(instruments_response=instruments_response)
+        self._set_storage(storage_key, storage, started_at=started_at, age=age)
+        if age > self._cache.ttl:
+            # the outdated snapshot is served until new instruments are loaded
+            self._revalidate_in_background(storage_key, get_instruments_method)
+        return storage
+
+    def _set_storage(
+        self,
+        storage_key: str,
+        storage: InstrumentStorage[InstrumentResponse, InstrumentsResponse],
+        *,
+        started_at: float,
+        age: float,
+    ) -> None:
+        refreshed_at = time.monotonic()
+        # readers get either the previous storage or the fully built new one
+        with self._lock:
+            self._cache[storage_key] = storage
+            self._storages[storage_key] = storage
+            self._refreshes[storage_key] = (
+                refreshed_at - age,
+                timedelta(seconds=refreshed_at - started_at),
+            )
+
+    def _revalidate_in_background(
+        self, storage_key: str, get_instruments_method: InstrumentsResponseCallable
+    ) -> None:
+        with self._lock:
+            if storage_key in self._revalidating:
+                return
+            self._revalidating.add(storage_key)
+        threading.Thread(
+            target=self._revalidate,
+            args=(storage_key, get_instruments_method),
+            name=f"instruments-cache-{storage_key}",
+            daemon=True,
+        ).start()
+
+    def _revalidate(
+        self, storage_key: str, get_instruments_method: InstrumentsResponseCallable
+    ) -> None:
+        logger.debug("Revalidating storage for key %s", storage_key)
+        try:
+            self._download(storage_key, get_instruments_method)
+        except Exception:  # pylint:disable=broad-except
+            logger.exception("Failed to revalidate storage for key %s", storage_key)
+        finally:
+            with self._lock:
+                self._revalidating.discard(storage_key)
 
     def shares(
         self, *, instrument_status: InstrumentStatus = InstrumentStatus(0)
@@ -114,6 +278,26 @@ class InstrumentsCache(IInstrumentsGetter):
         share = storage.get(id_type=id_type, class_code=class_code, id=id)
         return ShareResponse(instrument=share)
 
+    def shares_by_ids(
+        self,
+        *,
+        id_type: InstrumentIdType = InstrumentIdType(0),
+        class_code: str = "",
+        ids: Iterable[str],
+    ) -> Dict[str, Share]:
+        storage = cast(
+            InstrumentStorage[Share, SharesResponse],  # type: ignore
+            self._get_instrument_storage(self._instruments_service.shares),
+        )
+        return storage.get_many(id_type=id_type, class_code=class_code, ids=ids)
+
+    def shares_by_isin(self, isin: str) -> List[Share]:
+        storage = cast(
+            InstrumentStorage[Share, SharesResponse],  # type: ignore
+            self._get_instrument_storage(self._instruments_service.shares),
+        )
+        return storage.get_by_isin(isin)
+
     def futures(
         self, *, instrument_status: InstrumentStatus = InstrumentStatus(0)
     ) -> FuturesResponse:
@@ -137,6 +321,19 @@ class InstrumentsCache(IInstrumentsGetter):
         future = storage.get(id_type=id_type, class_code=class_code, id=id)
         return FutureResponse(instrument=future)
 
+    def futures_by_ids(
+        self,
+        *,
+        id_type: InstrumentIdType = InstrumentIdType(0),
+        class_code: str = "",
+        ids: Iterable[str],
+    ) -> Dict[str, Future]:
+        storage = cast(
+            InstrumentStorage[Future, FuturesResponse],  # type: ignore
+            self._get_instrument_storage(self._instruments_service.futures),
+        )
+        return storage.get_many(id_type=id_type, class_code=class_code, ids=ids)
+
     def etfs(
         self, *, instrument_status: InstrumentStatus = InstrumentStatus(0)
     ) -> EtfsResponse:
@@ -160,6 +357,26 @@ class InstrumentsCache(IInstrumentsGetter):
         etf = storage.get(id_type=id_type, class_code=class_code, id=id)
         return EtfResponse(instrument=etf)
 
+    def etfs_by_ids(
+        self,
+        *,
+        id_type: InstrumentIdType = InstrumentIdType(0),
+        class_code: str = "",
+        ids: Iterable[str],
+    ) -> Dict[str, Etf]:
+        storage = cast(
+            InstrumentStorage[Etf, EtfsResponse],  # type: ignore
+            self._get_instrument_storage(self._instruments_service.etfs),
+        )
+        return storage.get_many(id_type=id_type, class_code=class_code, ids=ids)
+
+    def etfs_by_isin(self, isin: str) -> List[Etf]:
+        storage = cast(
+            InstrumentStorage[Etf, EtfsResponse],  # type: ignore
+            self._get_instrument_storage(self._instruments_service.etfs),
+        )
+        return storage.get_by_isin(isin)
+
     def bonds(
         self, *, instrument_status: InstrumentStatus = InstrumentStatus(0)
     ) -> BondsResponse:
@@ -183,6 +400,26 @@ class InstrumentsCache(IInstrumentsGetter):
         bond = storage.get(id_type=id_type, class_code=class_code, id=id)
         return BondResponse(instrument=bond)
 
+    def bonds_by_ids(
+        self,
+        *,
+        id_type: InstrumentIdType = InstrumentIdType(0),
+        class_code: str = "",
+        ids: Iterable[str],
+    ) -> Dict[str, Bond]:
+        storage = cast(
+            InstrumentStorage[Bond, BondsResponse],  # type: ignore
+            self._get_instrument_storage(self._instruments_service.bonds),
+        )
+        return storage.get_many(id_type=id_type, class_code=class_code, ids=ids)
+
+    def bonds_by_isin(self, isin: str) -> List[Bond]:
+        storage = cast(
+            InstrumentStorage[Bond, BondsResponse],  # type: ignore
+            self._get_instrument_storage(self._instruments_service.bonds),
+        )
+        return storage.get_by_isin(isin)
+
     def currencies(
         self, *, instrument_status: InstrumentStatus = InstrumentStatus(0)
     ) -> CurrenciesResponse:
@@ -205,3 +442,23 @@ class InstrumentsCache(IInstrumentsGetter):
         )
         currency = storage.get(id_type=id_type, class_code=class_code, id=id)
         return CurrencyResponse(instrument=currency)
+
+    def currencies_by_ids(
+        self,
+        *,
+        id_type: InstrumentIdType = InstrumentIdType(0),
+        class_code: str = "",
+        ids: Iterable[str],
+    ) -> Dict[str, Currency]:
+        storage = cast(
+            InstrumentStorage[Currency, CurrenciesResponse],  # type: ignore
+            self._get_instrument_storage(self._instruments_service.currencies),
+        )
+        return storage.get_many(id_type=id_type, class_code=class_code, ids=ids)
+
+    def currencies_by_isin(self, isin: str) -> List[Currency]:
+        storage = cast(
+            InstrumentStorage[Currency, CurrenciesResponse],  # type: ignore
+            self._get_instrument_storage(self._instruments_service.currencies),
+        )
+        return storage.get_by_isin(isin)
@@ -1,3 +1,5 @@
+import dataclasses
+from datetime import timedelta
 from typing import List
 
 
@@ -7,7 +9,24 @@ class InstrumentResponse:
     figi: str
     ticker: str
     uid: str
+    position_uid: str
 
 
 class InstrumentsResponse:
     instruments: List[InstrumentResponse]
+
+
+@dataclasses.dataclass(frozen=True)
+class InstrumentsMemoryUsage:
+    instruments: int
+    # approximate, shared objects are counted once
+    size_bytes: int
+
+
+@dataclasses.dataclass(frozen=True)
+class InstrumentsRefreshStats:
+    # time since the served instruments were downloaded
+    age: timedelta
+    # time the last download or snapshot load with indexing took
+    duration: timedelta
+    in_progress: bool
@@ -1,7 +1,27 @@
 import dataclasses
 from datetime import timedelta
+from pathlib import Path
+from typing import FrozenSet, Optional
+
+from tinkoff.invest.schemas import InstrumentType
+
+ALL_INSTRUMENT_TYPES = frozenset(
+    {
+        InstrumentType.INSTRUMENT_TYPE_SHARE,
+        InstrumentType.INSTRUMENT_TYPE_FUTURES,
+        InstrumentType.INSTRUMENT_TYPE_ETF,
+        InstrumentType.INSTRUMENT_TYPE_BOND,
+        InstrumentType.INSTRUMENT_TYPE_CURRENCY,
+    }
+)
 
 
 @dataclasses.dataclass()
 class InstrumentsCacheSettings:
     ttl: timedelta = timedelta(days=1)
+    # instruments are kept there between processes if given
+    snapshot_dir: Optional[Path] = None
+    # other types are loaded on first access
+    preload: FrozenSet[InstrumentType] = ALL_INSTRUMENT_TYPES
+    # expired instruments are served while new ones are loaded in background
+    stale_while_revalidate: bool = False
@@ -0,0 +1,72 @@
+import logging
+import os
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+from tinkoff.invest import _grpc_helpers
+from tinkoff.invest.caching.instruments_cache.models import InstrumentsResponse
+from tinkoff.invest.grpc import instruments_pb2
+from tinkoff.invest.schemas import (
+    BondsResponse,
+    CurrenciesResponse,
+    EtfsResponse,
+    FuturesResponse,
+    SharesResponse,
+)
+
+logger = logging.getLogger(__name__)
+
+_RESPONSE_TYPES: Dict[str, Tuple[type, Any]] = {
+    "shares": (SharesResponse, instruments_pb2.SharesResponse),
+    "futures": (FuturesResponse, instruments_pb2.FuturesResponse),
+    "etfs": (EtfsResponse, instruments_pb2.EtfsResponse),
+    "bonds": (BondsResponse, instruments_pb2.BondsResponse),
+    "currencies": (CurrenciesResponse, instruments_pb2.CurrenciesResponse),
+}
+
+
+class InstrumentsSnapshot:
+    """Instruments responses saved as encoded protobuf messages.
+
+    A loaded response is a view over the parsed message, so instruments are
+    decoded only when they are accessed.
+    """
+
+    def __init__(self, snapshot_dir: Path):
+        self._snapshot_dir = snapshot_dir
+        self._snapshot_dir.mkdir(parents=True, exist_ok=True)
+
+    def _get_path(self, name: str) -> Path:
+        return self._snapshot_dir / f"{name}.pb"
+
+    def load(self, name: str) -> Optional[Tuple[InstrumentsResponse, float]]:
+        """Return the saved response and its age in seconds."""
+        path = self._get_path(name)
+        dataclass_type, protobuf_type = _RESPONSE_TYPES[name]
+        try:
+            saved_at = path.stat().st_mtime
+            pb_obj = protobuf_type.FromString(path.read_bytes())
+        except FileNotFoundError:
+            return None
+        except Exception as error:  # pylint:disable=broad-except
+            logger.warning("Failed to load snapshot %s: %s", path, error)
+            return None
+        logger.debug("Loaded snapshot %s", path)
+        response = _grpc_helpers.protobuf_to_view(pb_obj, dataclass_type)
+        return response, time.time() - saved_at
+
+    def save(self, name: str, response: InstrumentsResponse) -> None:
+        path = self._get_path(name)
+        _, protobuf_type = _RESPONSE_TYPES[name]
+        if isinstance(response, _grpc_helpers.MessageView):
+            pb_obj = response.protobuf
+        else:
+            pb_obj = _grpc_helpers.dataclass_to_protobuff(response, protobuf_type())
+        tmp_path = path.with_suffix(".tmp")
+        try:
+            tmp_path.write_bytes(pb_obj.SerializeToString())
+            # readers never see a partially written snapshot
+            os.replace(tmp_path, path)
+        except OSError as error:
+            logger.warning("Failed to save snapshot %s: %s", path, error)
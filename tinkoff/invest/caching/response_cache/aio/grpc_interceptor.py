@@ -0,0 +1,32 @@
+import grpc
+
+from tinkoff.invest._copied_calls import AsyncCopiedResponseCall
+from tinkoff.invest.caching.response_cache.response_cache import ResponseCache
+
+
+class AsyncResponseCacheClientInterceptor(
+    ResponseCache, grpc.aio.UnaryUnaryClientInterceptor
+):
+    """Returns responses of slowly changing data from a cache.
+
+    Only successful calls are cached.
+    """
+
+    async def intercept_unary_unary(self, continuation, client_call_details, request):
+        method_key = self.get_method_key(client_call_details.method)
+        if method_key is None:
+            return await continuation(client_call_details, request)
+
+        call_key = self.get_call_key(client_call_details, request)
+        call = self.get(method_key, call_key)
+        if call is None:
+            call = await continuation(client_call_details, request)
+            try:
+                await call
+            except grpc.RpcError:
+                return call  # raised again to the caller awaiting the call
+            self.set(method_key, call_key, call)
+        # the cached response is kept intact for the next callers
+        if self._copy_responses:
+            return AsyncCopiedResponseCall(call)
+        return call
@@ -0,0 +1,68 @@
+import dataclasses
+import threading
+from typing import Any, Dict, Hashable, Optional, Union
+
+from tinkoff.invest.caching.overrides import TTLCache
+from tinkoff.invest.caching.response_cache.settings import ResponseCacheSettings
+from tinkoff.invest.rate_limiting.scheduler import split_method
+
+
+@dataclasses.dataclass()
+class ResponseCacheStats:
+    hits: int = 0
+    misses: int = 0
+
+
+class ResponseCache:
+    """Responses of unary calls kept for the TTL of their method.
+
+    Responses are keyed by the encoded request and the metadata of the call.
+    With `copy_responses` every caller gets its own copy of the cached
+    response message, set it for clients with `ResponseFormat.PROTOBUF`.
+    """
+
+    def __init__(
+        self,
+        settings: Optional[ResponseCacheSettings] = None,
+        copy_responses: bool = False,
+    ):
+        settings = settings or ResponseCacheSettings()
+        self._copy_responses = copy_responses
+        self._lock = threading.Lock()
+        self._caches: Dict[str, TTLCache] = {
+            method: TTLCache(maxsize=settings.maxsize, ttl=ttl.total_seconds())
+            for method, ttl in settings.ttls.items()
+        }
+        self.stats: Dict[str, ResponseCacheStats] = {
+            method: ResponseCacheStats() for method in settings.ttls
+        }
+
+    def get_method_key(self, method: Union[str, bytes]) -> Optional[str]:
+        service, name = split_method(method)
+        method_key = f"{service}/{name}"
+        return method_key if method_key in self._caches else None
+
+    @staticmethod
+    def get_call_key(client_call_details: Any, request: Any) -> Hashable:
+        return (
+            request.SerializeToString(deterministic=True),
+            tuple(client_call_details.metadata or ()),
+        )
+
+    def get(self, method_key: str, call_key: Hashable) -> Optional[Any]:
+        with self._lock:
+            call = self._caches[method_key].get(call_key)
+            if call is None:
+                self.stats[method_key].misses += 1
+            else:
+                self.stats[method_key].hits += 1
+        return call
+
+    def set(self, method_key: str, call_key: Hashable, call: Any) -> None:
+        with self._lock:
+            self._caches[method_key][call_key] = call
+
+    def clear(self) -> None:
+        with self._lock:
+            for cache in self._caches.values():
+                cache.clear()
@@ -0,0 +1,29 @@
+import dataclasses
+from datetime import timedelta
+from typing import Dict
+
+
+def _default_ttls() -> Dict[str, timedelta]:
+    return {
+        "InstrumentsService/TradingSchedules": timedelta(hours=1),
+        "InstrumentsService/GetBrands": timedelta(days=1),
+        "InstrumentsService/GetAssets": timedelta(days=1),
+        "InstrumentsService/GetCountries": timedelta(days=1),
+        "InstrumentsService/GetDividends": timedelta(hours=1),
+        "InstrumentsService/GetBondCoupons": timedelta(hours=1),
+        "InstrumentsService/GetFuturesMargin": timedelta(minutes=10),
+    }
+
+
+@dataclasses.dataclass()
+class ResponseCacheSettings:
+    """Settings of cached responses.
+
+    Keys of `ttls` are short service and method names, e.g.
+    ``"InstrumentsService/GetBrands"``; responses of other methods are not
+    cached. Every method keeps up to `maxsize` responses, the least recently
+    used ones are evicted first.
+    """
+
+    ttls: Dict[str, timedelta] = dataclasses.field(default_factory=_default_ttls)
+    maxsize: int = 128
@@ -1,5 +1,8 @@
+import asyncio
+import enum
 import itertools
-from typing import Any, Optional, Sequence
+import threading
+from typing import Any, Callable, List, Optional, Sequence
 
 import grpc
 from grpc.aio import ClientInterceptor
@@ -7,10 +10,16 @@ from grpc.aio import ClientInterceptor
 from .constants import INVEST_GRPC_API, MAX_RECEIVE_MESSAGE_LENGTH
 from .typedefs import ChannelArgumentType
 
-__all__ = ("create_channel",)
+__all__ = (
+    "ChannelSelection",
+    "create_channel",
+    "create_channel_pool",
+)
 
 
 MAX_RECEIVE_MESSAGE_LENGTH_OPTION = "grpc.max_receive_message_length"
+# Channels with equal arguments share a connection unless it is set
+USE_LOCAL_SUBCHANNEL_POOL_OPTION = "grpc.use_local_subchannel_pool"
 
 
 def create_channel(
@@ -48,3 +57,219 @@ def _contains_option(options: ChannelArgumentType, expected_option_name: str) ->
         if option_name == expected_option_name:
             return True
     return False
+
+
+class ChannelSelection(str, enum.Enum):
+    ROUND_ROBIN = "round_robin"
+    LEAST_OUTSTANDING = "least_outstanding"
+
+
+def create_channel_pool(
+    *,
+    size: int,
+    selection: ChannelSelection = ChannelSelection.ROUND_ROBIN,
+    target: Optional[str] = None,
+    options: Optional[ChannelArgumentType] = None,
+    force_async: bool = False,
+    compression: Optional[grpc.Compression] = None,
+    interceptors: Optional[Sequence[ClientInterceptor]] = None,
+) -> Any:
+    """Create a channel spreading unary calls over `size` connections.
+
+    Streams are pinned to one more dedicated connection, so long-lived
+    streams do not take stream slots of the connections serving unary calls.
+    The pool is used by services as a single channel.
+    """
+    options = [*(options or []), (USE_LOCAL_SUBCHANNEL_POOL_OPTION, 1)]
+
+    def create() -> Any:
+        return create_channel(
+            target=target,
+            options=options,
+            force_async=force_async,
+            compression=compression,
+            interceptors=interceptors,
+        )
+
+    unary_channels = [create() for _ in range(size)]
+    selector = _ChannelSelector(size, selection)
+    if force_async:
+        return AsyncChannelPool(unary_channels, create(), selector)
+    return ChannelPool(unary_channels, create(), selector)
+
+
+class _ChannelSelector:
+    def __init__(self, size: int, selection: ChannelSelection):
+        self._selection = selection
+        self._lock = threading.Lock()
+        self._counter = itertools.count()
+        self._outstanding = [0] * size
+
+    def acquire(self) -> int:
+        with self._lock:
+            if self._selection == ChannelSelection.LEAST_OUTSTANDING:
+                index = min(
+                    range(len(self._outstanding)), key=self._outstanding.__getitem__
+                )
+            else:
+                index = next(self._counter) % len(self._outstanding)
+            self._outstanding[index] += 1
+            return index
+
+    def release(self, index: int) -> None:
+        with self._lock:
+            self._outstanding[index] -= 1
+
+
+class _PooledUnaryUnaryMultiCallable(grpc.UnaryUnaryMultiCallable):
+    def __init__(self, selector: _ChannelSelector, callables: List[Any]):
+        self._selector = selector
+        self._callables = callables
+
+    def __call__(self, request, *args, **kwargs):
+        index = self._selector.acquire()
+        try:
+            return self._callables[index](request, *args, **kwargs)
+        finally:
+            self._selector.release(index)
+
+    def with_call(self, request, *args, **kwargs):
+        index = self._selector.acquire()
+        try:
+            return self._callables[index].with_call(request, *args, **kwargs)
+        finally:
+            self._selector.release(index)
+
+    def future(self, request, *args, **kwargs):
+        index = self._selector.acquire()
+        try:
+            future = self._callables[index].future(request, *args, **kwargs)
+        except BaseException:
+            self._selector.release(index)
+            raise
+        future.add_done_callback(lambda _: self._selector.release(index))
+        return future
+
+
+class ChannelPool(grpc.Channel):
+    def __init__(
+        self,
+        unary_channels: List[grpc.Channel],
+        stream_channel: grpc.Channel,
+        selector: _ChannelSelector,
+    ):
+        self._unary_channels = unary_channels
+        self._stream_channel = stream_channel
+        self._selector = selector
+
+    @property
+    def _channels(self) -> List[grpc.Channel]:
+        return [*self._unary_channels, self._stream_channel]
+
+    def subscribe(self, callback, try_to_connect=False):
+        for channel in self._channels:
+            channel.subscribe(callback, try_to_connect=try_to_connect)
+
+    def unsubscribe(self, callback):
+        for channel in self._channels:
+            channel.unsubscribe(callback)
+
+    def unary_unary(self, method, *args, **kwargs):
+        return _PooledUnaryUnaryMultiCallable(
+            self._selector,
+            [
+                channel.unary_unary(method, *args, **kwargs)
+                for channel in self._unary_channels
+            ],
+        )
+
+    def unary_stream(self, method, *args, **kwargs):
+        return self._stream_channel.unary_stream(method, *args, **kwargs)
+
+    def stream_unary(self, method, *args, **kwargs):
+        return self._stream_channel.stream_unary(method, *args, **kwargs)
+
+    def stream_stream(self, method, *args, **kwargs):
+        return self._stream_channel.stream_stream(method, *args, **kwargs)
+
+    def close(self):
+        for channel in self._channels:
+            channel.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+        return False
+
+
+class _AsyncPooledUnaryUnaryMultiCallable(grpc.aio.UnaryUnaryMultiCallable):
+    def __init__(self, selector: _ChannelSelector, callables: List[Any]):
+        self._selector = selector
+        self._callables = callables
+
+    def __call__(self, request, **kwargs):
+        index = self._selector.acquire()
+        try:
+            call = self._callables[index](request, **kwargs)
+        except BaseException:
+            self._selector.release(index)
+            raise
+        call.add_done_callback(self._releasing(index))
+        return call
+
+    def _releasing(self, index: int) -> Callable[[Any], None]:
+        return lambda _: self._selector.release(index)
+
+
+class AsyncChannelPool(grpc.aio.Channel):
+    def __init__(
+        self,
+        unary_channels: List[grpc.aio.Channel],
+        stream_channel: grpc.aio.Channel,
+        selector: _ChannelSelector,
+    ):
+        self._unary_channels = unary_channels
+        self._stream_channel = stream_channel
+        self._selector = selector
+
+    @property
+    def _channels(self) -> List[grpc.aio.Channel]:
+        return [*self._unary_channels, self._stream_channel]
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+
+    async def close(self, grace: Optional[float] = None):
+        await asyncio.gather(*(channel.close(grace) for channel in self._channels))
+
+    def get_state(self, try_to_connect: bool = False) -> grpc.ChannelConnectivity:
+        return self._unary_channels[0].get_state(try_to_connect)
+
+    async def wait_for_state_change(self, last_observed_state):
+        await self._unary_channels[0].wait_for_state_change(last_observed_state)
+
+    async def channel_ready(self):
+        await asyncio.gather(*(channel.channel_ready() for channel in self._channels))
+
+    def unary_unary(self, method, *args, **kwargs):
+        return _AsyncPooledUnaryUnaryMultiCallable(
+            self._selector,
+            [
+                channel.unary_unary(method, *args, **kwargs)
+                for channel in self._unary_channels
+            ],
+        )
+
+    def unary_stream(self, method, *args, **kwargs):
+        return self._stream_channel.unary_stream(method, *args, **kwargs)
+
+    def stream_unary(self, method, *args, **kwargs):
+        return self._stream_channel.stream_unary(method, *args, **kwargs)
+
+    def stream_stream(self, method, *args, **kwargs):
+        return self._stream_channel.stream_stream(method, *args, **kwargs)
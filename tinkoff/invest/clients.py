@@ -3,8 +3,17 @@ from typing import List, Optional
 import grpc
 from grpc.aio import ClientInterceptor
 
+from ._grpc_helpers import ResponseFormat
 from .async_services import AsyncServices
-from .channels import create_channel
+from .channels import ChannelSelection, create_channel, create_channel_pool
+from .coalescing.aio.grpc_interceptor import AsyncCoalescingClientInterceptor
+from .coalescing.sync.grpc_interceptor import CoalescingClientInterceptor
+from .deadlines.aio.grpc_interceptor import AsyncDeadlineClientInterceptor
+from .deadlines.settings import DeadlineSettings
+from .deadlines.sync.grpc_interceptor import DeadlineClientInterceptor
+from .hedging.aio.grpc_interceptor import AsyncHedgingClientInterceptor
+from .hedging.settings import HedgingSettings
+from .hedging.sync.grpc_interceptor import HedgingClientInterceptor
 from .services import Services
 from .typedefs import ChannelArgumentType
 
@@ -36,15 +45,46 @@ class Client:
         options: Optional[ChannelArgumentType] = None,
         app_name: Optional[str] = None,
         interceptors: Optional[List[ClientInterceptor]] = None,
+        response_format: ResponseFormat = ResponseFormat.DATACLASS,
+        coalesce_requests: bool = False,
+        channel_pool_size: Optional[int] = None,
+        channel_selection: ChannelSelection = ChannelSelection.ROUND_ROBIN,
+        deadlines: Optional[DeadlineSettings] = None,
+        hedging: Optional[HedgingSettings] = None,
     ):
         self._token = token
         self._sandbox_token = sandbox_token
         self._options = options
         self._app_name = app_name
-
-        self._channel = create_channel(target=target, options=options)
+        self._response_format = response_format
+
+        if channel_pool_size:
+            self._channel = create_channel_pool(
+                size=channel_pool_size,
+                selection=channel_selection,
+                target=target,
+                options=options,
+            )
+        else:
+            self._channel = create_channel(target=target, options=options)
         if interceptors is None:
             interceptors = []
+        # every hedged request passes the given interceptors
+        self._hedging_interceptor: Optional[HedgingClientInterceptor] = None
+        if hedging is not None:
+            self._hedging_interceptor = HedgingClientInterceptor(hedging)
+            interceptors = [*interceptors, self._hedging_interceptor]
+        # both hedged requests share the deadline of the call
+        if deadlines is not None:
+            interceptors = [*interceptors, DeadlineClientInterceptor(deadlines)]
+        if coalesce_requests:
+            # identical calls are joined before any other interceptor runs
+            interceptors = [
+                *interceptors,
+                CoalescingClientInterceptor(
+                    copy_responses=response_format == ResponseFormat.PROTOBUF
+                ),
+            ]
         for interceptor in interceptors:
             self._channel = grpc.intercept_channel(self._channel, interceptor)
 
@@ -55,10 +95,13 @@ class Client:
             token=self._token,
             sandbox_token=self._sandbox_token,
             app_name=self._app_name,
+            response_format=self._response_format,
         )
 
     def __exit__(self, exc_type, exc_val, exc_tb):
         self._channel.__exit__(exc_type, exc_val, exc_tb)
+        if self._hedging_interceptor is not None:
+            self._hedging_interceptor.close()
         return False
 
 
@@ -93,14 +136,54 @@ class AsyncClient:
         options: Optional[ChannelArgumentType] = None,
         app_name: Optional[str] = None,
         interceptors: Optional[List[ClientInterceptor]] = None,
+        response_format: ResponseFormat = ResponseFormat.DATACLASS,
+        coalesce_requests: bool = False,
+        channel_pool_size: Optional[int] = None,
+        channel_selection: ChannelSelection = ChannelSelection.ROUND_ROBIN,
+        deadlines: Optional[DeadlineSettings] = None,
+        hedging: Optional[HedgingSettings] = None,
     ):
         self._token = token
         self._sandbox_token = sandbox_token
         self._options = options
         self._app_name = app_name
-        self._channel = create_channel(
-            target=target, force_async=True, options=options, interceptors=interceptors
-        )
+        self._response_format = response_format
+        # every hedged request passes the given interceptors
+        if hedging is not None:
+            interceptors = [
+                AsyncHedgingClientInterceptor(hedging),
+                *(interceptors or []),
+            ]
+        # both hedged requests share the deadline of the call
+        if deadlines is not None:
+            interceptors = [
+                AsyncDeadlineClientInterceptor(deadlines),
+                *(interceptors or []),
+            ]
+        if coalesce_requests:
+            # identical calls are joined before any other interceptor runs
+            interceptors = [
+                AsyncCoalescingClientInterceptor(
+                    copy_responses=response_format == ResponseFormat.PROTOBUF
+                ),
+                *(interceptors or []),
+            ]
+        if channel_pool_size:
+            self._channel = create_channel_pool(
+                size=channel_pool_size,
+                selection=channel_selection,
+                target=target,
+                force_async=True,
+                options=options,
+                interceptors=interceptors,
+            )
+        else:
+            self._channel = create_channel(
+                target=target,
+                force_async=True,
+                options=options,
+                interceptors=interceptors,
+            )
 
     async def __aenter__(self) -> AsyncServices:
         channel = await self._channel.__aenter__()
@@ -109,6 +192,7 @@ class AsyncClient:
             token=self._token,
             sandbox_token=self._sandbox_token,
             app_name=self._app_name,
+            response_format=self._response_format,
         )
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
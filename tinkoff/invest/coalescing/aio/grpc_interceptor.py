@@ -0,0 +1,53 @@
+import asyncio
+import logging
+from typing import Collection, Dict, Hashable, Optional
+
+import grpc
+
+from tinkoff.invest._copied_calls import AsyncCopiedResponseCall
+from tinkoff.invest.coalescing.base import BaseCoalescingInterceptor
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncCoalescingClientInterceptor(
+    BaseCoalescingInterceptor, grpc.aio.UnaryUnaryClientInterceptor
+):
+    def __init__(
+        self,
+        methods: Optional[Collection[str]] = None,
+        copy_responses: bool = False,
+    ):
+        super().__init__(methods=methods, copy_responses=copy_responses)
+        self._in_flight: Dict[Hashable, asyncio.Future] = {}
+
+    async def intercept_unary_unary(self, continuation, client_call_details, request):
+        key = self.get_call_key(client_call_details, request)
+        if key is None:
+            return await continuation(client_call_details, request)
+
+        future = self._in_flight.get(key)
+        is_leader = future is None
+        if future is None:
+            future = asyncio.ensure_future(
+                self._call(continuation, client_call_details, request)
+            )
+            self._in_flight[key] = future
+            future.add_done_callback(lambda _: self._in_flight.pop(key, None))
+        else:
+            logger.debug("Joining call of %s", client_call_details.method)
+        # a cancelled caller does not cancel the call shared with others
+        call = await asyncio.shield(future)
+        if self._copy_responses and not is_leader:
+            return AsyncCopiedResponseCall(call)
+        return call
+
+    @staticmethod
+    async def _call(continuation, client_call_details, request):
+        call = await continuation(client_call_details, request)
+        try:
+            # the call is shared until its response is received
+            await call
+        except grpc.RpcError:
+            pass  # raised again to every caller awaiting the call
+        return call
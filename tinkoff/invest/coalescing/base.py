@@ -0,0 +1,54 @@
+from typing import Any, Collection, Hashable, Optional
+
+from tinkoff.invest.rate_limiting.scheduler import split_method
+
+# Calls changing the state of an account are never shared between callers
+NON_IDEMPOTENT_METHODS = frozenset(
+    {
+        "CancelOrder",
+        "CancelSandboxOrder",
+        "CancelStopOrder",
+        "CloseSandboxAccount",
+        "EditFavorites",
+        "OpenSandboxAccount",
+        "PostOrder",
+        "PostSandboxOrder",
+        "PostStopOrder",
+        "ReplaceOrder",
+        "ReplaceSandboxOrder",
+        "SandboxPayIn",
+    }
+)
+
+
+class BaseCoalescingInterceptor:
+    """Shares one call between identical requests made at the same time.
+
+    Requests are identical when their method, encoded message and metadata
+    are equal. Only `methods` are coalesced if given, otherwise every method
+    reading data. With `copy_responses` every joined caller gets its own copy
+    of the response message, so callers mutating `*_pb2` responses do not
+    affect each other.
+    """
+
+    def __init__(
+        self,
+        methods: Optional[Collection[str]] = None,
+        copy_responses: bool = False,
+    ):
+        self._methods = methods
+        self._copy_responses = copy_responses
+
+    def get_call_key(
+        self, client_call_details: Any, request: Any
+    ) -> Optional[Hashable]:
+        _, name = split_method(client_call_details.method)
+        if name in NON_IDEMPOTENT_METHODS or (
+            self._methods is not None and name not in self._methods
+        ):
+            return None
+        return (
+            client_call_details.method,
+            request.SerializeToString(deterministic=True),
+            tuple(client_call_details.metadata or ()),
+        )
@@ -0,0 +1,52 @@
+import logging
+import threading
+from concurrent.futures import Future
+from typing import Collection, Dict, Hashable, Optional
+
+import grpc
+
+from tinkoff.invest._copied_calls import CopiedResponseCall
+from tinkoff.invest.coalescing.base import BaseCoalescingInterceptor
+
+logger = logging.getLogger(__name__)
+
+
+class CoalescingClientInterceptor(
+    BaseCoalescingInterceptor, grpc.UnaryUnaryClientInterceptor
+):
+    def __init__(
+        self,
+        methods: Optional[Collection[str]] = None,
+        copy_responses: bool = False,
+    ):
+        super().__init__(methods=methods, copy_responses=copy_responses)
+        self._lock = threading.Lock()
+        self._in_flight: Dict[Hashable, Future] = {}
+
+    def intercept_unary_unary(self, continuation, client_call_details, request):
+        key = self.get_call_key(client_call_details, request)
+        if key is None:
+            return continuation(client_call_details, request)
+
+        with self._lock:
+            future = self._in_flight.get(key)
+            is_leader = future is None
+            if future is None:
+                future = self._in_flight[key] = Future()
+        if not is_leader:
+            logger.debug("Joining call of %s", client_call_details.method)
+            if self._copy_responses:
+                return CopiedResponseCall(future.result())
+            return future.result()
+
+        try:
+            call = continuation(client_call_details, request)
+        except BaseException as error:
+            future.set_exception(error)
+            raise
+        else:
+            future.set_result(call)
+            return call
+        finally:
+            with self._lock:
+                del self._in_flight[key]
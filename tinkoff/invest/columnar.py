@@ -0,0 +1,124 @@
+import dataclasses
+from typing import Any, Iterable, List
+
+import numpy as np
+
+from .fixed_point import NANOS_IN_UNIT
+
+__all__ = (
+    "HistoricCandleColumns",
+    "candles_to_columns",
+    "concatenate_candle_columns",
+)
+
+
+@dataclasses.dataclass(frozen=True)
+class HistoricCandleColumns:
+    """Historic candles stored column by column in numpy arrays.
+
+    `time` is int64 nanoseconds since epoch (view it as `datetime64[ns]` if
+    needed). Prices are int64 nanos (`units * 10**9 + nano`) or float64 when
+    requested with `as_float=True`.
+    """
+
+    time: np.ndarray
+    open: np.ndarray
+    high: np.ndarray
+    low: np.ndarray
+    close: np.ndarray
+    volume: np.ndarray
+    is_complete: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.time)
+
+    def __getitem__(self, index: Any) -> "HistoricCandleColumns":
+        return HistoricCandleColumns(
+            **{
+                field.name: getattr(self, field.name)[index]
+                for field in dataclasses.fields(self)
+            }
+        )
+
+    @classmethod
+    def empty(cls, as_float: bool = False) -> "HistoricCandleColumns":
+        price_dtype = np.float64 if as_float else np.int64
+        return cls(
+            time=np.empty(0, dtype=np.int64),
+            open=np.empty(0, dtype=price_dtype),
+            high=np.empty(0, dtype=price_dtype),
+            low=np.empty(0, dtype=price_dtype),
+            close=np.empty(0, dtype=price_dtype),
+            volume=np.empty(0, dtype=np.int64),
+            is_complete=np.empty(0, dtype=bool),
+        )
+
+
+def _prices(nanos: List[int], as_float: bool) -> np.ndarray:
+    prices = np.array(nanos, dtype=np.int64)
+    if as_float:
+        return prices / NANOS_IN_UNIT
+    return prices
+
+
+def candles_to_columns(
+    candles: Iterable[Any], as_float: bool = False
+) -> HistoricCandleColumns:
+    """Decode a repeated `HistoricCandle` protobuf field into columns.
+
+    Values are read straight from the protobuf messages, no intermediate
+    dataclasses are created.
+    """
+    time: List[int] = []
+    open_: List[int] = []
+    high: List[int] = []
+    low: List[int] = []
+    close: List[int] = []
+    volume: List[int] = []
+    is_complete: List[bool] = []
+    for candle in candles:
+        price = candle.open
+        open_.append(price.units * NANOS_IN_UNIT + price.nano)
+        price = candle.high
+        high.append(price.units * NANOS_IN_UNIT + price.nano)
+        price = candle.low
+        low.append(price.units * NANOS_IN_UNIT + price.nano)
+        price = candle.close
+        close.append(price.units * NANOS_IN_UNIT + price.nano)
+        timestamp = candle.time
+        time.append(timestamp.seconds * NANOS_IN_UNIT + timestamp.nanos)
+        volume.append(candle.volume)
+        is_complete.append(candle.is_complete)
+    return HistoricCandleColumns(
+        time=np.array(time, dtype=np.int64),
+        open=_prices(open_, as_float),
+        high=_prices(high, as_float),
+        low=_prices(low, as_float),
+        close=_prices(close, as_float),
+        volume=np.array(volume, dtype=np.int64),
+        is_complete=np.array(is_complete, dtype=bool),
+    )
+
+
+def concatenate_candle_columns(
+    parts: Iterable[HistoricCandleColumns], as_float: bool = False
+) -> HistoricCandleColumns:
+    """Join consecutive chunks of candles.
+
+    Candles not newer than the last candle of the previous chunk are dropped,
+    so chunks requested for adjacent intervals do not repeat boundary candles.
+    """
+    kept: List[HistoricCandleColumns] = []
+    for part in parts:
+        if kept and len(part):
+            part = part[part.time > kept[-1].time[-1]]
+        if len(part):
+            kept.append(part)
+    if not kept:
+        return HistoricCandleColumns.empty(as_float=as_float)
+    return HistoricCandleColumns(
+        **{
+            field.name: np.concatenate([getattr(part, field.name) for part in kept])
+            for field in dataclasses.fields(HistoricCandleColumns)
+        }
+    )
@@ -0,0 +1,108 @@
+import asyncio
+import logging
+from collections import defaultdict
+from typing import (
+    TYPE_CHECKING,
+    AsyncGenerator,
+    AsyncIterator,
+    Callable,
+    DefaultDict,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+)
+
+from tinkoff.invest.data_loaders.candles_jobs import (
+    BulkLoadProgress,
+    CandlesJob,
+    CandlesJobResult,
+)
+from tinkoff.invest.schemas import CandleInterval, HistoricCandle
+
+if TYPE_CHECKING:
+    from tinkoff.invest.async_services import AsyncMarketDataCache, AsyncServices
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncBulkCandlesLoader:
+    """Loads candles of many instruments with bounded concurrency.
+
+    Asyncio counterpart of `BulkCandlesLoader`.
+    Candles go through `market_data_cache` when it is given.
+    """
+
+    def __init__(
+        self,
+        services: "AsyncServices",
+        max_concurrency: int = 4,
+        market_data_cache: Optional["AsyncMarketDataCache"] = None,
+        on_progress: Optional[Callable[[BulkLoadProgress], None]] = None,
+    ):
+        self._services = services
+        self._max_concurrency = max_concurrency
+        self._market_data_cache = market_data_cache
+        self._on_progress = on_progress
+        # the cache keeps a storage per instrument and interval
+        self._storage_locks: DefaultDict[
+            Tuple[str, CandleInterval], asyncio.Lock
+        ] = defaultdict(asyncio.Lock)
+
+    async def load(
+        self, jobs: Iterable[CandlesJob]
+    ) -> AsyncGenerator[CandlesJobResult, None]:
+        jobs = list(jobs)
+        progress = BulkLoadProgress(jobs_total=len(jobs))
+        semaphore = asyncio.Semaphore(self._max_concurrency)
+        tasks = [asyncio.ensure_future(self._load_job(job, semaphore)) for job in jobs]
+        try:
+            for next_result in asyncio.as_completed(tasks):
+                result = await next_result
+                self._report(progress, result)
+                yield result
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    def _report(self, progress: BulkLoadProgress, result: CandlesJobResult) -> None:
+        progress.add(result)
+        logger.debug(
+            "Loaded %s of %s jobs, %.1f candles per second",
+            progress.jobs_done,
+            progress.jobs_total,
+            progress.candles_per_second,
+        )
+        if self._on_progress is not None:
+            self._on_progress(progress)
+
+    async def _load_job(
+        self, job: CandlesJob, semaphore: asyncio.Semaphore
+    ) -> CandlesJobResult:
+        async with semaphore:
+            try:
+                candles = await self._get_candles(job)
+            except Exception as error:  # pylint:disable=broad-except
+                logger.warning("Failed to load candles of %s: %s", job.figi, error)
+                return CandlesJobResult(job=job, candles=[], error=error)
+        return CandlesJobResult(job=job, candles=candles)
+
+    async def _get_candles(self, job: CandlesJob) -> List[HistoricCandle]:
+        if self._market_data_cache is None:
+            return await self._collect(
+                self._services.get_all_candles(
+                    figi=job.figi, interval=job.interval, from_=job.from_, to=job.to
+                )
+            )
+        async with self._storage_locks[(job.figi, job.interval)]:
+            return await self._collect(
+                self._market_data_cache.get_all_candles(
+                    figi=job.figi, interval=job.interval, from_=job.from_, to=job.to
+                )
+            )
+
+    @staticmethod
+    async def _collect(
+        candles: AsyncIterator[HistoricCandle],
+    ) -> List[HistoricCandle]:
+        return [candle async for candle in candles]
@@ -0,0 +1,112 @@
+import logging
+import threading
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import (
+    TYPE_CHECKING,
+    Callable,
+    DefaultDict,
+    Generator,
+    Iterable,
+    Optional,
+    Tuple,
+)
+
+from tinkoff.invest.data_loaders.candles_jobs import (
+    BulkLoadProgress,
+    CandlesJob,
+    CandlesJobResult,
+)
+from tinkoff.invest.schemas import CandleInterval
+
+if TYPE_CHECKING:
+    from tinkoff.invest.services import MarketDataCache, Services
+
+logger = logging.getLogger(__name__)
+
+
+class BulkCandlesLoader:
+    """Loads candles of many instruments in a pool of threads.
+
+    ```python
+    with Client(TOKEN) as client:
+        loader = BulkCandlesLoader(client, max_workers=8)
+        jobs = [
+            CandlesJob(figi=figi, interval=CandleInterval.CANDLE_INTERVAL_HOUR,
+                       from_=now() - timedelta(days=30))
+            for figi in figis
+        ]
+        for result in loader.load(jobs):
+            print(result.job.figi, len(result.candles))
+    ```
+
+    Results are yielded as jobs complete. All workers share the client, so
+    a rate limit interceptor of the client applies to all of them.
+    Candles go through `market_data_cache` when it is given.
+    """
+
+    def __init__(
+        self,
+        services: "Services",
+        max_workers: int = 4,
+        market_data_cache: Optional["MarketDataCache"] = None,
+        on_progress: Optional[Callable[[BulkLoadProgress], None]] = None,
+    ):
+        self._services = services
+        self._max_workers = max_workers
+        self._market_data_cache = market_data_cache
+        self._on_progress = on_progress
+        # the cache keeps a storage per instrument and interval
+        self._storage_locks: DefaultDict[
+            Tuple[str, CandleInterval], threading.Lock
+        ] = defaultdict(threading.Lock)
+
+    def load(
+        self, jobs: Iterable[CandlesJob]
+    ) -> Generator[CandlesJobResult, None, None]:
+        jobs = list(jobs)
+        progress = BulkLoadProgress(jobs_total=len(jobs))
+        with ThreadPoolExecutor(max_workers=self._max_workers) as executor:
+            futures = [executor.submit(self._load_job, job) for job in jobs]
+            try:
+                for future in as_completed(futures):
+                    result = future.result()
+                    self._report(progress, result)
+                    yield result
+            finally:
+                for future in futures:
+                    future.cancel()
+
+    def _report(self, progress: BulkLoadProgress, result: CandlesJobResult) -> None:
+        progress.add(result)
+        logger.debug(
+            "Loaded %s of %s jobs, %.1f candles per second",
+            progress.jobs_done,
+            progress.jobs_total,
+            progress.candles_per_second,
+        )
+        if self._on_progress is not None:
+            self._on_progress(progress)
+
+    def _load_job(self, job: CandlesJob) -> CandlesJobResult:
+        try:
+            if self._market_data_cache is None:
+                candles = list(
+                    self._services.get_all_candles(
+                        figi=job.figi, interval=job.interval, from_=job.from_, to=job.to
+                    )
+                )
+            else:
+                with self._storage_locks[(job.figi, job.interval)]:
+                    candles = list(
+                        self._market_data_cache.get_all_candles(
+                            figi=job.figi,
+                            interval=job.interval,
+                            from_=job.from_,
+                            to=job.to,
+                        )
+                    )
+        except Exception as error:  # pylint:disable=broad-except
+            logger.warning("Failed to load candles of %s: %s", job.figi, error)
+            return CandlesJobResult(job=job, candles=[], error=error)
+        return CandlesJobResult(job=job, candles=candles)
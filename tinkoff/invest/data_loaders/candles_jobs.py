@@ -0,0 +1,49 @@
+import dataclasses
+import time
+from datetime import datetime
+from typing import List, Optional
+
+from tinkoff.invest.schemas import CandleInterval, HistoricCandle
+
+
+@dataclasses.dataclass(frozen=True)
+class CandlesJob:
+    figi: str
+    interval: CandleInterval
+    from_: datetime
+    to: Optional[datetime] = None
+
+
+@dataclasses.dataclass()
+class CandlesJobResult:
+    job: CandlesJob
+    candles: List[HistoricCandle]
+    # Failed jobs have no candles, other jobs are loaded anyway
+    error: Optional[Exception] = None
+
+
+@dataclasses.dataclass()
+class BulkLoadProgress:
+    jobs_total: int
+    jobs_done: int = 0
+    jobs_failed: int = 0
+    candles_loaded: int = 0
+    started_at: float = dataclasses.field(default_factory=time.monotonic)
+
+    @property
+    def elapsed_seconds(self) -> float:
+        return time.monotonic() - self.started_at
+
+    @property
+    def candles_per_second(self) -> float:
+        return self.candles_loaded / max(self.elapsed_seconds, 1e-9)
+
+    @property
+    def jobs_per_second(self) -> float:
+        return self.jobs_done / max(self.elapsed_seconds, 1e-9)
+
+    def add(self, result: CandlesJobResult) -> None:
+        self.jobs_done += 1
+        self.candles_loaded += len(result.candles)
+        if result.error is not None:
+            self.jobs_failed += 1
@@ -0,0 +1,102 @@
+import asyncio
+import dataclasses
+from concurrent.futures import ThreadPoolExecutor
+from typing import AsyncGenerator, Awaitable, Callable, Generator, Optional
+
+from tinkoff.invest import _grpc_helpers
+from tinkoff.invest.schemas import (
+    GetOperationsByCursorRequest,
+    GetOperationsByCursorResponse,
+)
+
+
+@dataclasses.dataclass()
+class OperationsCursorCheckpoint:
+    """Position of a walk over `GetOperationsByCursor` pages.
+
+    It is moved forward only when all operations of a page have been
+    consumed, so a walk resumed from it never misses operations. Store
+    `cursor` and `has_next` to resume the walk in another process.
+    """
+
+    cursor: str = ""
+    has_next: bool = True
+
+    @classmethod
+    def of_request(
+        cls, request: GetOperationsByCursorRequest
+    ) -> "OperationsCursorCheckpoint":
+        if request.cursor is _grpc_helpers.PLACEHOLDER:
+            return cls()
+        return cls(cursor=request.cursor)
+
+    def advance(self, page: GetOperationsByCursorResponse) -> None:
+        self.cursor = page.next_cursor
+        self.has_next = page.has_next
+
+
+def get_page_request(
+    request: GetOperationsByCursorRequest,
+    cursor: str,
+    page_size: Optional[int],
+) -> GetOperationsByCursorRequest:
+    if page_size is None:
+        return dataclasses.replace(request, cursor=cursor)
+    return dataclasses.replace(request, cursor=cursor, limit=page_size)
+
+
+def iter_pages(
+    get_page: Callable[[str], GetOperationsByCursorResponse],
+    cursor: str,
+    prefetch: bool,
+) -> Generator[GetOperationsByCursorResponse, None, None]:
+    """Yield pages starting from `cursor` until the last one.
+
+    With `prefetch` the next page is requested in a background thread
+    while the current one is consumed.
+    """
+    if not prefetch:
+        page = get_page(cursor)
+        while page.has_next:
+            yield page
+            page = get_page(page.next_cursor)
+        yield page
+        return
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        pending = executor.submit(get_page, cursor)
+        try:
+            page = pending.result()
+            while page.has_next:
+                pending = executor.submit(get_page, page.next_cursor)
+                yield page
+                page = pending.result()
+            yield page
+        finally:
+            pending.cancel()
+
+
+async def aiter_pages(
+    get_page: Callable[[str], Awaitable[GetOperationsByCursorResponse]],
+    cursor: str,
+    prefetch: bool,
+) -> AsyncGenerator[GetOperationsByCursorResponse, None]:
+    """Asyncio counterpart of `iter_pages` prefetching in a task."""
+    if not prefetch:
+        page = await get_page(cursor)
+        while page.has_next:
+            yield page
+            page = await get_page(page.next_cursor)
+        yield page
+        return
+
+    pending = asyncio.ensure_future(get_page(cursor))
+    try:
+        page = await pending
+        while page.has_next:
+            pending = asyncio.ensure_future(get_page(page.next_cursor))
+            yield page
+            page = await pending
+        yield page
+    finally:
+        pending.cancel()
@@ -0,0 +1,30 @@
+import grpc
+
+from tinkoff.invest.deadlines.settings import DeadlineSettings
+
+
+def replace_timeout(client_call_details, timeout: float) -> grpc.aio.ClientCallDetails:
+    return grpc.aio.ClientCallDetails(
+        client_call_details.method,
+        timeout,
+        client_call_details.metadata,
+        client_call_details.credentials,
+        client_call_details.wait_for_ready,
+    )
+
+
+class AsyncDeadlineClientInterceptor(grpc.aio.UnaryUnaryClientInterceptor):
+    """Sets a timeout of the method to calls made without a timeout."""
+
+    def __init__(
+        self, settings: DeadlineSettings
+    ):  # pylint: disable=super-init-not-called
+        self._settings = settings
+
+    async def intercept_unary_unary(self, continuation, client_call_details, request):
+        timeout = self._settings.get_timeout(client_call_details.method)
+        if timeout is None or client_call_details.timeout is not None:
+            return await continuation(client_call_details, request)
+        return await continuation(
+            replace_timeout(client_call_details, timeout), request
+        )
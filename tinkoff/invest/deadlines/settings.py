@@ -0,0 +1,24 @@
+import dataclasses
+from typing import Dict, Optional, Union
+
+from tinkoff.invest.rate_limiting.scheduler import split_method
+
+
+@dataclasses.dataclass()
+class DeadlineSettings:
+    """Timeouts in seconds of unary calls.
+
+    Keys of `methods` are short service names, e.g. ``"MarketDataService"``,
+    or service and method names, e.g. ``"MarketDataService/GetCandles"``.
+    Calls of other methods get `default`, no timeout if it is None.
+    """
+
+    default: Optional[float] = None
+    methods: Dict[str, float] = dataclasses.field(default_factory=dict)
+
+    def get_timeout(self, method: Union[str, bytes]) -> Optional[float]:
+        service, name = split_method(method)
+        for key in (f"{service}/{name}", service):
+            if key in self.methods:
+                return self.methods[key]
+        return self.default
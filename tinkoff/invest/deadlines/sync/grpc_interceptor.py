@@ -0,0 +1,48 @@
+import collections
+
+import grpc
+
+from tinkoff.invest.deadlines.settings import DeadlineSettings
+
+
+class _ClientCallDetails(
+    collections.namedtuple(
+        "_ClientCallDetails",
+        (
+            "method",
+            "timeout",
+            "metadata",
+            "credentials",
+            "wait_for_ready",
+            "compression",
+        ),
+    ),
+    grpc.ClientCallDetails,
+):
+    pass
+
+
+def replace_timeout(client_call_details, timeout: float) -> grpc.ClientCallDetails:
+    return _ClientCallDetails(
+        client_call_details.method,
+        timeout,
+        client_call_details.metadata,
+        client_call_details.credentials,
+        client_call_details.wait_for_ready,
+        client_call_details.compression,
+    )
+
+
+class DeadlineClientInterceptor(grpc.UnaryUnaryClientInterceptor):
+    """Sets a timeout of the method to calls made without a timeout."""
+
+    def __init__(
+        self, settings: DeadlineSettings
+    ):  # pylint: disable=super-init-not-called
+        self._settings = settings
+
+    def intercept_unary_unary(self, continuation, client_call_details, request):
+        timeout = self._settings.get_timeout(client_call_details.method)
+        if timeout is None or client_call_details.timeout is not None:
+            return continuation(client_call_details, request)
+        return continuation(replace_timeout(client_call_details, timeout), request)
@@ -0,0 +1,177 @@
+from decimal import Decimal
+from typing import Any, Union
+
+from .schemas import MoneyValue, Quotation
+
+__all__ = ("FixedPoint", "NANOS_IN_UNIT")
+
+NANOS_IN_UNIT = 1_000_000_000
+
+
+def _div_toward_zero(dividend: int, divisor: int) -> int:
+    quotient = abs(dividend) // abs(divisor)
+    return quotient if (dividend < 0) == (divisor < 0) else -quotient
+
+
+class FixedPoint:
+    """Number with 9 fractional digits kept as a single integer of nanos.
+
+    Arithmetic and comparisons are integer operations, so price math does
+    not need `Decimal`. `Quotation` and `MoneyValue` can be used as operands
+    of addition, subtraction and comparisons, the result is a `FixedPoint`
+    on either side of the operator. The currency of `MoneyValue` is ignored.
+
+    ```python
+    price = FixedPoint.from_quotation(candle.close)
+    cost = price * quantity_in_lots * lot
+    ```
+    """
+
+    __slots__ = ("nanos",)
+
+    def __init__(self, nanos: int = 0):
+        self.nanos = nanos
+
+    @classmethod
+    def from_units(cls, units: int, nano: int = 0) -> "FixedPoint":
+        return cls(units * NANOS_IN_UNIT + nano)
+
+    @classmethod
+    def from_quotation(cls, quotation: Quotation) -> "FixedPoint":
+        return cls(quotation.units * NANOS_IN_UNIT + quotation.nano)
+
+    @classmethod
+    def from_money_value(cls, money: MoneyValue) -> "FixedPoint":
+        return cls(money.units * NANOS_IN_UNIT + money.nano)
+
+    @classmethod
+    def from_decimal(cls, value: Decimal) -> "FixedPoint":
+        # digits after the 9th are truncated
+        return cls(int(value.scaleb(9)))
+
+    @property
+    def units(self) -> int:
+        return _div_toward_zero(self.nanos, NANOS_IN_UNIT)
+
+    @property
+    def nano(self) -> int:
+        return self.nanos - self.units * NANOS_IN_UNIT
+
+    def to_quotation(self) -> Quotation:
+        units = self.units
+        return Quotation(units=units, nano=self.nanos - units * NANOS_IN_UNIT)
+
+    def to_money_value(self, currency: str) -> MoneyValue:
+        units = self.units
+        return MoneyValue(
+            currency=currency, units=units, nano=self.nanos - units * NANOS_IN_UNIT
+        )
+
+    def to_decimal(self) -> Decimal:
+        return Decimal(self.nanos).scaleb(-9)
+
+    def __float__(self) -> float:
+        return self.nanos / NANOS_IN_UNIT
+
+    def __int__(self) -> int:
+        return self.units
+
+    def __bool__(self) -> bool:
+        return self.nanos != 0
+
+    def __add__(self, other: Any) -> "FixedPoint":
+        other_nanos = _money_to_nanos(other)
+        if other_nanos is None:
+            return NotImplemented
+        return FixedPoint(self.nanos + other_nanos)
+
+    def __radd__(self, other: Any) -> "FixedPoint":
+        # sum() starts from 0
+        if other.__class__ is int and other == 0:
+            return self
+        return self.__add__(other)
+
+    def __sub__(self, other: Any) -> "FixedPoint":
+        other_nanos = _money_to_nanos(other)
+        if other_nanos is None:
+            return NotImplemented
+        return FixedPoint(self.nanos - other_nanos)
+
+    def __rsub__(self, other: Any) -> "FixedPoint":
+        other_nanos = _money_to_nanos(other)
+        if other_nanos is None:
+            return NotImplemented
+        return FixedPoint(other_nanos - self.nanos)
+
+    def __mul__(self, other: Union[int, "FixedPoint"]) -> "FixedPoint":
+        if isinstance(other, int):
+            return FixedPoint(self.nanos * other)
+        if isinstance(other, FixedPoint):
+            return FixedPoint(_div_toward_zero(self.nanos * other.nanos, NANOS_IN_UNIT))
+        return NotImplemented
+
+    __rmul__ = __mul__
+
+    def __truediv__(self, other: Union[int, "FixedPoint"]) -> "FixedPoint":
+        if isinstance(other, int):
+            return FixedPoint(_div_toward_zero(self.nanos, other))
+        if isinstance(other, FixedPoint):
+            return FixedPoint(_div_toward_zero(self.nanos * NANOS_IN_UNIT, other.nanos))
+        return NotImplemented
+
+    def __neg__(self) -> "FixedPoint":
+        return FixedPoint(-self.nanos)
+
+    def __pos__(self) -> "FixedPoint":
+        return self
+
+    def __abs__(self) -> "FixedPoint":
+        return FixedPoint(abs(self.nanos))
+
+    def __eq__(self, other: object) -> bool:
+        other_nanos = _money_to_nanos(other)
+        if other_nanos is None:
+            return NotImplemented
+        return self.nanos == other_nanos
+
+    def __hash__(self) -> int:
+        # equal to the hash of the same normalized Quotation
+        return hash(divmod(self.nanos, NANOS_IN_UNIT))
+
+    def __lt__(self, other: Any) -> bool:
+        other_nanos = _money_to_nanos(other)
+        if other_nanos is None:
+            return NotImplemented
+        return self.nanos < other_nanos
+
+    def __le__(self, other: Any) -> bool:
+        other_nanos = _money_to_nanos(other)
+        if other_nanos is None:
+            return NotImplemented
+        return self.nanos <= other_nanos
+
+    def __gt__(self, other: Any) -> bool:
+        other_nanos = _money_to_nanos(other)
+        if other_nanos is None:
+            return NotImplemented
+        return self.nanos > other_nanos
+
+    def __ge__(self, other: Any) -> bool:
+        other_nanos = _money_to_nanos(other)
+        if other_nanos is None:
+            return NotImplemented
+        return self.nanos >= other_nanos
+
+    def __repr__(self) -> str:
+        return f"FixedPoint(nanos={self.nanos})"
+
+    def __str__(self) -> str:
+        return str(self.to_decimal())
+
+
+def _money_to_nanos(value: Any) -> Any:
+    if isinstance(value, FixedPoint):
+        return value.nanos
+    if isinstance(value, (Quotation, MoneyValue)):
+        return value.units * NANOS_IN_UNIT + value.nano
+    return None
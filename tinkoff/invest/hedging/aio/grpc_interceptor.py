@@ -0,0 +1,96 @@
+import asyncio
+import logging
+import time
+from typing import List, Optional
+
+import grpc
+
+from tinkoff.invest.deadlines.aio.grpc_interceptor import replace_timeout
+from tinkoff.invest.hedging.latency_tracker import LatencyTracker
+from tinkoff.invest.hedging.settings import HedgingSettings
+
+logger = logging.getLogger(__name__)
+
+
+def _is_successful(attempt: asyncio.Future) -> bool:
+    if attempt.exception() is not None:
+        return False
+    _, _, succeeded = attempt.result()
+    return succeeded
+
+
+class AsyncHedgingClientInterceptor(grpc.aio.UnaryUnaryClientInterceptor):
+    """Sends a second request of a slow call and takes the first response.
+
+    The losing request is cancelled.
+    """
+
+    def __init__(
+        self, settings: Optional[HedgingSettings] = None
+    ):  # pylint: disable=super-init-not-called
+        self._latencies = LatencyTracker(settings or HedgingSettings())
+
+    async def intercept_unary_unary(self, continuation, client_call_details, request):
+        method = client_call_details.method
+        if not self._latencies.is_hedged(method):
+            return await continuation(client_call_details, request)
+
+        started = time.monotonic()
+        attempts = [
+            asyncio.ensure_future(
+                self._attempt(continuation, client_call_details, request)
+            )
+        ]
+        try:
+            delay = self._latencies.get_delay(method)
+            done, _ = await asyncio.wait(attempts, timeout=delay)
+            if not done:
+                logger.debug("Hedging call of %s", method)
+                client_call_details = self._get_hedge_call_details(
+                    client_call_details, delay
+                )
+                attempts.append(
+                    asyncio.ensure_future(
+                        self._attempt(continuation, client_call_details, request)
+                    )
+                )
+            attempt = await self._wait_successful(attempts)
+        finally:
+            for pending in attempts:
+                pending.cancel()
+        call, finished, succeeded = attempt.result()
+        if succeeded:
+            # the latency of the call, whichever request answered it
+            self._latencies.record(method, finished - started)
+        return call
+
+    @staticmethod
+    def _get_hedge_call_details(client_call_details, delay: float):
+        if client_call_details.timeout is None:
+            return client_call_details
+        # the second request ends with the first one
+        return replace_timeout(
+            client_call_details, max(client_call_details.timeout - delay, 0)
+        )
+
+    @staticmethod
+    async def _attempt(continuation, client_call_details, request):
+        call = await continuation(client_call_details, request)
+        try:
+            await call
+        except grpc.RpcError:
+            # raised again to the caller awaiting the call
+            return call, time.monotonic(), False
+        return call, time.monotonic(), True
+
+    @staticmethod
+    async def _wait_successful(attempts: List[asyncio.Future]) -> asyncio.Future:
+        pending = set(attempts)
+        while True:
+            done, pending = await asyncio.wait(
+                pending, return_when=asyncio.FIRST_COMPLETED
+            )
+            successful = [attempt for attempt in done if _is_successful(attempt)]
+            if successful or not pending:
+                # errors of the first request are raised if none succeeded
+                return successful[0] if successful else attempts[0]
@@ -0,0 +1,36 @@
+import math
+import threading
+from collections import defaultdict, deque
+from typing import DefaultDict, Deque, Union
+
+from tinkoff.invest.hedging.settings import HedgingSettings
+from tinkoff.invest.rate_limiting.scheduler import split_method
+
+
+class LatencyTracker:
+    """Keeps recent latencies of methods to find delays of hedged requests."""
+
+    def __init__(self, settings: HedgingSettings):
+        self._settings = settings
+        self._lock = threading.Lock()
+        self._latencies: DefaultDict[str, Deque[float]] = defaultdict(
+            lambda: deque(maxlen=settings.max_samples)
+        )
+
+    def is_hedged(self, method: Union[str, bytes]) -> bool:
+        _, name = split_method(method)
+        return name in self._settings.methods
+
+    def record(self, method: Union[str, bytes], latency: float) -> None:
+        _, name = split_method(method)
+        with self._lock:
+            self._latencies[name].append(latency)
+
+    def get_delay(self, method: Union[str, bytes]) -> float:
+        _, name = split_method(method)
+        with self._lock:
+            latencies = sorted(self._latencies[name])
+        if len(latencies) < self._settings.min_samples:
+            return self._settings.initial_delay
+        index = math.ceil(self._settings.percentile / 100 * len(latencies)) - 1
+        return max(latencies[max(index, 0)], self._settings.min_delay)
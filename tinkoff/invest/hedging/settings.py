@@ -0,0 +1,34 @@
+import dataclasses
+from typing import FrozenSet
+
+# Idempotent reads of market data, safe to send twice
+HEDGED_METHODS = frozenset(
+    {
+        "GetCandles",
+        "GetClosePrices",
+        "GetLastPrices",
+        "GetLastTrades",
+        "GetOrderBook",
+        "GetTradingStatus",
+        "GetTradingStatuses",
+    }
+)
+
+
+@dataclasses.dataclass()
+class HedgingSettings:
+    """Settings of hedged calls.
+
+    A second request of a call to one of `methods` is sent when the first one
+    takes longer than `percentile` of latencies of the method, and the first
+    response received wins. Until `min_samples` latencies are known
+    `initial_delay` seconds are waited. A hedged call takes two requests of
+    the rate limit.
+    """
+
+    methods: FrozenSet[str] = HEDGED_METHODS
+    percentile: float = 95.0
+    initial_delay: float = 1.0
+    min_delay: float = 0.01
+    min_samples: int = 20
+    max_samples: int = 200
@@ -0,0 +1,106 @@
+import logging
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import List, Optional
+
+import grpc
+
+from tinkoff.invest.deadlines.sync.grpc_interceptor import replace_timeout
+from tinkoff.invest.hedging.latency_tracker import LatencyTracker
+from tinkoff.invest.hedging.settings import HedgingSettings
+
+logger = logging.getLogger(__name__)
+
+
+def _is_successful(attempt: Future) -> bool:
+    if attempt.exception() is not None:
+        return False
+    call, _ = attempt.result()
+    return call.exception() is None
+
+
+class HedgingClientInterceptor(grpc.UnaryUnaryClientInterceptor):
+    """Sends a second request of a slow call and takes the first response.
+
+    Requests are made in a pool of `max_workers` threads and never wait for
+    a free one: when all of them are busy, a call is made in the calling
+    thread without hedging and a second request is not sent. A losing
+    request can not be cancelled and runs to its end in the pool.
+    """
+
+    def __init__(
+        self, settings: Optional[HedgingSettings] = None, max_workers: int = 16
+    ):  # pylint: disable=super-init-not-called
+        self._latencies = LatencyTracker(settings or HedgingSettings())
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="hedging"
+        )
+        self._free_workers = threading.BoundedSemaphore(max_workers)
+
+    def close(self) -> None:
+        self._executor.shutdown(wait=False)
+
+    def intercept_unary_unary(self, continuation, client_call_details, request):
+        method = client_call_details.method
+        if not self._latencies.is_hedged(method):
+            return continuation(client_call_details, request)
+
+        started = time.monotonic()
+        if not self._take_worker():
+            call = continuation(client_call_details, request)
+            if call.exception() is None:
+                self._latencies.record(method, time.monotonic() - started)
+            return call
+        attempts = [self._submit(continuation, client_call_details, request)]
+        delay = self._latencies.get_delay(method)
+        done, _ = wait(attempts, timeout=delay)
+        if not done and self._take_worker():
+            logger.debug("Hedging call of %s", method)
+            client_call_details = self._get_hedge_call_details(
+                client_call_details, delay
+            )
+            attempts.append(self._submit(continuation, client_call_details, request))
+        attempt = self._wait_successful(attempts)
+        call, finished = attempt.result()
+        if call.exception() is None:
+            # the latency of the call, whichever request answered it
+            self._latencies.record(method, finished - started)
+        return call
+
+    def _take_worker(self) -> bool:
+        # the worker is given back when its request ends
+        return self._free_workers.acquire(  # pylint:disable=consider-using-with
+            blocking=False
+        )
+
+    def _submit(self, continuation, client_call_details, request) -> Future:
+        return self._executor.submit(
+            self._attempt, continuation, client_call_details, request
+        )
+
+    @staticmethod
+    def _get_hedge_call_details(client_call_details, delay: float):
+        if client_call_details.timeout is None:
+            return client_call_details
+        # the second request ends with the first one
+        return replace_timeout(
+            client_call_details, max(client_call_details.timeout - delay, 0)
+        )
+
+    def _attempt(self, continuation, client_call_details, request):
+        try:
+            call = continuation(client_call_details, request)
+        finally:
+            self._free_workers.release()
+        return call, time.monotonic()
+
+    @staticmethod
+    def _wait_successful(attempts: List[Future]) -> Future:
+        pending = set(attempts)
+        while True:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            successful = [attempt for attempt in done if _is_successful(attempt)]
+            if successful or not pending:
+                # errors of the first request are raised if none succeeded
+                return successful[0] if successful else attempts[0]
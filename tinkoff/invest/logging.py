@@ -1,7 +1,7 @@
 import logging
 from collections import namedtuple
 from contextvars import ContextVar
-from typing import Any, Optional
+from typing import Any, Iterable, Optional, Tuple
 
 from .constants import (
     MESSAGE,
@@ -17,6 +17,7 @@ __all__ = (
     "get_tracking_id_from_coro",
     "get_metadata_from_call",
     "get_metadata_from_aio_error",
+    "get_metadata_from_aio_call",
     "log_request",
     "log_error",
 )
@@ -94,7 +95,16 @@ def get_metadata_from_call(call: Any) -> Optional[Metadata]:
 
 
 def get_metadata_from_aio_error(err: Any) -> Optional[Metadata]:
-    metadata = err.initial_metadata() or err.trailing_metadata()
+    return _parse_metadata(err.initial_metadata() or err.trailing_metadata())
+
+
+async def get_metadata_from_aio_call(call: Any) -> Optional[Metadata]:
+    return _parse_metadata(
+        await call.initial_metadata() or await call.trailing_metadata()
+    )
+
+
+def _parse_metadata(metadata: Iterable[Tuple[str, Any]]) -> Optional[Metadata]:
     tracking_id = None
     ratelimit_limit = None
     ratelimit_remaining = None
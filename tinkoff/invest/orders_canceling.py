@@ -0,0 +1,96 @@
+import dataclasses
+import logging
+from typing import TYPE_CHECKING, List, Optional
+
+from .typedefs import AccountId
+
+if TYPE_CHECKING:
+    from .async_services import OrdersService as AsyncOrdersService
+    from .async_services import StopOrdersService as AsyncStopOrdersService
+    from .services import OrdersService, StopOrdersService
+
+__all__ = (
+    "OrderCancellation",
+    "CancelAllOrdersResult",
+)
+
+logger = logging.getLogger(__name__)
+
+
+@dataclasses.dataclass()
+class OrderCancellation:
+    order_id: str
+    is_stop_order: bool = False
+    # Failed cancellations do not stop the others
+    error: Optional[Exception] = None
+
+    @property
+    def is_cancelled(self) -> bool:
+        return self.error is None
+
+
+@dataclasses.dataclass()
+class CancelAllOrdersResult:
+    cancellations: List[OrderCancellation] = dataclasses.field(default_factory=list)
+
+    @property
+    def failed(self) -> List[OrderCancellation]:
+        return [
+            cancellation
+            for cancellation in self.cancellations
+            if not cancellation.is_cancelled
+        ]
+
+
+def cancel_order(
+    orders_service: "OrdersService", account_id: AccountId, order_id: str
+) -> OrderCancellation:
+    try:
+        orders_service.cancel_order(account_id=account_id, order_id=order_id)
+    except Exception as error:  # pylint:disable=broad-except
+        logger.warning("Failed to cancel order %s: %s", order_id, error)
+        return OrderCancellation(order_id=order_id, error=error)
+    return OrderCancellation(order_id=order_id)
+
+
+def cancel_stop_order(
+    stop_orders_service: "StopOrdersService", account_id: AccountId, stop_order_id: str
+) -> OrderCancellation:
+    try:
+        stop_orders_service.cancel_stop_order(
+            account_id=account_id, stop_order_id=stop_order_id
+        )
+    except Exception as error:  # pylint:disable=broad-except
+        logger.warning("Failed to cancel stop order %s: %s", stop_order_id, error)
+        return OrderCancellation(
+            order_id=stop_order_id, is_stop_order=True, error=error
+        )
+    return OrderCancellation(order_id=stop_order_id, is_stop_order=True)
+
+
+async def acancel_order(
+    orders_service: "AsyncOrdersService", account_id: AccountId, order_id: str
+) -> OrderCancellation:
+    try:
+        await orders_service.cancel_order(account_id=account_id, order_id=order_id)
+    except Exception as error:  # pylint:disable=broad-except
+        logger.warning("Failed to cancel order %s: %s", order_id, error)
+        return OrderCancellation(order_id=order_id, error=error)
+    return OrderCancellation(order_id=order_id)
+
+
+async def acancel_stop_order(
+    stop_orders_service: "AsyncStopOrdersService",
+    account_id: AccountId,
+    stop_order_id: str,
+) -> OrderCancellation:
+    try:
+        await stop_orders_service.cancel_stop_order(
+            account_id=account_id, stop_order_id=stop_order_id
+        )
+    except Exception as error:  # pylint:disable=broad-except
+        logger.warning("Failed to cancel stop order %s: %s", stop_order_id, error)
+        return OrderCancellation(
+            order_id=stop_order_id, is_stop_order=True, error=error
+        )
+    return OrderCancellation(order_id=stop_order_id, is_stop_order=True)
@@ -0,0 +1,26 @@
+import asyncio
+import logging
+
+import grpc
+
+from tinkoff.invest.logging import get_metadata_from_aio_call
+from tinkoff.invest.rate_limiting.scheduler import RateLimitScheduler
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncRateLimitClientInterceptor(grpc.aio.UnaryUnaryClientInterceptor):
+    def __init__(
+        self, scheduler: RateLimitScheduler
+    ):  # pylint: disable=super-init-not-called
+        self._scheduler = scheduler
+
+    async def intercept_unary_unary(self, continuation, client_call_details, request):
+        method = client_call_details.method
+        seconds_to_sleep = self._scheduler.reserve(method)
+        if seconds_to_sleep > 0:
+            logger.debug("Delaying %s for %s seconds", method, seconds_to_sleep)
+            await asyncio.sleep(seconds_to_sleep)
+        call = await continuation(client_call_details, request)
+        self._scheduler.update(method, await get_metadata_from_aio_call(call))
+        return call
@@ -0,0 +1,145 @@
+import logging
+import threading
+import time
+from typing import Callable, Dict, List, Mapping, Optional, Tuple, Union
+
+from tinkoff.invest.logging import Metadata
+
+logger = logging.getLogger(__name__)
+
+# Limits of the API are set per minute
+DEFAULT_WINDOW = 60.0
+
+GET_CANDLES_METHOD = "MarketDataService/GetCandles"
+
+
+def parse_ratelimit_limit(value: str) -> Tuple[int, float]:
+    """Parse `x-ratelimit-limit` header, e.g. ``"200, 200;w=60"``.
+
+    Returns number of requests and window in seconds.
+    """
+    limit, _, policy = value.partition(",")
+    window = DEFAULT_WINDOW
+    for param in policy.split(";")[1:]:
+        name, _, param_value = param.strip().partition("=")
+        if name == "w":
+            window = float(param_value)
+    return int(limit), window
+
+
+def split_method(method: Union[str, bytes]) -> Tuple[str, str]:
+    """Split full grpc method name into short service and method names.
+
+    ``"/tinkoff.public.invest.api.contract.v1.MarketDataService/GetCandles"``
+    becomes ``("MarketDataService", "GetCandles")``.
+    """
+    if isinstance(method, bytes):
+        method = method.decode()
+    service, _, name = method.strip("/").rpartition("/")
+    return service.rpartition(".")[2], name
+
+
+class TokenBucket:
+    """Token bucket refilled at `limit` tokens per `window` seconds.
+
+    Tokens may go below zero: a caller takes a token at once and waits until
+    the debt is paid off, so waiting callers are served in order.
+    """
+
+    __slots__ = ("limit", "window", "tokens", "_updated")
+
+    def __init__(
+        self, limit: int, window: float, now: float, tokens: Optional[float] = None
+    ):
+        self.limit = limit
+        self.window = window
+        self.tokens = float(limit if tokens is None else tokens)
+        self._updated = now
+
+    @property
+    def rate(self) -> float:
+        return self.limit / self.window
+
+    def reserve(self, now: float) -> float:
+        """Take a token and return seconds to wait before using it."""
+        self._refill(now)
+        self.tokens -= 1
+        if self.tokens >= 0:
+            return 0.0
+        return -self.tokens / self.rate
+
+    def learn(
+        self, limit: int, window: float, remaining: int, reset: int, now: float
+    ) -> None:
+        """Corrects the bucket with the budget reported by the server."""
+        self._refill(now)
+        self.limit = limit
+        self.window = window
+        self.tokens = min(self.tokens, remaining)
+        if remaining <= 0:
+            # nothing is left until the window of the server resets
+            self.tokens = min(self.tokens, 1 - reset * self.rate)
+
+    def _refill(self, now: float) -> None:
+        elapsed = now - self._updated
+        self._updated = now
+        self.tokens = min(self.limit, self.tokens + elapsed * self.rate)
+
+
+class RateLimitScheduler:
+    """Delays calls so that they fit into the rate limits of the API.
+
+    Budgets of methods are learned from `x-ratelimit-*` headers of responses.
+    Limits known beforehand are given in requests per minute for a service
+    (``"MarketDataService"``) or a method (``"MarketDataService/GetCandles"``).
+    A call waits until both its service and its method have a token.
+
+    The scheduler is thread-safe and may be shared between clients using
+    the same token.
+    """
+
+    def __init__(
+        self,
+        limits: Optional[Mapping[str, int]] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self._clock = clock
+        self._lock = threading.Lock()
+        now = clock()
+        self._buckets: Dict[str, TokenBucket] = {
+            name: TokenBucket(limit, DEFAULT_WINDOW, now)
+            for name, limit in (limits or {}).items()
+        }
+
+    def reserve(self, method: Union[str, bytes]) -> float:
+        """Take tokens for a call and return seconds to wait before it."""
+        service, name = split_method(method)
+        now = self._clock()
+        delays: List[float] = [0.0]
+        with self._lock:
+            for key in (service, f"{service}/{name}"):
+                bucket = self._buckets.get(key)
+                if bucket is not None:
+                    delays.append(bucket.reserve(now))
+        return max(delays)
+
+    def update(self, method: Union[str, bytes], metadata: Optional[Metadata]) -> None:
+        """Learns the budget of a method from response metadata."""
+        if (
+            metadata is None
+            or metadata.ratelimit_limit is None
+            or metadata.ratelimit_remaining is None
+        ):
+            return
+        limit, window = parse_ratelimit_limit(metadata.ratelimit_limit)
+        remaining = metadata.ratelimit_remaining
+        reset = metadata.ratelimit_reset or 0
+        service, name = split_method(method)
+        key = f"{service}/{name}"
+        now = self._clock()
+        with self._lock:
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                bucket = self._buckets[key] = TokenBucket(limit, window, now)
+            bucket.learn(limit, window, remaining, reset, now)
+        logger.debug("%s has %s of %s requests left", key, remaining, limit)
@@ -1,11 +1,16 @@
 # pylint:disable=too-many-lines
 # pylint:disable=too-many-instance-attributes
-from dataclasses import dataclass
 from datetime import datetime
-from typing import List, SupportsAbs
+from typing import TYPE_CHECKING, List, SupportsAbs
 
 from . import _grpc_helpers
 
+if TYPE_CHECKING:
+    # type checkers understand the standard decorator only
+    from dataclasses import dataclass
+else:
+    dataclass = _grpc_helpers.slotted_dataclass
+
 
 class SecurityTradingStatus(_grpc_helpers.Enum):
     SECURITY_TRADING_STATUS_UNSPECIFIED = 0
@@ -353,12 +358,16 @@ class Quotation(_grpc_helpers.Message, SupportsAbs):
         self.nano = nano % max_quotation_nano
 
     def __add__(self, other: "Quotation") -> "Quotation":
+        if not isinstance(other, Quotation):
+            return NotImplemented
         return Quotation(
             units=self.units + other.units,
             nano=self.nano + other.nano,
         )
 
     def __sub__(self, other: "Quotation") -> "Quotation":
+        if not isinstance(other, Quotation):
+            return NotImplemented
         return Quotation(
             units=self.units - other.units,
             nano=self.nano - other.nano,
@@ -373,21 +382,29 @@ class Quotation(_grpc_helpers.Message, SupportsAbs):
         return self.units == other.units and self.nano == other.nano
 
     def __lt__(self, other: "Quotation") -> bool:
+        if not isinstance(other, Quotation):
+            return NotImplemented
         return self.units < other.units or (
             self.units == other.units and self.nano < other.nano
         )
 
     def __le__(self, other: "Quotation") -> bool:
+        if not isinstance(other, Quotation):
+            return NotImplemented
         return self.units < other.units or (
             self.units == other.units and self.nano <= other.nano
         )
 
     def __gt__(self, other: "Quotation") -> bool:
+        if not isinstance(other, Quotation):
+            return NotImplemented
         return self.units > other.units or (
             self.units == other.units and self.nano > other.nano
         )
 
     def __ge__(self, other: "Quotation") -> bool:
+        if not isinstance(other, Quotation):
+            return NotImplemented
         return self.units > other.units or (
             self.units == other.units and self.nano >= other.nano
         )
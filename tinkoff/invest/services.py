@@ -1,13 +1,16 @@
 # pylint:disable=redefined-builtin,too-many-lines
 import abc
 import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import Dict, Generator, Iterable, List, Optional, Tuple
+from typing import TYPE_CHECKING, Any, Dict, Generator, Iterable, List, Optional, Tuple
 
 import grpc
 from deprecation import deprecated
 
 from . import _grpc_helpers
+from ._concurrency import ordered_map
 from ._errors import handle_request_error, handle_request_error_gen
 from .caching.market_data_cache.cache_settings import MarketDataCacheSettings
 from .caching.market_data_cache.instrument_date_range_market_data import (
@@ -16,6 +19,11 @@ from .caching.market_data_cache.instrument_date_range_market_data import (
 from .caching.market_data_cache.instrument_market_data_storage import (
     InstrumentMarketDataStorage,
 )
+from .data_loaders.operations_cursor import (
+    OperationsCursorCheckpoint,
+    get_page_request,
+    iter_pages,
+)
 from .grpc import (
     instruments_pb2,
     instruments_pb2_grpc,
@@ -35,6 +43,8 @@ from .grpc import (
 from .logging import get_tracking_id_from_call, log_request
 from .market_data_stream.market_data_stream_manager import MarketDataStreamManager
 from .metadata import get_metadata
+from .orders_canceling import CancelAllOrdersResult, cancel_order, cancel_stop_order
+from .rate_limiting.scheduler import GET_CANDLES_METHOD, RateLimitScheduler
 from .schemas import (
     AssetRequest,
     AssetResponse,
@@ -129,6 +139,7 @@ from .schemas import (
     MoneyValue,
     OpenSandboxAccountRequest,
     OpenSandboxAccountResponse,
+    OperationItem,
     OperationsRequest,
     OperationsResponse,
     OperationState,
@@ -175,6 +186,9 @@ from .utils import (
     with_filtering_distinct_candles,
 )
 
+if TYPE_CHECKING:
+    from .columnar import HistoricCandleColumns
+
 __all__ = (
     "Services",
     "InstrumentsService",
@@ -192,6 +206,11 @@ __all__ = (
 logger = logging.getLogger(__name__)
 
 
+def _wait_for_get_candles(scheduler: Optional[RateLimitScheduler]) -> None:
+    if scheduler is not None:
+        time.sleep(scheduler.reserve(GET_CANDLES_METHOD))
+
+
 class ICandleGetter(abc.ABC):
     @abc.abstractmethod
     def get_all_candles(
@@ -207,6 +226,7 @@ class ICandleGetter(abc.ABC):
 
 class MarketDataCache(ICandleGetter):
     def __init__(self, settings: MarketDataCacheSettings, services: "Services"):
+        _grpc_helpers.check_response_format(services.response_format, "MarketDataCache")
         self._settings = settings
         self._settings.base_cache_dir.mkdir(parents=True, exist_ok=True)
         self._services = services
@@ -217,12 +237,14 @@ class MarketDataCache(ICandleGetter):
     def _get_candles_from_net(
         self, figi: str, interval: CandleInterval, from_: datetime, to: datetime
     ) -> Iterable[HistoricCandle]:
-        yield from self._services.get_all_candles(
+        candles = self._services.get_all_candles(
             figi=figi,
             interval=interval,
             from_=from_,
             to=to,
         )
+        # cached candles are written as dataclasses, views are materialized
+        yield from map(_grpc_helpers.materialize, candles)
 
     def _with_saving_into_cache(
         self,
@@ -323,48 +345,107 @@ class MarketDataCache(ICandleGetter):
         return start, floor_datetime(end, interval_delta)
 
 
-class Services(ICandleGetter):
+class Services(ICandleGetter):  # pylint:disable=too-many-instance-attributes
     def __init__(
         self,
         channel: grpc.Channel,
         token: str,
         sandbox_token: Optional[str] = None,
         app_name: Optional[str] = None,
+        response_format: _grpc_helpers.ResponseFormat = (
+            _grpc_helpers.ResponseFormat.DATACLASS
+        ),
     ) -> None:
         metadata = get_metadata(token, app_name)
         sandbox_metadata = get_metadata(sandbox_token or token, app_name)
-        self.instruments = InstrumentsService(channel, metadata)
-        self.market_data = MarketDataService(channel, metadata)
-        self.market_data_stream = MarketDataStreamService(channel, metadata)
-        self.operations = OperationsService(channel, metadata)
-        self.operations_stream = OperationsStreamService(channel, metadata)
-        self.orders_stream = OrdersStreamService(channel, metadata)
-        self.orders = OrdersService(channel, metadata)
-        self.users = UsersService(channel, metadata)
-        self.sandbox = SandboxService(channel, sandbox_metadata)
-        self.stop_orders = StopOrdersService(channel, metadata)
+        self.response_format = response_format
+        self.instruments = InstrumentsService(channel, metadata, response_format)
+        self.market_data = MarketDataService(channel, metadata, response_format)
+        self.market_data_stream = MarketDataStreamService(
+            channel, metadata, response_format
+        )
+        self.operations = OperationsService(channel, metadata, response_format)
+        self.operations_stream = OperationsStreamService(
+            channel, metadata, response_format
+        )
+        self.orders_stream = OrdersStreamService(channel, metadata, response_format)
+        self.orders = OrdersService(channel, metadata, response_format)
+        self.users = UsersService(channel, metadata, response_format)
+        self.sandbox = SandboxService(channel, sandbox_metadata, response_format)
+        self.stop_orders = StopOrdersService(channel, metadata, response_format)
 
     def create_market_data_stream(self) -> MarketDataStreamManager:
         return MarketDataStreamManager(
             market_data_stream_service=self.market_data_stream
         )
 
-    def cancel_all_orders(self, account_id: AccountId) -> None:
+    def cancel_all_orders(
+        self, account_id: AccountId, max_workers: int = 4
+    ) -> CancelAllOrdersResult:
+        """Cancel all orders and stop orders of the account.
+
+        Orders and stop orders are fetched in parallel, then up to
+        `max_workers` of them are cancelled at once in a pool of threads.
+        A failed cancellation does not stop the others, see `failed` of
+        the result.
+        """
+        _grpc_helpers.check_response_format(self.response_format, "cancel_all_orders")
         orders_service: OrdersService = self.orders
         stop_orders_service: StopOrdersService = self.stop_orders
 
-        orders_response = orders_service.get_orders(account_id=account_id)
-        for order in orders_response.orders:
-            orders_service.cancel_order(account_id=account_id, order_id=order.order_id)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            orders_future = executor.submit(
+                orders_service.get_orders, account_id=account_id
+            )
+            stop_orders_future = executor.submit(
+                stop_orders_service.get_stop_orders, account_id=account_id
+            )
+            cancellations = [
+                executor.submit(
+                    cancel_order, orders_service, account_id, order.order_id
+                )
+                for order in orders_future.result().orders
+            ]
+            cancellations.extend(
+                executor.submit(
+                    cancel_stop_order,
+                    stop_orders_service,
+                    account_id,
+                    stop_order.stop_order_id,
+                )
+                for stop_order in stop_orders_future.result().stop_orders
+            )
+            return CancelAllOrdersResult(
+                cancellations=[future.result() for future in cancellations]
+            )
 
-        stop_orders_response = stop_orders_service.get_stop_orders(
-            account_id=account_id
-        )
-        for stop_order in stop_orders_response.stop_orders:
-            stop_orders_service.cancel_stop_order(
-                account_id=account_id, stop_order_id=stop_order.stop_order_id
+    def get_all_operations_by_cursor(
+        self,
+        request: GetOperationsByCursorRequest,
+        *,
+        page_size: Optional[int] = None,
+        checkpoint: Optional[OperationsCursorCheckpoint] = None,
+        prefetch: bool = True,
+    ) -> Generator[OperationItem, None, None]:
+        """Yield operations of all pages starting from `request.cursor`.
+
+        `page_size` overrides `request.limit`. With `prefetch` the next page is
+        requested in a background thread while the current one is consumed.
+        A given `checkpoint` is resumed from and moved forward page by page.
+        """
+        checkpoint = checkpoint or OperationsCursorCheckpoint.of_request(request)
+        if not checkpoint.has_next:
+            return
+
+        def get_page(cursor: str) -> GetOperationsByCursorResponse:
+            return self.operations.get_operations_by_cursor(
+                get_page_request(request, cursor, page_size)
             )
 
+        for page in iter_pages(get_page, checkpoint.cursor, prefetch):
+            yield from page.items
+            checkpoint.advance(page)
+
     # pylint:disable=too-many-nested-blocks
     def get_all_candles(
         self,
@@ -373,18 +454,33 @@ class Services(ICandleGetter):
         to: Optional[datetime] = None,
         interval: CandleInterval = CandleInterval(0),
         figi: str = "",
+        max_concurrency: int = 1,
+        rate_limit_scheduler: Optional[RateLimitScheduler] = None,
     ) -> Generator[HistoricCandle, None, None]:
+        """Yield candles of the period requested window by window.
+
+        With `max_concurrency` above one, up to that many windows are requested
+        in parallel threads. Candles are still yielded in time order. Requests
+        wait for tokens of `rate_limit_scheduler` if it is given; a client with
+        `RateLimitClientInterceptor` throttles them already.
+        """
+        _grpc_helpers.check_response_format(self.response_format, "get_all_candles")
         to = to or now()
 
-        previous_candles = set()
-        for current_from, current_to in get_intervals(interval, from_, to):
-            candles_response: GetCandlesResponse = self.market_data.get_candles(
+        def get_candles(window: Tuple[datetime, datetime]) -> GetCandlesResponse:
+            _wait_for_get_candles(rate_limit_scheduler)
+            current_from, current_to = window
+            return self.market_data.get_candles(
                 figi=figi,
                 interval=interval,
                 from_=current_from,
                 to=current_to,
             )
 
+        previous_candles = set()
+        for candles_response in ordered_map(
+            get_candles, get_intervals(interval, from_, to), max_concurrency
+        ):
             for candle in candles_response.candles:
                 if candle not in previous_candles:
                     yield candle
@@ -392,6 +488,47 @@ class Services(ICandleGetter):
 
             previous_candles = set(candles_response.candles)
 
+    def get_all_candles_columns(
+        self,
+        *,
+        from_: datetime,
+        to: Optional[datetime] = None,
+        interval: CandleInterval = CandleInterval(0),
+        figi: str = "",
+        instrument_id: str = "",
+        as_float: bool = False,
+        max_concurrency: int = 1,
+        rate_limit_scheduler: Optional[RateLimitScheduler] = None,
+    ) -> "HistoricCandleColumns":
+        from .columnar import (  # pylint:disable=import-outside-toplevel
+            concatenate_candle_columns,
+        )
+
+        to = to or now()
+
+        def get_candles_columns(
+            window: Tuple[datetime, datetime]
+        ) -> "HistoricCandleColumns":
+            _wait_for_get_candles(rate_limit_scheduler)
+            current_from, current_to = window
+            return self.market_data.get_candles_columns(
+                figi=figi,
+                interval=interval,
+                from_=current_from,
+                to=current_to,
+                instrument_id=instrument_id,
+                as_float=as_float,
+            )
+
+        return concatenate_candle_columns(
+            ordered_map(
+                get_candles_columns,
+                get_intervals(interval, from_, to),
+                max_concurrency,
+            ),
+            as_float=as_float,
+        )
+
 
 class InstrumentsService(_grpc_helpers.Service):
     _stub_factory = instruments_pb2_grpc.InstrumentsServiceStub
@@ -417,7 +554,7 @@ class InstrumentsService(_grpc_helpers.Service):
             metadata=self.metadata,
         )
         log_request(get_tracking_id_from_call(call), "TradingSchedules")
-        return _grpc_helpers.protobuf_to_dataclass(response, TradingSchedulesResponse)
+        return self._convert_response(response, TradingSchedulesResponse)
 
     @handle_request_error("BondBy")
     def bond_by(
@@ -438,7 +575,7 @@ class InstrumentsService(_grpc_helpers.Service):
             metadata=self.metadata,
         )
         log_request(get_tracking_id_from_call(call), "BondBy")
-        return _grpc_helpers.protobuf_to_dataclass(response, BondResponse)
+        return self._convert_response(response, BondResponse)
 
     @handle_request_error("Bonds")
     def bonds(
@@ -453,7 +590,7 @@ class InstrumentsService(_grpc_helpers.Service):
             metadata=self.metadata,
         )
         log_request(get_tracking_id_from_call(call), "Bonds")
-        return _grpc_helpers.protobuf_to_dataclass(response, BondsResponse)
+        return self._convert_response(response, BondsResponse)
 
     @handle_request_error("CurrencyBy")
     def currency_by(
@@ -474,7 +611,7 @@ class InstrumentsService(_grpc_helpers.Service):
             metadata=self.metadata,
         )
         log_request(get_tracking_id_from_call(call), "CurrencyBy")
-        return _grpc_helpers.protobuf_to_dataclass(response, CurrencyResponse)
+        return self._convert_response(response, CurrencyResponse)
 
     @handle_request_error("Currencies")
     def currencies(
@@ -489,7 +626,7 @@ class InstrumentsService(_grpc_helpers.Service):
             metadata=self.metadata,
         )
         log_request(get_tracking_id_from_call(call), "Currencies")
-        return _grpc_helpers.protobuf_to_dataclass(response, CurrenciesResponse)
+        return self._convert_response(response, CurrenciesResponse)
 
     @handle_request_error("EtfBy")
     def etf_by(
@@ -510,7 +647,7 @@ class InstrumentsService(_grpc_helpers.Service):
             metadata=self.metadata,
         )
         log_request(get_tracking_id_from_call(call), "EtfBy")
-        return _grpc_helpers.protobuf_to_dataclass(response, EtfResponse)
+        return self._convert_response(response, EtfResponse)
 
     @handle_request_error("Etfs")
     def etfs(
@@ -525,7 +662,7 @@ class InstrumentsService(_grpc_helpers.Service):
             metadata=self.metadata,
         )
         log_request(get_tracking_id_from_call(call), "Etfs")
-        return _grpc_helpers.protobuf_to_dataclass(response, EtfsResponse)
+        return self._convert_response(response, EtfsResponse)
 
     @handle_request_error("FutureBy")
     def future_by(
@@ -546,7 +683,7 @@ class InstrumentsService(_grpc_helpers.Service):
             metadata=self.metadata,
         )
         log_request(get_tracking_id_from_call(call), "FutureBy")
-        return _grpc_helpers.protobuf_to_dataclass(response, FutureResponse)
+        return self._convert_response(response, FutureResponse)
 
     @handle_request_error("Futures")
     def futures(
@@ -561,7 +698,7 @@ class InstrumentsService(_grpc_helpers.Service):
             metadata=self.metadata,
         )
         log_request(get_tracking_id_from_call(call), "Futures")
-        return _grpc_helpers.protobuf_to_dataclass(response, FuturesResponse)
+        return self._convert_response(response, FuturesResponse)
 
     @handle_request_error("OptionBy")
     def option_by(
@@ -582,7 +719,7 @@ class InstrumentsService(_grpc_helpers.Service):
             metadata=self.metadata,
         )
         log_request(get_tracking_id_from_call(call), "OptionBy")
-        return _grpc_helpers.protobuf_to_dataclass(response, OptionResponse)
+        return self._convert_response(response, OptionResponse)
 
     @deprecated(details="Use `Client.instruments.options_by(...)` method instead")
     @handle_request_error("Options")
@@ -598,7 +735,7 @@ class InstrumentsService(_grpc_helpers.Service):
             metadata=self.metadata,
         )
         log_request(get_tracking_id_from_call(call), "Options")
-        return _grpc_helpers.protobuf_to_dataclass(response, OptionsResponse)
+        return self._convert_response(response, OptionsResponse)
 
     @handle_request_error("OptionsBy")
     def options_by(
@@ -614,7 +751,7 @@ class InstrumentsService(_grpc_helpers.Service):
             metadata=self.metadata,
         )
         log_request(get_tracking_id_from_call(call), "OptionsBy")
-        return _grpc_helpers.protobuf_to_dataclass(response, OptionsResponse)
+        return self._convert_response(response, OptionsResponse)
 
     @handle_request_error("ShareBy")
     def share_by(
@@ -635,7 +772,7 @@ class InstrumentsService(_grpc_helpers.Service):
             metadata=self.metadata,
         )
         log_request(get_tracking_id_from_call(call), "ShareBy")
-        return _grpc_helpers.protobuf_to_dataclass(response, ShareResponse)
+        return self._convert_response(response, ShareResponse)
 
     @handle_request_error("Shares")
     def shares(
@@ -650,7 +787,7 @@ class InstrumentsService(_grpc_helpers.Service):
             metadata=self.metadata,
         )
         log_request(get_tracking_id_from_call(call), "Shares")
-        return _grpc_helpers.protobuf_to_dataclass(response, SharesResponse)
+        return self._convert_response(response, SharesResponse)
 
     @handle_request_error("GetAccruedInterests")
     def get_accrued_interests(
@@ -673,9 +810,7 @@ class InstrumentsService(_grpc_helpers.Service):
             metadata=self.metadata,
         )
         log_request(get_tracking_id_from_call(call), "GetAccruedInterests")
-        return _grpc_helpers.protobuf_to_dataclass(
-            response, GetAccruedInterestsResponse
-        )
+        return self._convert_response(response, GetAccruedInterestsResponse)
 
     @handle_request_error("GetFuturesMargin")
     def get_futures_margin(self, *, figi: str = "") -> GetFuturesMarginResponse:
@@ -688,7 +823,7 @@ class InstrumentsService(_grpc_helpers.Service):
             metadata=self.metadata,
         )
         log_request(get_tracking_id_from_call(call), "GetFuturesMargin")
-        return _grpc_helpers.protobuf_to_dataclass(response, GetFuturesMarginResponse)
+        return self._convert_response(response, GetFuturesMarginResponse)
 
     @handle_request_error("GetInstrumentBy")
     def get_instrument_by(
@@ -709,7 +844,7 @@ class InstrumentsService(_grpc_helpers.Service):
             metadata=self.metadata,
         )
         log_request(get_tracking_id_from_call(call), "GetInstrumentBy")
-        return _grpc_helpers.protobuf_to_dataclass(response, InstrumentResponse)
+        return self._convert_response(response, InstrumentResponse)
 
     @handle_request_error("GetDividends")
     def get_dividends(
@@ -732,7 +867,7 @@ class InstrumentsService(_grpc_helpers.Service):
             metadata=self.metadata,
         )
         log_request(get_tracking_id_from_call(call), "GetDividends")
-        return _grpc_helpers.protobuf_to_dataclass(response, GetDividendsResponse)
+        return self._convert_response(response, GetDividendsResponse)
 
     @handle_request_error("GetBondCoupons")
     def get_bond_coupons(
@@ -755,7 +890,7 @@ class InstrumentsService(_grpc_helpers.Service):
             metadata=self.metadata,
         )
         log_request(get_tracking_id_from_call(call), "GetBondCoupons")
-        return _grpc_helpers.protobuf_to_dataclass(response, GetBondCouponsResponse)
+        return self._convert_response(response, GetBondCouponsResponse)
 
     @handle_request_error("GetAssetBy")
     def get_asset_by(
@@ -772,7 +907,7 @@ class InstrumentsService(_grpc_helpers.Service):
             metadata=self.metadata,
         )
         log_request(get_tracking_id_from_call(call), "GetAssetBy")
-        return _grpc_helpers.protobuf_to_dataclass(response, AssetResponse)
+        return self._convert_response(response, AssetResponse)
 
     @handle_request_error("GetAssets")
     def get_assets(
@@ -786,7 +921,7 @@ class InstrumentsService(_grpc_helpers.Service):
             metadata=self.metadata,
         )
         log_request(get_tracking_id_from_call(call), "GetAssets")
-        return _grpc_helpers.protobuf_to_dataclass(response, AssetsResponse)
+        return self._convert_response(response, AssetsResponse)
 
     @handle_request_error("GetFavorites")
     def get_favorites(
@@ -800,7 +935,7 @@ class InstrumentsService(_grpc_helpers.Service):
             metadata=self.metadata,
         )
         log_request(get_tracking_id_from_call(call), "GetFavorites")
-        return _grpc_helpers.protobuf_to_dataclass(response, GetFavoritesResponse)
+        return self._convert_response(response, GetFavoritesResponse)
 
     @handle_request_error("EditFavorites")
     def edit_favorites(
@@ -821,7 +956,7 @@ class InstrumentsService(_grpc_helpers.Service):
             metadata=self.metadata,
         )
         log_request(get_tracking_id_from_call(call), "EditFavorites")
-        return _grpc_helpers.protobuf_to_dataclass(response, EditFavoritesResponse)
+        return self._convert_response(response, EditFavoritesResponse)
 
     @handle_request_error("GetCountries")
     def get_countries(
@@ -835,7 +970,7 @@ class InstrumentsService(_grpc_helpers.Service):
             metadata=self.metadata,
         )
         log_request(get_tracking_id_from_call(call), "GetCountries")
-        return _grpc_helpers.protobuf_to_dataclass(response, GetCountriesResponse)
+        return self._convert_response(response, GetCountriesResponse)
 
     @handle_request_error("FindInstrument")
     def find_instrument(
@@ -858,7 +993,7 @@ class InstrumentsService(_grpc_helpers.Service):
             metadata=self.metadata,
         )
         log_request(get_tracking_id_from_call(call), "FindInstrument")
-        return _grpc_helpers.protobuf_to_dataclass(response, FindInstrumentResponse)
+        return self._convert_response(response, FindInstrumentResponse)
 
     @handle_request_error("GetBrands")
     def get_brands(
@@ -872,7 +1007,7 @@ class InstrumentsService(_grpc_helpers.Service):
             metadata=self.metadata,
         )
         log_request(get_tracking_id_from_call(call), "GetBrands")
-        return _grpc_helpers.protobuf_to_dataclass(response, GetBrandsResponse)
+        return self._convert_response(response, GetBrandsResponse)
 
     @handle_request_error("GetBrandBy")
     def get_brands_by(self, id: str = "") -> Brand:
@@ -885,7 +1020,7 @@ class InstrumentsService(_grpc_helpers.Service):
             metadata=self.metadata,
         )
         log_request(get_tracking_id_from_call(call), "GetBrandBy")
-        return _grpc_helpers.protobuf_to_dataclass(response, Brand)
+        return self._convert_response(response, Brand)
 
 
 class MarketDataService(_grpc_helpers.Service):
@@ -916,7 +1051,39 @@ class MarketDataService(_grpc_helpers.Service):
             metadata=self.metadata,
         )
         log_request(get_tracking_id_from_call(call), "GetCandles")
-        return _grpc_helpers.protobuf_to_dataclass(response, GetCandlesResponse)
+        return self._convert_response(response, GetCandlesResponse)
+
+    @handle_request_error("GetCandles")
+    def get_candles_columns(
+        self,
+        *,
+        figi: str = "",
+        from_: Optional[datetime] = None,
+        to: Optional[datetime] = None,
+        interval: CandleInterval = CandleInterval(0),
+        instrument_id: str = "",
+        as_float: bool = False,
+    ) -> "HistoricCandleColumns":
+        from .columnar import (  # pylint:disable=import-outside-toplevel
+            candles_to_columns,
+        )
+
+        request = GetCandlesRequest()
+        request.figi = figi
+        request.instrument_id = instrument_id
+        if from_ is not None:
+            request.from_ = from_
+        if to is not None:
+            request.to = to
+        request.interval = interval
+        response, call = self.stub.GetCandles.with_call(
+            request=_grpc_helpers.dataclass_to_protobuff(
+                request, marketdata_pb2.GetCandlesRequest()
+            ),
+            metadata=self.metadata,
+        )
+        log_request(get_tracking_id_from_call(call), "GetCandles")
+        return candles_to_columns(response.candles, as_float=as_float)
 
     @handle_request_error("GetLastPrices")
     def get_last_prices(
@@ -938,7 +1105,7 @@ class MarketDataService(_grpc_helpers.Service):
             metadata=self.metadata,
         )
         log_request(get_tracking_id_from_call(call), "GetLastPrices")
-        return _grpc_helpers.protobuf_to_dataclass(response, GetLastPricesResponse)
+        return self._convert_response(response, GetLastPricesResponse)
 
     @handle_request_error("GetOrderBook")
     def get_order_book(
@@ -955,7 +1122,7 @@ class MarketDataService(_grpc_helpers.Service):
             metadata=self.metadata,
         )
         log_request(get_tracking_id_from_call(call), "GetOrderBook")
-        return _grpc_helpers.protobuf_to_dataclass(response, GetOrderBookResponse)
+        return self._convert_response(response, GetOrderBookResponse)
 
     @handle_request_error("GetTradingStatus")
     def get_trading_status(
@@ -971,7 +1138,7 @@ class MarketDataService(_grpc_helpers.Service):
             metadata=self.metadata,
         )
         log_request(get_tracking_id_from_call(call), "GetTradingStatus")
-        return _grpc_helpers.protobuf_to_dataclass(response, GetTradingStatusResponse)
+        return self._convert_response(response, GetTradingStatusResponse)
 
     @handle_request_error("GetTradingStatuses")
     def get_trading_statuses(
@@ -987,7 +1154,7 @@ class MarketDataService(_grpc_helpers.Service):
             metadata=self.metadata,
         )
         log_request(get_tracking_id_from_call(call), "GetTradingStatuses")
-        return _grpc_helpers.protobuf_to_dataclass(response, GetTradingStatusesResponse)
+        return self._convert_response(response, GetTradingStatusesResponse)
 
     @handle_request_error("GetLastTrades")
     def get_last_trades(
@@ -1012,7 +1179,7 @@ class MarketDataService(_grpc_helpers.Service):
             metadata=self.metadata,
         )
         log_request(get_tracking_id_from_call(call), "GetLastTrades")
-        return _grpc_helpers.protobuf_to_dataclass(response, GetLastTradesResponse)
+        return self._convert_response(response, GetLastTradesResponse)
 
     @handle_request_error("GetClosePrices")
     def get_close_prices(
@@ -1030,7 +1197,7 @@ class MarketDataService(_grpc_helpers.Service):
             metadata=self.metadata,
         )
         log_request(get_tracking_id_from_call(call), "GetClosePrices")
-        return _grpc_helpers.protobuf_to_dataclass(response, GetClosePricesResponse)
+        return self._convert_response(response, GetClosePricesResponse)
 
 
 class MarketDataStreamService(_grpc_helpers.Service):
@@ -1054,7 +1221,7 @@ class MarketDataStreamService(_grpc_helpers.Service):
             request_iterator=self._convert_market_data_stream_request(request_iterator),
             metadata=self.metadata,
         ):
-            yield _grpc_helpers.protobuf_to_dataclass(response, MarketDataResponse)
+            yield self._convert_response(response, MarketDataResponse)
 
     @staticmethod
     def _convert_market_data_server_side_stream_request(
@@ -1076,7 +1243,7 @@ class MarketDataStreamService(_grpc_helpers.Service):
             ),
             metadata=self.metadata,
         ):
-            yield _grpc_helpers.protobuf_to_dataclass(response, MarketDataResponse)
+            yield self._convert_response(response, MarketDataResponse)
 
 
 class OperationsService(_grpc_helpers.Service):
@@ -1107,7 +1274,7 @@ class OperationsService(_grpc_helpers.Service):
             metadata=self.metadata,
         )
         log_request(get_tracking_id_from_call(call), "GetOperations")
-        return _grpc_helpers.protobuf_to_dataclass(response, OperationsResponse)
+        return self._convert_response(response, OperationsResponse)
 
     @handle_request_error("GetPortfolio")
     def get_portfolio(self, *, account_id: str = "") -> PortfolioResponse:
@@ -1120,7 +1287,7 @@ class OperationsService(_grpc_helpers.Service):
             metadata=self.metadata,
         )
         log_request(get_tracking_id_from_call(call), "GetPortfolio")
-        return _grpc_helpers.protobuf_to_dataclass(response, PortfolioResponse)
+        return self._convert_response(response, PortfolioResponse)
 
     @handle_request_error("GetPositions")
     def get_positions(self, *, account_id: str = "") -> PositionsResponse:
@@ -1133,7 +1300,7 @@ class OperationsService(_grpc_helpers.Service):
             metadata=self.metadata,
         )
         log_request(get_tracking_id_from_call(call), "GetPositions")
-        return _grpc_helpers.protobuf_to_dataclass(response, PositionsResponse)
+        return self._convert_response(response, PositionsResponse)
 
     @handle_request_error("GetWithdrawLimits")
     def get_withdraw_limits(self, *, account_id: str = "") -> WithdrawLimitsResponse:
@@ -1146,7 +1313,7 @@ class OperationsService(_grpc_helpers.Service):
             metadata=self.metadata,
         )
         log_request(get_tracking_id_from_call(call), "GetWithdrawLimits")
-        return _grpc_helpers.protobuf_to_dataclass(response, WithdrawLimitsResponse)
+        return self._convert_response(response, WithdrawLimitsResponse)
 
     @handle_request_error("GetBrokerReport")
     def get_broker_report(
@@ -1167,7 +1334,7 @@ class OperationsService(_grpc_helpers.Service):
             metadata=self.metadata,
         )
         log_request(get_tracking_id_from_call(call), "GetBrokerReport")
-        return _grpc_helpers.protobuf_to_dataclass(response, BrokerReportResponse)
+        return self._convert_response(response, BrokerReportResponse)
 
     @handle_request_error("GetDividendsForeignIssuer")
     def get_dividends_foreign_issuer(
@@ -1194,9 +1361,7 @@ class OperationsService(_grpc_helpers.Service):
             metadata=self.metadata,
         )
         log_request(get_tracking_id_from_call(call), "GetDividendsForeignIssuer")
-        return _grpc_helpers.protobuf_to_dataclass(
-            response, GetDividendsForeignIssuerResponse
-        )
+        return self._convert_response(response, GetDividendsForeignIssuerResponse)
 
     @handle_request_error("GetOperationsByCursor")
     def get_operations_by_cursor(
@@ -1210,9 +1375,7 @@ class OperationsService(_grpc_helpers.Service):
             metadata=self.metadata,
         )
         log_request(get_tracking_id_from_call(call), "GetOperationsByCursor")
-        return _grpc_helpers.protobuf_to_dataclass(
-            response, GetOperationsByCursorResponse
-        )
+        return self._convert_response(response, GetOperationsByCursorResponse)
 
 
 class OperationsStreamService(_grpc_helpers.Service):
@@ -1233,7 +1396,7 @@ class OperationsStreamService(_grpc_helpers.Service):
             ),
             metadata=self.metadata,
         ):
-            yield _grpc_helpers.protobuf_to_dataclass(response, PortfolioStreamResponse)
+            yield self._convert_response(response, PortfolioStreamResponse)
 
     @handle_request_error_gen("PositionsStream")
     def positions_stream(
@@ -1250,7 +1413,7 @@ class OperationsStreamService(_grpc_helpers.Service):
             ),
             metadata=self.metadata,
         ):
-            yield _grpc_helpers.protobuf_to_dataclass(response, PositionsStreamResponse)
+            yield self._convert_response(response, PositionsStreamResponse)
 
 
 class OrdersStreamService(_grpc_helpers.Service):
@@ -1271,7 +1434,7 @@ class OrdersStreamService(_grpc_helpers.Service):
             ),
             metadata=self.metadata,
         ):
-            yield _grpc_helpers.protobuf_to_dataclass(response, TradesStreamResponse)
+            yield self._convert_response(response, TradesStreamResponse)
 
 
 class OrdersService(_grpc_helpers.Service):
@@ -1307,7 +1470,18 @@ class OrdersService(_grpc_helpers.Service):
             metadata=self.metadata,
         )
         log_request(get_tracking_id_from_call(call), "PostOrder")
-        return _grpc_helpers.protobuf_to_dataclass(response, PostOrderResponse)
+        return self._convert_response(response, PostOrderResponse)
+
+    @handle_request_error("PostOrder")
+    def post_order_from_template(
+        self, template: _grpc_helpers.RequestTemplate[PostOrderRequest], **changes: Any
+    ) -> PostOrderResponse:
+        response, call = self.stub.PostOrder.with_call(
+            request=template.encode(orders_pb2.PostOrderRequest, **changes),
+            metadata=self.metadata,
+        )
+        log_request(get_tracking_id_from_call(call), "PostOrder")
+        return self._convert_response(response, PostOrderResponse)
 
     @handle_request_error("CancelOrder")
     def cancel_order(
@@ -1323,7 +1497,7 @@ class OrdersService(_grpc_helpers.Service):
             metadata=self.metadata,
         )
         log_request(get_tracking_id_from_call(call), "CancelOrder")
-        return _grpc_helpers.protobuf_to_dataclass(response, CancelOrderResponse)
+        return self._convert_response(response, CancelOrderResponse)
 
     @handle_request_error("GetOrderState")
     def get_order_state(
@@ -1339,7 +1513,7 @@ class OrdersService(_grpc_helpers.Service):
             metadata=self.metadata,
         )
         log_request(get_tracking_id_from_call(call), "GetOrderState")
-        return _grpc_helpers.protobuf_to_dataclass(response, OrderState)
+        return self._convert_response(response, OrderState)
 
     @handle_request_error("GetOrders")
     def get_orders(self, *, account_id: str = "") -> GetOrdersResponse:
@@ -1352,7 +1526,7 @@ class OrdersService(_grpc_helpers.Service):
             metadata=self.metadata,
         )
         log_request(get_tracking_id_from_call(call), "GetOrders")
-        return _grpc_helpers.protobuf_to_dataclass(response, GetOrdersResponse)
+        return self._convert_response(response, GetOrdersResponse)
 
     @handle_request_error("ReplaceOrder")
     def replace_order(self, request: ReplaceOrderRequest) -> PostOrderResponse:
@@ -1363,7 +1537,20 @@ class OrdersService(_grpc_helpers.Service):
             metadata=self.metadata,
         )
         log_request(get_tracking_id_from_call(call), "ReplaceOrder")
-        return _grpc_helpers.protobuf_to_dataclass(response, PostOrderResponse)
+        return self._convert_response(response, PostOrderResponse)
+
+    @handle_request_error("ReplaceOrder")
+    def replace_order_from_template(
+        self,
+        template: _grpc_helpers.RequestTemplate[ReplaceOrderRequest],
+        **changes: Any,
+    ) -> PostOrderResponse:
+        response, call = self.stub.ReplaceOrder.with_call(
+            request=template.encode(orders_pb2.ReplaceOrderRequest, **changes),
+            metadata=self.metadata,
+        )
+        log_request(get_tracking_id_from_call(call), "ReplaceOrder")
+        return self._convert_response(response, PostOrderResponse)
 
 
 class UsersService(_grpc_helpers.Service):
@@ -1379,7 +1566,7 @@ class UsersService(_grpc_helpers.Service):
             metadata=self.metadata,
         )
         log_request(get_tracking_id_from_call(call), "GetAccounts")
-        return _grpc_helpers.protobuf_to_dataclass(response, GetAccountsResponse)
+        return self._convert_response(response, GetAccountsResponse)
 
     @handle_request_error("GetMarginAttributes")
     def get_margin_attributes(
@@ -1394,9 +1581,7 @@ class UsersService(_grpc_helpers.Service):
             metadata=self.metadata,
         )
         log_request(get_tracking_id_from_call(call), "GetMarginAttributes")
-        return _grpc_helpers.protobuf_to_dataclass(
-            response, GetMarginAttributesResponse
-        )
+        return self._convert_response(response, GetMarginAttributesResponse)
 
     @handle_request_error("GetUserTariff")
     def get_user_tariff(self) -> GetUserTariffResponse:
@@ -1408,7 +1593,7 @@ class UsersService(_grpc_helpers.Service):
             metadata=self.metadata,
         )
         log_request(get_tracking_id_from_call(call), "GetUserTariff")
-        return _grpc_helpers.protobuf_to_dataclass(response, GetUserTariffResponse)
+        return self._convert_response(response, GetUserTariffResponse)
 
     @handle_request_error("GetInfo")
     def get_info(self) -> GetInfoResponse:
@@ -1420,7 +1605,7 @@ class UsersService(_grpc_helpers.Service):
             metadata=self.metadata,
         )
         log_request(get_tracking_id_from_call(call), "GetInfo")
-        return _grpc_helpers.protobuf_to_dataclass(response, GetInfoResponse)
+        return self._convert_response(response, GetInfoResponse)
 
 
 class SandboxService(_grpc_helpers.Service):
@@ -1436,7 +1621,7 @@ class SandboxService(_grpc_helpers.Service):
             metadata=self.metadata,
         )
         log_request(get_tracking_id_from_call(call), "OpenSandboxAccount")
-        return _grpc_helpers.protobuf_to_dataclass(response, OpenSandboxAccountResponse)
+        return self._convert_response(response, OpenSandboxAccountResponse)
 
     @deprecated(details="Use `SandboxClient.users.get_accounts(...)` method instead")
     @handle_request_error("GetSandboxAccounts")
@@ -1449,7 +1634,7 @@ class SandboxService(_grpc_helpers.Service):
             metadata=self.metadata,
         )
         log_request(get_tracking_id_from_call(call), "GetSandboxAccounts")
-        return _grpc_helpers.protobuf_to_dataclass(response, GetAccountsResponse)
+        return self._convert_response(response, GetAccountsResponse)
 
     @handle_request_error("CloseSandboxAccount")
     def close_sandbox_account(
@@ -1464,9 +1649,7 @@ class SandboxService(_grpc_helpers.Service):
             metadata=self.metadata,
         )
         log_request(get_tracking_id_from_call(call), "CloseSandboxAccount")
-        return _grpc_helpers.protobuf_to_dataclass(
-            response, CloseSandboxAccountResponse
-        )
+        return self._convert_response(response, CloseSandboxAccountResponse)
 
     @deprecated(details="Use `SandboxClient.orders.post_order(...)` method instead")
     @handle_request_error("PostSandboxOrder")
@@ -1499,7 +1682,7 @@ class SandboxService(_grpc_helpers.Service):
             metadata=self.metadata,
         )
         log_request(get_tracking_id_from_call(call), "PostSandboxOrder")
-        return _grpc_helpers.protobuf_to_dataclass(response, PostOrderResponse)
+        return self._convert_response(response, PostOrderResponse)
 
     @deprecated(details="Use `SandboxClient.orders.replace_order(...)` method instead")
     @handle_request_error("ReplaceSandboxOrder")
@@ -1514,7 +1697,7 @@ class SandboxService(_grpc_helpers.Service):
             metadata=self.metadata,
         )
         log_request(get_tracking_id_from_call(call), "ReplaceSandboxOrder")
-        return _grpc_helpers.protobuf_to_dataclass(response, PostOrderResponse)
+        return self._convert_response(response, PostOrderResponse)
 
     @deprecated(details="Use `SandboxClient.orders.get_orders(...)` method instead")
     @handle_request_error("GetSandboxOrders")
@@ -1528,7 +1711,7 @@ class SandboxService(_grpc_helpers.Service):
             metadata=self.metadata,
         )
         log_request(get_tracking_id_from_call(call), "GetSandboxOrders")
-        return _grpc_helpers.protobuf_to_dataclass(response, GetOrdersResponse)
+        return self._convert_response(response, GetOrdersResponse)
 
     @deprecated(details="Use `SandboxClient.orders.cancel_order(...)` method instead")
     @handle_request_error("CancelSandboxOrder")
@@ -1545,7 +1728,7 @@ class SandboxService(_grpc_helpers.Service):
             metadata=self.metadata,
         )
         log_request(get_tracking_id_from_call(call), "CancelSandboxOrder")
-        return _grpc_helpers.protobuf_to_dataclass(response, CancelOrderResponse)
+        return self._convert_response(response, CancelOrderResponse)
 
     @deprecated(
         details="Use `SandboxClient.orders.get_order_state(...)` method instead"
@@ -1564,7 +1747,7 @@ class SandboxService(_grpc_helpers.Service):
             metadata=self.metadata,
         )
         log_request(get_tracking_id_from_call(call), "GetSandboxOrderState")
-        return _grpc_helpers.protobuf_to_dataclass(response, OrderState)
+        return self._convert_response(response, OrderState)
 
     @deprecated(
         details="Use `SandboxClient.operations.get_positions(...)` method instead"
@@ -1580,7 +1763,7 @@ class SandboxService(_grpc_helpers.Service):
             metadata=self.metadata,
         )
         log_request(get_tracking_id_from_call(call), "GetSandboxPositions")
-        return _grpc_helpers.protobuf_to_dataclass(response, PositionsResponse)
+        return self._convert_response(response, PositionsResponse)
 
     @deprecated(
         details="Use `SandboxClient.operations.get_operations(...)` method instead"
@@ -1610,7 +1793,7 @@ class SandboxService(_grpc_helpers.Service):
             metadata=self.metadata,
         )
         log_request(get_tracking_id_from_call(call), "GetSandboxOperations")
-        return _grpc_helpers.protobuf_to_dataclass(response, OperationsResponse)
+        return self._convert_response(response, OperationsResponse)
 
     @deprecated(
         details="Use `SandboxClient.operations.get_operations_by_cursor` method instead"
@@ -1627,9 +1810,7 @@ class SandboxService(_grpc_helpers.Service):
             metadata=self.metadata,
         )
         log_request(get_tracking_id_from_call(call), "GetOperationsByCursor")
-        return _grpc_helpers.protobuf_to_dataclass(
-            response, GetOperationsByCursorResponse
-        )
+        return self._convert_response(response, GetOperationsByCursorResponse)
 
     @deprecated(
         details="Use `SandboxClient.operations.get_portfolio(...)` method instead"
@@ -1645,7 +1826,7 @@ class SandboxService(_grpc_helpers.Service):
             metadata=self.metadata,
         )
         log_request(get_tracking_id_from_call(call), "GetSandboxPortfolio")
-        return _grpc_helpers.protobuf_to_dataclass(response, PortfolioResponse)
+        return self._convert_response(response, PortfolioResponse)
 
     @handle_request_error("SandboxPayIn")
     def sandbox_pay_in(
@@ -1662,7 +1843,7 @@ class SandboxService(_grpc_helpers.Service):
             metadata=self.metadata,
         )
         log_request(get_tracking_id_from_call(call), "SandboxPayIn")
-        return _grpc_helpers.protobuf_to_dataclass(response, SandboxPayInResponse)
+        return self._convert_response(response, SandboxPayInResponse)
 
     @deprecated(
         details="Use `SandboxClient.operations.get_withdraw_limits(...)` method instead"
@@ -1682,7 +1863,7 @@ class SandboxService(_grpc_helpers.Service):
             metadata=self.metadata,
         )
         log_request(get_tracking_id_from_call(call), "GetSandboxWithdrawLimits")
-        return _grpc_helpers.protobuf_to_dataclass(response, WithdrawLimitsResponse)
+        return self._convert_response(response, WithdrawLimitsResponse)
 
 
 class StopOrdersService(_grpc_helpers.Service):
@@ -1724,7 +1905,20 @@ class StopOrdersService(_grpc_helpers.Service):
             metadata=self.metadata,
         )
         log_request(get_tracking_id_from_call(call), "PostStopOrder")
-        return _grpc_helpers.protobuf_to_dataclass(response, PostStopOrderResponse)
+        return self._convert_response(response, PostStopOrderResponse)
+
+    @handle_request_error("PostStopOrder")
+    def post_stop_order_from_template(
+        self,
+        template: _grpc_helpers.RequestTemplate[PostStopOrderRequest],
+        **changes: Any,
+    ) -> PostStopOrderResponse:
+        response, call = self.stub.PostStopOrder.with_call(
+            request=template.encode(stoporders_pb2.PostStopOrderRequest, **changes),
+            metadata=self.metadata,
+        )
+        log_request(get_tracking_id_from_call(call), "PostStopOrder")
+        return self._convert_response(response, PostStopOrderResponse)
 
     @handle_request_error("GetStopOrders")
     def get_stop_orders(self, *, account_id: str = "") -> GetStopOrdersResponse:
@@ -1737,7 +1931,7 @@ class StopOrdersService(_grpc_helpers.Service):
             metadata=self.metadata,
         )
         log_request(get_tracking_id_from_call(call), "GetStopOrders")
-        return _grpc_helpers.protobuf_to_dataclass(response, GetStopOrdersResponse)
+        return self._convert_response(response, GetStopOrdersResponse)
 
     @handle_request_error("CancelStopOrder")
     def cancel_stop_order(
@@ -1753,4 +1947,4 @@ class StopOrdersService(_grpc_helpers.Service):
             metadata=self.metadata,
         )
         log_request(get_tracking_id_from_call(call), "CancelStopOrder")
-        return _grpc_helpers.protobuf_to_dataclass(response, CancelStopOrderResponse)
+        return self._convert_response(response, CancelStopOrderResponse)
@@ -6,12 +6,23 @@ from typing import Any, Callable, Generator, Iterable, List, Protocol, Tuple
 
 import dateutil.parser
 
-from .schemas import CandleInterval, HistoricCandle, Quotation, SubscriptionInterval
+from .fixed_point import NANOS_IN_UNIT, FixedPoint
+from .schemas import (
+    CandleInterval,
+    HistoricCandle,
+    MoneyValue,
+    Quotation,
+    SubscriptionInterval,
+)
 
 __all__ = (
     "get_intervals",
     "quotation_to_decimal",
     "decimal_to_quotation",
+    "quotation_to_fixed_point",
+    "money_to_fixed_point",
+    "fixed_point_to_quotation",
+    "fixed_point_to_money",
     "candle_interval_to_subscription_interval",
     "now",
     "candle_interval_to_timedelta",
@@ -71,6 +82,22 @@ def money_to_decimal(money: MoneyProtocol) -> Decimal:
     return Decimal(money.units) + fractional
 
 
+def quotation_to_fixed_point(quotation: Quotation) -> FixedPoint:
+    return FixedPoint(quotation.units * NANOS_IN_UNIT + quotation.nano)
+
+
+def money_to_fixed_point(money: MoneyProtocol) -> FixedPoint:
+    return FixedPoint(money.units * NANOS_IN_UNIT + money.nano)
+
+
+def fixed_point_to_quotation(value: FixedPoint) -> Quotation:
+    return value.to_quotation()
+
+
+def fixed_point_to_money(value: FixedPoint, currency: str) -> MoneyValue:
+    return value.to_money_value(currency)
+
+
 # fmt: off
 _CANDLE_INTERVAL_TO_SUBSCRIPTION_INTERVAL_MAPPING = {
     CandleInterval.CANDLE_INTERVAL_1_MIN: